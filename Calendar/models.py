@@ -216,6 +216,36 @@ class TaskDeadlineSync(models.Model):
                 calendar_event.priority = self.task.priority
                 calendar_event.save()
 
+    @classmethod
+    def create_for_new_tasks(cls, tasks):
+        """
+        Bulk form of the post_save deadline sync, for tasks inserted with
+        bulk_create (which have no sync row or deadline event yet)
+        """
+        tasks = [task for task in tasks if task.due_date and task.assigned_to_id]
+        cls.objects.bulk_create([cls(task=task) for task in tasks], batch_size=1000)
+
+        now = timezone.now().time()
+        CalendarEvent.objects.bulk_create(
+            [
+                CalendarEvent(
+                    user_id=task.assigned_to_id,
+                    linked_task=task,
+                    title=f"Task Deadline: {task.title}",
+                    description=task.description or "",
+                    event_type=EventTypesEnum.DEADLINE,
+                    priority=task.priority,
+                    event_date=task.due_date,
+                    start_time=now,
+                    end_time=now,
+                    send_reminder=True,
+                    reminder_minutes_before=1440,  # 24hours before
+                )
+                for task in tasks
+            ],
+            batch_size=1000,
+        )
+
 
 class CalendarView(models.Model):
     """user's personal calendar view preferences"""
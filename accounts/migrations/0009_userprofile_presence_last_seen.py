@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:18
+
+from django.db import migrations, models
+
+
+def clear_last_seen(apps, schema_editor):
+    # Values written by auto_now track profile saves, not activity
+    UserProfile = apps.get_model("accounts", "UserProfile")
+    UserProfile.objects.update(last_seen=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_userprofile_last_seen"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="userprofile",
+            name="last_seen",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(clear_last_seen, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Trigram indexes behind UserDirectoryService. pg_trgm ships with PostgreSQL's
+# contrib package; without it the directory falls back to prefix matching and
+# these indexes are skipped.
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import migrations
+from django.db.models.functions import Upper
+
+DIRECTORY_FIELDS = ("username", "first_name", "last_name", "email")
+
+
+def _indexes():
+    # On UPPER(column): the expression Django's istartswith compares
+    return [
+        GinIndex(
+            OpClass(Upper(field), name="gin_trgm_ops"),
+            name=f"user_{field}_trgm_idx",
+        )
+        for field in DIRECTORY_FIELDS
+    ]
+
+
+def add_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    User = apps.get_model("auth", "User")
+    for index in _indexes():
+        schema_editor.add_index(User, index)
+
+
+def remove_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index in _indexes():
+        schema_editor.execute(
+            f"DROP INDEX IF EXISTS {schema_editor.quote_name(index.name)}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0009_userprofile_presence_last_seen"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_trigram_indexes, remove_trigram_indexes),
+    ]
@@ -1,10 +1,17 @@
 from datetime import timedelta
+from unittest import mock
 
 from django.contrib.auth.models import Group, User
+from django.db import DatabaseError
+from django.test import override_settings
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from accounts.models import UserProfile
+from core.services import presence
+from core.services.presence import PresenceService, presence_buffer
+from core.services.project_service import ProjectService
 from projects.models import ProjectMembers, ProjectsModel
 
 
@@ -118,3 +125,117 @@ class TeamUserAccessTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         self.assertEqual(response.data["error"]["code"], "FORBIDDEN")
+
+    @override_settings(CACHE_SHARED=True)
+    def test_directory_search_ranks_username_prefix_first(self):
+        User.objects.create_user(
+            username="zed", email="zed@example.com", first_name="Teams"
+        )
+        self.client.force_authenticate(user=self.pm_user)
+
+        response = self.client.get("/api/v1/accounts/team/users/search/?q=tea")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        usernames = [user["username"] for user in response.data["data"]]
+        self.assertEqual(usernames[0], "team_member")
+        self.assertIn("zed", usernames)
+        self.assertNotIn("external_member", usernames)
+
+        # Repeated keystrokes are served from the cache; only the users
+        # generation in its key is read
+        with self.assertNumQueries(1):
+            self.client.get("/api/v1/accounts/team/users/search/?q=tea")
+
+    def test_invite_rejects_members_and_unknown_users(self):
+        self.client.force_authenticate(user=self.admin_user)
+        url = f"/api/v1/projects/{self.pm_project.pk}/team/invite/"
+
+        response = self.client.post(url, {"username": "team_member"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["error"]["code"], "ALREADY_MEMBER")
+
+        response = self.client.post(url, {"email": "nobody@example.com"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("email", response.data["error"]["details"])
+
+
+class PresenceTests(APITestCase):
+    def setUp(self):
+        presence_buffer.clear()
+        self.owner = User.objects.create_user(
+            username="presence_owner",
+            email="presence-owner@example.com",
+            password="defaultPassword123",
+        )
+        self.member = User.objects.create_user(
+            username="presence_member",
+            email="presence-member@example.com",
+            password="defaultPassword123",
+        )
+        today = timezone.now().date()
+        self.project = ProjectService.create_project(
+            user=self.owner,
+            data={
+                "project_name": "Presence Project",
+                "start_date": today,
+                "end_date": today + timedelta(days=7),
+            },
+        )
+        ProjectService.add_member(
+            project=self.project, user=self.member, role="Developer"
+        )
+
+    def test_activity_is_buffered_then_flushed_in_bulk(self):
+        self.client.force_authenticate(user=self.member)
+        self.client.get("/api/v1/auth/me/")
+
+        # Nothing written yet, but the buffered activity already counts
+        self.member.profile.refresh_from_db()
+        self.assertIsNone(self.member.profile.last_seen)
+        self.assertEqual(
+            PresenceService.online_user_ids(self.project), {self.member.pk}
+        )
+
+        with self.assertNumQueries(1):
+            presence_buffer.flush()
+
+        self.member.profile.refresh_from_db()
+        self.assertIsNotNone(self.member.profile.last_seen)
+        self.assertEqual(
+            PresenceService.online_user_ids(self.project), {self.member.pk}
+        )
+
+    def test_failed_flush_keeps_the_batch(self):
+        presence_buffer.touch(self.member.pk)
+
+        with mock.patch.object(
+            UserProfile.objects, "filter", side_effect=DatabaseError
+        ), self.assertLogs("core.services.presence", "ERROR"):
+            self.assertEqual(presence_buffer.flush(), 0)
+
+        self.assertTrue(presence_buffer.is_pending(self.member.pk))
+        self.assertEqual(presence_buffer.flush(), 1)
+
+    def test_idle_worker_flushes_without_a_request(self):
+        buffer = presence.PresenceBuffer()
+        with mock.patch.object(buffer, "start_flusher") as start_flusher:
+            buffer.touch(self.member.pk)
+            # A worker forked after the flusher was started runs its own
+            buffer._flusher_pid = -1
+            buffer.touch(self.owner.pk)
+        start_flusher.assert_called_once()
+        self.assertTrue(buffer.is_pending(self.member.pk))
+
+        # What the flusher thread runs once the worker has been idle long enough
+        self.assertEqual(buffer.flush_if_due(), 0)
+        buffer._last_flush -= presence.FLUSH_INTERVAL
+        self.assertEqual(buffer.flush_if_due(), 2)
+        self.member.profile.refresh_from_db()
+        self.assertIsNotNone(self.member.profile.last_seen)
+
+    def test_stale_activity_is_offline(self):
+        UserProfile.objects.filter(user=self.member).update(
+            last_seen=timezone.now() - timedelta(hours=1)
+        )
+        self.assertEqual(PresenceService.online_user_ids(self.project), set())
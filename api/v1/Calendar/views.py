@@ -16,6 +16,7 @@ from Calendar.models import (
 )
 from tasks.models import TaskModel
 from projects.models import ProjectsModel, ProjectMembers
+from core.services.task_assignment import TaskAssignmentService
 
 from .serializers import (
     CalendarEventSerializer,
@@ -122,7 +123,8 @@ class CalendarEventViewSet(viewsets.ModelViewSet):
 
         # get tasks with deadlines for user
         tasks = TaskModel.objects.filter(
-            Q(assigned_to=request.user) | Q(project__in=user_projects),
+            Q(pk__in=TaskAssignmentService.task_ids_for(request.user))
+            | Q(project__in=user_projects),
             due_date__gte=start_date,
             due_date__lte=end_date,
         ).select_related("project", "assigned_to")
@@ -173,9 +175,11 @@ class CalendarEventViewSet(viewsets.ModelViewSet):
             members__project_member=request.user
         )
 
-        # get tasks
+        # get tasks, found through the user's assignments
         tasks = TaskModel.objects.filter(
-            assigned_to=request.user, due_date__gte=start_date, due_date__lte=end_date
+            pk__in=TaskAssignmentService.task_ids_for(
+                request.user, due_date__gte=start_date, due_date__lte=end_date
+            )
         )
 
         # get milestones
@@ -185,9 +189,11 @@ class CalendarEventViewSet(viewsets.ModelViewSet):
 
         # claculate statistics
         overdue_tasks = TaskModel.objects.filter(
-            assigned_to=request.user,
-            due_date__lt=start_date,
-            status__in=["TO_DO", "IN_PROGRESS"],
+            pk__in=TaskAssignmentService.task_ids_for(
+                request.user,
+                due_date__lt=start_date,
+                status__in=["TO_DO", "IN_PROGRESS"],
+            )
         )
 
         overdue_milestones = ProjectMilestone.objects.filter(
@@ -247,9 +253,9 @@ class CalendarEventViewSet(viewsets.ModelViewSet):
         # get tasks
         tasks = (
             TaskModel.objects.filter(
-                assigned_to=request.user,
-                due_date__gte=start_date,
-                due_date__lte=end_date,
+                pk__in=TaskAssignmentService.task_ids_for(
+                    request.user, due_date__gte=start_date, due_date__lte=end_date
+                )
             )
             .select_related("project")
             .order_by("due_date")
@@ -278,7 +284,9 @@ class CalendarEventViewSet(viewsets.ModelViewSet):
     def sync_task_deadlines(self, request):
         """Manually trigger sync of all task deadlines to calendar"""
         tasks = TaskModel.objects.filter(
-            assigned_to=request.user, due_date__isnull=False
+            pk__in=TaskAssignmentService.task_ids_for(
+                request.user, due_date__isnull=False
+            )
         )
 
         synced_count = 0
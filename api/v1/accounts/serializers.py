@@ -5,6 +5,7 @@ from drf_spectacular.types import OpenApiTypes
 
 from accounts.models import RegisterModel, UserProfile
 from core.services.registration_service import register_user
+from core.services.presence import PresenceService
 
 
 class UserProfileSerializer(serializers.ModelSerializer):
@@ -106,7 +107,8 @@ class UserListSerializer(serializers.ModelSerializer):
 
     @extend_schema_field(OpenApiTypes.BOOL)
     def get_is_online(self, obj):
-        return False
+        last_seen = obj.profile.last_seen if hasattr(obj, "profile") else None
+        return PresenceService.is_online(obj.pk, last_seen)
 
     @extend_schema_field(OpenApiTypes.INT)
     def get_task_count(self, obj):
@@ -122,3 +124,27 @@ class TeamStatsSerializer(serializers.Serializer):
     total_members = serializers.IntegerField()
     online_members = serializers.IntegerField()
     admin_members = serializers.IntegerField()
+
+
+class DirectorySearchSerializer(serializers.Serializer):
+    """Query parameters of the user directory search"""
+
+    q = serializers.CharField(max_length=100)
+    limit = serializers.IntegerField(min_value=1, max_value=20, default=8)
+
+
+class DirectoryUserSerializer(serializers.ModelSerializer):
+    avatar = serializers.SerializerMethodField()
+
+    class Meta:
+        model = User
+        fields = ["id", "username", "email", "first_name", "last_name", "avatar"]
+
+    @extend_schema_field(OpenApiTypes.URI)
+    def get_avatar(self, obj):
+        profile = getattr(obj, "profile", None)
+        if not profile or not profile.avatar:
+            return None
+        request = self.context.get("request")
+        url = profile.avatar.url
+        return request.build_absolute_uri(url) if request else url
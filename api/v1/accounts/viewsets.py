@@ -1,6 +1,6 @@
 from rest_framework import viewsets, status
 from django.contrib.auth.models import User
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from core.services.authentication import ClaimsJWTAuthentication
 from rest_framework.permissions import IsAdminUser, IsAuthenticated, AllowAny
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -11,6 +11,8 @@ from drf_spectacular.utils import extend_schema, OpenApiExample, OpenApiResponse
 from drf_spectacular.types import OpenApiTypes
 
 from .serializers import (
+    DirectorySearchSerializer,
+    DirectoryUserSerializer,
     RegistrationSerializer,
     UserSerializer,
     UserProfileSerializer,
@@ -19,7 +21,10 @@ from .serializers import (
 )
 from accounts.models import RegisterModel, UserProfile
 from core.services.permissions import UserPermissions
+from core.services.permission_context import PermissionContext
 from core.services.group_assignment import set_user_role
+from core.services.team_stats import TeamStatsService
+from core.services.user_directory import UserDirectoryService
 from projects.models import ProjectMembers
 from ..projects.serializers import ExtendedUserSerializer
 from api.v1.common.responses import ResponseMixin
@@ -50,24 +55,25 @@ class RegisterAPIView(ResponseMixin, APIView):
 class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [UserPermissions]
 
 
 class ProfileViewSet(viewsets.ModelViewSet):
     queryset = UserProfile.objects.all()
     serializer_class = UserProfileSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [UserPermissions]
 
 
 class TeamUserViewSet(ResponseMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = UserListSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
-    def _is_admin_or_project_manager(self, user):
-        return user.is_staff or user.groups.filter(name="Project Manager").exists()
+    def _is_admin_or_project_manager(self, request):
+        context = PermissionContext.for_request(request)
+        return context.is_staff or context.is_project_manager
 
     def _forbidden_response(self):
         return self._error(
@@ -95,12 +101,12 @@ class TeamUserViewSet(ResponseMixin, viewsets.ReadOnlyModelViewSet):
         ).distinct()
 
     def list(self, request, *args, **kwargs):
-        if not self._is_admin_or_project_manager(request.user):
+        if not self._is_admin_or_project_manager(request):
             return self._forbidden_response()
         return super().list(request, *args, **kwargs)
 
     def retrieve(self, request, *args, **kwargs):
-        if not self._is_admin_or_project_manager(request.user):
+        if not self._is_admin_or_project_manager(request):
             return self._forbidden_response()
         return super().retrieve(request, *args, **kwargs)
 
@@ -108,31 +114,36 @@ class TeamUserViewSet(ResponseMixin, viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=["get"], url_path="stats")
     def team_stats(self, request):
         """Get tam statistics for the current user's projects"""
-        if not self._is_admin_or_project_manager(request.user):
+        if not self._is_admin_or_project_manager(request):
             return self._forbidden_response()
 
-        if request.user.is_staff:
-            user_projects = ProjectMembers.objects.values_list("project_id", flat=True)
-        else:
-            user_projects = request.user.project_memberships.values_list(
-                "project_id", flat=True
-            )
+        # Members across the user's projects (all projects for staff)
+        stats = TeamStatsService.for_user(request.user)
+        return self._success(data=stats)
 
-        # Get all projects te user is a member of
-        # get all users in those projects
-        team_members = User.objects.filter(
-            project_memberships__project_id__in=user_projects
-        ).distinct()
+    @extend_schema(
+        parameters=[DirectorySearchSerializer],
+        responses=DirectoryUserSerializer(many=True),
+    )
+    @action(detail=False, methods=["get"], url_path="search")
+    def search(self, request):
+        """Ranked user suggestions for invite dialogs, matched by name prefix"""
+        if not self._is_admin_or_project_manager(request):
+            return self._forbidden_response()
 
-        # Calculate stats
-        stats = {
-            "total_members": team_members.count(),
-            "online_members": team_members.filter(
-                profile__last_seen__isnull=False
-            ).count(),
-            "admin_members": ProjectMembers.objects.filter(
-                project_id__in=user_projects, role_in_project="Admin"
-            ).count(),
-        }
+        params = DirectorySearchSerializer(data=request.query_params)
+        if not params.is_valid():
+            return self._error(
+                "INVALID_INPUT",
+                "Invalid search parameters.",
+                details=params.errors,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
 
-        return self._success(data=stats)
+        users = UserDirectoryService.search(
+            params.validated_data["q"], limit=params.validated_data["limit"]
+        )
+        serializer = DirectoryUserSerializer(
+            users, many=True, context={"request": request}
+        )
+        return self._success(data=serializer.data)
@@ -1,7 +1,15 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 from rest_framework.exceptions import AuthenticationFailed
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from core.services.authentication import principal_claims
+from core.services.token_blacklist import CachedRefreshToken, RotatingRefreshToken
 
 User = get_user_model()
 
@@ -17,12 +25,21 @@ class LoginResponseSerializer(serializers.Serializer):
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = CachedRefreshToken
     email = serializers.EmailField(required=False)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.fields[self.username_field].required = False
 
+    @classmethod
+    def get_token(cls, user):
+        """Embed the user's global roles so ClaimsJWTAuthentication can skip the user lookup"""
+        token = super().get_token(user)
+        for claim, value in principal_claims(user).items():
+            token[claim] = value
+        return token
+
     def validate(self, attrs):
         username = attrs.get(self.username_field)
         email = attrs.get("email")
@@ -53,3 +70,43 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
             return super().validate(attrs)
         except AuthenticationFailed:
             raise AuthenticationFailed("Invalid username/email or password")
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh with rotation that loads the user once and uses the blacklist
+    insert itself as the reuse check (no separate blacklist lookup).
+    """
+
+    token_class = RotatingRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        user = User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+        if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(
+                self.error_messages["no_active_account"], "no_active_account"
+            )
+
+        # Refresh the embedded role claims so new access tokens stay fresh
+        for claim, value in principal_claims(user).items():
+            refresh[claim] = value
+
+        if api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION:
+            _, created = refresh.blacklist(user=user)
+            if not created:
+                raise TokenError("Token is blacklisted")
+
+        data = {"access": str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            refresh.outstand(user=user)
+
+            data["refresh"] = str(refresh)
+
+        return data
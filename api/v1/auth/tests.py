@@ -1,7 +1,21 @@
+from datetime import timedelta
+from io import StringIO
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
 
+from core.services.authentication import ClaimsJWTAuthentication
+from core.services.token_blacklist import CachedRefreshToken, blacklist_cache
 
 User = get_user_model()
 
@@ -60,3 +74,101 @@ class AuthLoginTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
         self.assertEqual(response.data["error"]["code"], "AUTHENTICATION_FAILED")
+
+
+@override_settings(CACHE_SHARED=True)
+class ClaimsAuthenticationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="claimsuser",
+            email="claims@example.com",
+            password="defaultPassword123",
+        )
+        response = self.client.post(
+            "/api/v1/auth/login/",
+            {"username": self.user.username, "password": "defaultPassword123"},
+            format="json",
+        )
+        self.access = response.data["data"]["access"]
+
+    def _authenticate(self):
+        request = APIRequestFactory().get(
+            "/", HTTP_AUTHORIZATION=f"Bearer {self.access}"
+        )
+        return ClaimsJWTAuthentication().authenticate(request)
+
+    def test_fresh_token_skips_user_lookup(self):
+        with self.assertNumQueries(0):
+            user, _ = self._authenticate()
+
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(user.username, "claimsuser")
+        self.assertFalse(user.is_staff)
+
+    def test_stale_token_reloads_user(self):
+        self.user.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+    @override_settings(CACHE_SHARED=False)
+    def test_per_process_cache_always_loads_user(self):
+        # Another worker may have deactivated the user without this one knowing
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+
+class TokenRefreshTests(APITestCase):
+    def setUp(self):
+        blacklist_cache.clear()
+        self.user = User.objects.create_user(
+            username="refreshuser",
+            email="refresh@example.com",
+            password="defaultPassword123",
+        )
+        response = self.client.post(
+            "/api/v1/auth/login/",
+            {"username": self.user.username, "password": "defaultPassword123"},
+            format="json",
+        )
+        self.refresh = response.data["data"]["refresh"]
+
+    def _refresh(self, token):
+        return self.client.post(
+            "/api/token/refresh/", {"refresh": token}, format="json"
+        )
+
+    def test_rotated_token_cannot_be_reused(self):
+        response = self._refresh(self.refresh)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("refresh", response.data)
+
+        # Rejected from the in-process cache
+        self.assertEqual(
+            self._refresh(self.refresh).status_code, status.HTTP_401_UNAUTHORIZED
+        )
+
+        # Rejected by the blacklist insert when this process has not seen it
+        blacklist_cache.clear()
+        self.assertEqual(
+            self._refresh(self.refresh).status_code, status.HTTP_401_UNAUTHORIZED
+        )
+
+    def test_prune_tokens_removes_expired_tokens(self):
+        self._refresh(self.refresh)
+        jti = CachedRefreshToken(self.refresh, verify=False)["jti"]
+        OutstandingToken.objects.filter(jti=jti).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        call_command("prune_tokens", chunk_size=1, stdout=StringIO())
+
+        self.assertFalse(OutstandingToken.objects.filter(jti=jti).exists())
+        self.assertFalse(BlacklistedToken.objects.exists())
+        # The rotated replacement has not expired yet
+        self.assertEqual(OutstandingToken.objects.count(), 1)
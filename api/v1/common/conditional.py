@@ -0,0 +1,85 @@
+import hashlib
+import re
+
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def weak_etag(*parts):
+    return 'W/"{}"'.format("-".join(str(part) for part in parts))
+
+
+def versioned_etag(kind, pk, version, *parts):
+    """
+    ETag of a resource with a `version`. The version rides in it as `v<n>`,
+    so the ETag a GET served can be sent back as If-Match.
+    """
+    return weak_etag(kind, pk, f"v{version}", *parts)
+
+
+# `"3"`, or the opaque part of a versioned_etag(): `"task-12-v3-..."`
+VERSION_TAG = re.compile(r'"(?:(\d+)|[a-z-]+-\d+-v(\d+)(?:-[^"]*)?)"')
+
+
+def query_digest(request):
+    """Short digest of the query string, for ETags of filtered or paged lists"""
+    query = request.META.get("QUERY_STRING", "")
+    return hashlib.sha1(query.encode()).hexdigest()[:12]
+
+
+def _opaque(etag):
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def not_modified(request, etag):
+    """
+    304 response when If-None-Match matches `etag` (weak comparison), else None.
+    Call it after the permission checks and before serializing.
+    """
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return None
+
+    candidates = parse_etags(header)
+    if "*" in candidates or _opaque(etag) in {_opaque(tag) for tag in candidates}:
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
+
+def with_etag(response, etag):
+    response["ETag"] = etag
+    return response
+
+
+def expected_version(request):
+    """
+    The version the client last read, from If-Match or else a `version` field
+    in the body. If-Match takes the ETag a GET of the resource served, or a
+    bare quoted version such as `"3"`. Returns (version, error); both are None
+    when the request sends neither, and `If-Match: *` matches any version.
+    """
+    header = request.headers.get("If-Match")
+    if header:
+        tags = parse_etags(header)
+        if tags == ["*"]:
+            return None, None
+        match = VERSION_TAG.fullmatch(_opaque(tags[0])) if len(tags) == 1 else None
+        raw = next(group for group in match.groups() if group) if match else None
+        error = (
+            "If-Match must be the ETag served for the resource or a single "
+            'quoted version, e.g. "3".'
+        )
+    else:
+        raw = request.data.get("version") if hasattr(request.data, "get") else None
+        if raw is None:
+            return None, None
+        error = "version must be a positive integer."
+
+    try:
+        version = int(raw)
+    except (TypeError, ValueError):
+        return None, error
+    if version < 1:
+        return None, error
+    return version, None
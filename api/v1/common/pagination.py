@@ -0,0 +1,157 @@
+import base64
+import datetime
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q
+from rest_framework.exceptions import ValidationError
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder truncates datetimes to milliseconds, which would skip
+    rows that share the cursor's millisecond. Cursors keep the full value.
+    """
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPaginator:
+    """
+    Keyset (seek) pagination over a fixed ordering.
+
+    The cursor is the ordering values of the last row of the previous page,
+    so each page is an indexed range scan instead of an OFFSET. Ordering
+    fields (model fields or annotations) must be non-null, except those in
+    `nulls_last`, which sort nulls after every value. The last field must be
+    unique (usually "id").
+
+        paginator = KeysetPaginator(ordering=("-created_at", "-id"))
+        rows, pagination = paginator.paginate(queryset, request)
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+
+    def __init__(
+        self,
+        ordering=("-id",),
+        default_page_size=50,
+        max_page_size=200,
+        nulls_last=(),
+    ):
+        self.ordering = tuple(ordering)
+        self.default_page_size = default_page_size
+        self.max_page_size = max_page_size
+        self.nulls_last = frozenset(nulls_last)
+
+    # Cursor encoding
+
+    @staticmethod
+    def encode_cursor(values):
+        raw = json.dumps(values, cls=CursorEncoder, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def cursor_for(self, row):
+        """Cursor for the rows after `row`"""
+        return self.encode_cursor([getattr(row, name) for name in self._field_names()])
+
+    @staticmethod
+    def _output_field(queryset, name):
+        annotation = queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        return queryset.model._meta.get_field(name)
+
+    def decode_cursor(self, cursor, queryset):
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError("cursor does not match ordering")
+
+            # Restore typed values (dates, decimals, enums) through the model
+            # fields, or the output fields of annotated sort keys
+            return [
+                (
+                    None
+                    if value is None
+                    else self._output_field(queryset, name).to_python(value)
+                )
+                for name, value in zip(self._field_names(), values)
+            ]
+        except Exception:
+            raise ValidationError({self.cursor_query_param: ["Invalid cursor."]})
+
+    # Query building
+
+    def _field_names(self):
+        return [field.lstrip("-") for field in self.ordering]
+
+    def _order_by(self):
+        order_by = []
+        for field in self.ordering:
+            name = field.lstrip("-")
+            if name not in self.nulls_last:
+                order_by.append(field)
+            elif field.startswith("-"):
+                order_by.append(F(name).desc(nulls_last=True))
+            else:
+                order_by.append(F(name).asc(nulls_last=True))
+        return order_by
+
+    def _seek_filter(self, values):
+        """Rows strictly after the cursor: (a > x) OR (a = x AND b > y) ..."""
+        condition = Q()
+        equal_prefix = Q()
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip("-")
+            if value is None:
+                # Only a nulls_last field is null, and nothing sorts after null
+                equal_prefix &= Q(**{f"{name}__isnull": True})
+                continue
+            lookup = "lt" if field.startswith("-") else "gt"
+            after = Q(**{f"{name}__{lookup}": value})
+            if name in self.nulls_last:
+                after |= Q(**{f"{name}__isnull": True})
+            condition |= equal_prefix & after
+            equal_prefix &= Q(**{name: value})
+        return condition
+
+    def get_page_size(self, request):
+        raw = request.query_params.get(self.page_size_query_param)
+        if raw is None:
+            return self.default_page_size
+        try:
+            page_size = int(raw)
+        except ValueError:
+            raise ValidationError(
+                {self.page_size_query_param: ["A valid integer is required."]}
+            )
+        return max(1, min(page_size, self.max_page_size))
+
+    def paginate(self, queryset, request):
+        """Return (rows, pagination) for the page after the request's cursor"""
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self._order_by())
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            values = self.decode_cursor(cursor, queryset)
+            queryset = queryset.filter(self._seek_filter(values))
+
+        # One extra row tells us whether another page exists
+        rows = list(queryset[: page_size + 1])
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+
+        next_cursor = self.cursor_for(rows[-1]) if has_next else None
+
+        return rows, {
+            "page_size": page_size,
+            "has_next": has_next,
+            "next_cursor": next_cursor,
+        }
@@ -1,17 +1,26 @@
 from rest_framework import status
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
 
 class ResponseMixin:
-    def _success(self, data=None, message=None, status_code=status.HTTP_200_OK):
+    def _success(self, data=None, message=None, status_code=status.HTTP_200_OK, pagination=None):
         payload = {"success": True}
         if message:
             payload["message"] = message
         if data is not None:
             payload["data"] = data
+        if pagination is not None:
+            payload["pagination"] = pagination
         return Response(payload, status_code)
     
     def _error(self, code, message, details=None, status_code=status.HTTP_400_BAD_REQUEST):
         payload = {"success": False, "error": {"code": code, "message": message}}
         if details is not None:
             payload["error"]["details"] = details
-        return Response(payload, status=status_code)
\ No newline at end of file
+        return Response(payload, status=status_code)
+
+    def handle_exception(self, exc):
+        # Role gates raising with code FORBIDDEN answer in the standard envelope
+        if isinstance(exc, PermissionDenied) and getattr(exc.detail, "code", None) == "FORBIDDEN":
+            return self._error("FORBIDDEN", str(exc.detail), status_code=status.HTTP_403_FORBIDDEN)
+        return super().handle_exception(exc)
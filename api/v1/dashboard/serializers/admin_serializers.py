@@ -169,6 +169,7 @@ class AdminProjectListSerializer(serializers.ModelSerializer):
             "member_count",
             "tasks_completed",
             "tasks_total",
+            "version",
         ]
 
     def get_members(self, obj):
@@ -233,6 +234,7 @@ class AdminTaskListSerializer(serializers.ModelSerializer):
             "is_overdue",
             "created_at",
             "updated_at",
+            "version",
         ]
 
     def get_assignee(self, obj):
@@ -369,6 +371,7 @@ class AdminTaskDetailSerializer(serializers.ModelSerializer):
             "due_date",
             "created_at",
             "updated_at",
+            "version",
             "comments_count",
             "comments",
         ]
@@ -6,18 +6,19 @@ from django.utils import timezone
 from drf_spectacular.utils import extend_schema
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from core.services.authentication import ClaimsJWTAuthentication
 
 from api.v1.common.responses import ResponseMixin
 from core.services.enums import PriorityEnum, ProjectStatusEnum, StatusEnum
 from core.services.permissions import IsAdminDashboardUser
+from core.services.permission_context import PermissionContext
 from projects.models import ProjectsModel
 from tasks.models import TaskHistoryModel, TaskModel
 from ..serializers.admin_serializers import AdminAnalyticsResponseSerializer
 
 
 class AdminAnalyticsView(ResponseMixin, APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated, IsAdminDashboardUser]
 
     def _window_days(self, request) -> int:
@@ -64,21 +65,13 @@ class AdminAnalyticsView(ResponseMixin, APIView):
                 pass
         return "Unknown"
 
-    def _is_admin_user(self, user: User) -> bool:
-        return (
-            user.is_superuser
-            or user.is_staff
-            or user.groups.filter(name="Admin").exists()
-        )
-
-    def _is_project_manager(self, user: User) -> bool:
-        return user.groups.filter(name="Project Manager").exists()
-
-    def _projects_queryset(self, user: User):
-        if self._is_admin_user(user):
+    def _projects_queryset(self, request):
+        # Role flags were already resolved by IsAdminDashboardUser for this request
+        context = PermissionContext.for_request(request)
+        if context.is_admin:
             return ProjectsModel.objects.all()
-        if self._is_project_manager(user):
-            return ProjectsModel.objects.filter(created_by=user)
+        if context.is_project_manager:
+            return ProjectsModel.objects.filter(created_by=request.user)
         return ProjectsModel.objects.none()
 
     @extend_schema(responses=AdminAnalyticsResponseSerializer)
@@ -92,7 +85,7 @@ class AdminAnalyticsView(ResponseMixin, APIView):
         prev_start = window_start - timedelta(days=window_days)
         prev_end = window_start
 
-        projects_qs = self._projects_queryset(request.user)
+        projects_qs = self._projects_queryset(request)
         tasks_qs = TaskModel.objects.filter(project__in=projects_qs)
         history_qs = TaskHistoryModel.objects.filter(task__project__in=projects_qs)
 
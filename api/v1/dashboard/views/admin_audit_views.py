@@ -1,14 +1,14 @@
-from rest_framework import status
 from drf_spectacular.utils import extend_schema
 
 from django.db.models import Q
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from core.services.authentication import ClaimsJWTAuthentication
 from django.contrib.auth.models import User
 
 from api.v1.common.responses import ResponseMixin
-from projects.models import ProjectsModel
+from core.services.project_access import ProjectAccessService
+from core.services.permissions import IsProjectManagerOrStaff
 
 # from tasks.models import TaskHistoryModel
 from audit.models import GlobalAuditLog
@@ -30,23 +30,13 @@ class AdminAuditLogsView(ResponseMixin, APIView):
       - limit       : number of results to return (default: 50, max: 200)
     """
 
-    authentication_classes = [JWTAuthentication]
-    permission_classes = [IsAuthenticated]
-
-    def _is_authorised(self, user):
-        return user.is_staff or user.groups.filter(name="Project Manager").exists()
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsProjectManagerOrStaff]
 
     @extend_schema(responses=AuditLogsResponseSerializer)
     def get(self, request):
         user = request.user
 
-        if not self._is_authorised(user):
-            return self._error(
-                "FORBIDDEN",
-                "Admin or Project Manager access required.",
-                status_code=status.HTTP_403_FORBIDDEN,
-            )
-
         base_qs = GlobalAuditLog.objects.select_related(
             "actor",
             "actor__profile",
@@ -54,14 +44,9 @@ class AdminAuditLogsView(ResponseMixin, APIView):
         ).order_by("-occurred_at")
 
         if not user.is_staff:
-            project_ids = list(
-                ProjectsModel.objects.filter(
-                    Q(created_by=user) | Q(members__project_member=user)
-                )
-                .distinct()
-                .values_list("id", flat=True)
+            base_qs = base_qs.filter(
+                project_id__in=ProjectAccessService.project_ids_for(user)
             )
-            base_qs = base_qs.filter(project_id__in=project_ids)
 
         search = request.query_params.get("search", "").strip()
         if search:
@@ -1,21 +1,26 @@
 from rest_framework import status
 from drf_spectacular.utils import extend_schema
 
-from django.db.models import Count, Q
+from django.db.models.functions import Coalesce
 from rest_framework.permissions import IsAdminUser
 from rest_framework.views import APIView
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from core.services.authentication import ClaimsJWTAuthentication
 
+from api.v1.common.conditional import expected_version
 from api.v1.common.responses import ResponseMixin
+from core.services.project_archive import ProjectArchiveService
+from core.services.project_deletion import ProjectDeletionService
 from core.services.project_service import ProjectService
+from core.services.versioning import VersionConflict
 from projects.models import ProjectsModel
+from api.v1.projects.serializers import ProjectDeletionJobSerializer
 from ..serializers.admin_serializers import (
     AdminProjectListSerializer,
     AdminProjectMemberSerializer,
     AdminProjectWriteSerializer,
 )
 from core.services.audit_service import AuditService
-from core.services.enums import StatusEnum, AuditModule
+from core.services.enums import AuditModule
 from core.services.permissions import IsAdminDashboardUser
 
 
@@ -25,7 +30,7 @@ class AdminProjectMembersView(ResponseMixin, APIView):
     Returns members for a specific project
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAdminDashboardUser]
 
     @extend_schema(responses=AdminProjectMemberSerializer)
@@ -61,7 +66,7 @@ class AdminProjectsView(ResponseMixin, APIView):
     POST /dashboard/admin/projects/   — create a new project
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAdminDashboardUser]
 
     def _base_queryset(self):
@@ -73,13 +78,9 @@ class AdminProjectsView(ResponseMixin, APIView):
                 "members__project_member__profile",
             )
             .annotate(
-                tasks_total=Count("project_tasks", distinct=True),
-                tasks_completed=Count(
-                    "project_tasks",
-                    filter=Q(project_tasks__status=StatusEnum.DONE),
-                    distinct=True,
-                ),
-                member_count=Count("members", distinct=True),
+                tasks_total=Coalesce("stats__total_tasks", 0),
+                tasks_completed=Coalesce("stats__done_tasks", 0),
+                member_count=Coalesce("stats__member_count", 0),
             )
             .order_by("-created_at")
         )
@@ -137,7 +138,7 @@ class AdminProjectDetailView(ResponseMixin, APIView):
     DELETE /dashboard/admin/projects/<pk>/  — delete project
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAdminDashboardUser]
 
     def _get_project(self, pk):
@@ -152,13 +153,9 @@ class AdminProjectDetailView(ResponseMixin, APIView):
                     "members__project_member__profile",
                 )
                 .annotate(
-                    tasks_total=Count("project_tasks", distinct=True),
-                    tasks_completed=Count(
-                        "project_tasks",
-                        filter=Q(project_tasks__status=StatusEnum.DONE),
-                        distinct=True,
-                    ),
-                    member_count=Count("members", distinct=True),
+                    tasks_total=Coalesce("stats__total_tasks", 0),
+                    tasks_completed=Coalesce("stats__done_tasks", 0),
+                    member_count=Coalesce("stats__member_count", 0),
                 )
                 .get(pk=pk)
             )
@@ -190,6 +187,13 @@ class AdminProjectDetailView(ResponseMixin, APIView):
                 status_code=status.HTTP_404_NOT_FOUND,
             )
 
+        if ProjectArchiveService.is_archived(project.pk):
+            return self._error(
+                "PROJECT_ARCHIVED",
+                "Archived projects are read-only",
+                status_code=status.HTTP_403_FORBIDDEN,
+            )
+
         before = {
             "project_name": project.project_name,
             "description": project.description,
@@ -210,11 +214,31 @@ class AdminProjectDetailView(ResponseMixin, APIView):
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
-        updated_project = ProjectService.update_project(
-            user=request.user,
-            project_id=project.pk,
-            data=serializer.validated_data,
-        )
+        version, version_error = expected_version(request)
+        if version_error:
+            return self._error(
+                "INVALID_INPUT",
+                version_error,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            updated_project = ProjectService.update_project(
+                user=request.user,
+                project_id=project.pk,
+                data=serializer.validated_data,
+                version=version,
+            )
+        except VersionConflict:
+            current = AdminProjectListSerializer(
+                self._get_project(pk), context={"request": request}
+            )
+            return self._error(
+                "VERSION_CONFLICT",
+                "The project was changed by someone else.",
+                {"current": current.data},
+                status_code=status.HTTP_409_CONFLICT,
+            )
 
         updated = self._get_project(updated_project.pk)
         if not updated:
@@ -263,21 +287,12 @@ class AdminProjectDetailView(ResponseMixin, APIView):
                 status_code=status.HTTP_404_NOT_FOUND,
             )
 
-        project_id = project.pk
-        project_name = project.project_name
-
-        AuditService.deleted(
-            module=AuditModule.PROJECT,
-            actor=request.user,
-            target_type=ProjectsModel.__name__,
-            target_id=project_id,
-            target_label=project_name,
-            project=project,
-            description=f'Deleted project "{project_name}"',
-            metadata={"project_name": project_name},
+        # Deleted in the background; the job writes the audit entry when done
+        job, _created = ProjectDeletionService.start(
+            project=project, requested_by=request.user
         )
-        project.delete()
         return self._success(
-            message="Project deleted successfully",
-            status_code=status.HTTP_204_NO_CONTENT,
+            data=ProjectDeletionJobSerializer(job).data,
+            message="Project deletion started",
+            status_code=status.HTTP_202_ACCEPTED,
         )
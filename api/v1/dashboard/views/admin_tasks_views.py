@@ -2,18 +2,21 @@ from datetime import timedelta
 from rest_framework import status
 from drf_spectacular.utils import extend_schema
 
-from django.db.models import Q
 from django.utils import timezone
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from core.services.authentication import ClaimsJWTAuthentication
 from django.contrib.auth.models import User
 
+from api.v1.common.conditional import expected_version
 from api.v1.common.responses import ResponseMixin
 from core.services.enums import StatusEnum, AuditModule
+from core.services.search import SearchService
 from core.services.task_service import TaskService
+from core.services.versioning import VersionConflict
 from core.services.audit_service import AuditService
-from projects.models import ProjectsModel
+from core.services.project_access import ProjectAccessService
+from core.services.permissions import IsProjectManagerOrStaff
 from tasks.models import TaskHistoryModel, TaskModel, CommentModel
 from accounts.models import RegisterModel
 from ..serializers.admin_serializers import (
@@ -37,7 +40,7 @@ class AdminQuickActionsView(ResponseMixin, APIView):
     - recent_activity: platform-wide events — new registrations + task history (up to 20)
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     @extend_schema(responses=AdminQuickActionsSerializer)
@@ -137,16 +140,13 @@ class AdminTasksView(ResponseMixin, APIView):
     plus summary stats shown in the two cards at the top of the Tasks tab.
 
     Query params:
-      - search   : filters by task title or project name
+      - search   : full-text prefix match on the task's or its project's text
       - status   : exact match against StatusEnum (TO_DO, IN_PROGRESS, IN_REVIEW, DONE)
       - priority : exact match against PriorityEnum (LOW, MEDIUM, HIGH)
     """
 
-    authentication_classes = [JWTAuthentication]
-    permission_classes = [IsAuthenticated]
-
-    def _is_authorised(self, user):
-        return user.is_staff or user.groups.filter(name="Project Manager").exists()
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsProjectManagerOrStaff]
 
     def _base_queryset(self, user):
         qs = TaskModel.objects.select_related(
@@ -156,25 +156,11 @@ class AdminTasksView(ResponseMixin, APIView):
         ).order_by("-created_at")
         if user.is_staff:
             return qs
-        project_ids = list(
-            ProjectsModel.objects.filter(
-                Q(created_by=user) | Q(members__project_member=user)
-            )
-            .distinct()
-            .values_list("id", flat=True)
-        )
-        return qs.filter(project_id__in=project_ids)
+        return qs.filter(project_id__in=ProjectAccessService.project_ids_for(user))
 
     @extend_schema(responses=AdminTasksResponseSerializer)
     def get(self, request):
         user = request.user
-        if not self._is_authorised(user):
-            return self._error(
-                "FORBIDDEN",
-                "Admin or Project Manager access required.",
-                status_code=status.HTTP_403_FORBIDDEN,
-            )
-
         today = timezone.now().date()
         base_qs = self._base_queryset(user)
 
@@ -189,11 +175,9 @@ class AdminTasksView(ResponseMixin, APIView):
 
         task_qs = base_qs
 
-        search = request.query_params.get("search", "").strip()
-        if search:
-            task_qs = task_qs.filter(
-                Q(title__icontains=search) | Q(project__project_name__icontains=search)
-            )
+        search = SearchService.parse(request.query_params.get("search", ""))
+        if search is not None:
+            task_qs = task_qs.filter(SearchService.task_match(search))
 
         status_filter = request.query_params.get("status", "").strip().upper()
         if status_filter:
@@ -228,11 +212,8 @@ class AdminTaskDetailView(ResponseMixin, APIView):
         Admin: any task. Project Manager: only tasks in their projects.
     """
 
-    authentication_classes = [JWTAuthentication]
-    permission_classes = [IsAuthenticated]
-
-    def _is_authorised(self, user):
-        return user.is_staff or user.groups.filter(name="Project Manager").exists()
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsProjectManagerOrStaff]
 
     def _get_task(self, pk, user):
         try:
@@ -255,14 +236,7 @@ class AdminTaskDetailView(ResponseMixin, APIView):
         if user.is_staff:
             return task, None
 
-        project_ids = list(
-            ProjectsModel.objects.filter(
-                Q(created_by=user) | Q(members__project_member=user)
-            )
-            .distinct()
-            .values_list("id", flat=True)
-        )
-        if task.project.pk not in project_ids:
+        if not ProjectAccessService.has_access(user, task.project_id):
             return None, "forbidden"
 
         return task, None
@@ -270,13 +244,6 @@ class AdminTaskDetailView(ResponseMixin, APIView):
     @extend_schema(responses=AdminTaskDetailSerializer)
     def get(self, request, pk):
         user = request.user
-        if not self._is_authorised(user):
-            return self._error(
-                "FORBIDDEN",
-                "Admin or Project Manager access required.",
-                status_code=status.HTTP_403_FORBIDDEN,
-            )
-
         task, err = self._get_task(pk, user)
         if err == "not_found":
             return self._error(
@@ -298,13 +265,6 @@ class AdminTaskDetailView(ResponseMixin, APIView):
     @extend_schema(request=AdminTaskUpdateSerializer, responses=AdminTaskListSerializer)
     def patch(self, request, pk):
         user = request.user
-        if not self._is_authorised(user):
-            return self._error(
-                "FORBIDDEN",
-                "Admin or Project Manager access required.",
-                status_code=status.HTTP_403_FORBIDDEN,
-            )
-
         task, err = self._get_task(pk, user)
         if err == "not_found":
             return self._error(
@@ -330,6 +290,14 @@ class AdminTaskDetailView(ResponseMixin, APIView):
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
+        version, version_error = expected_version(request)
+        if version_error:
+            return self._error(
+                "VALIDATION_ERROR",
+                version_error,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
         data = serializer.validated_data or {}
         update_payload = {}
 
@@ -345,7 +313,9 @@ class AdminTaskDetailView(ResponseMixin, APIView):
                 update_payload["assigned_to"] = None
             else:
                 try:
-                    update_payload["assigned_to"] = User.objects.get(pk=assigned_id)
+                    update_payload["assigned_to"] = User.objects.select_related(
+                        "profile"
+                    ).get(pk=assigned_id)
                 except User.DoesNotExist:
                     return self._error(
                         "NOT_FOUND",
@@ -353,15 +323,24 @@ class AdminTaskDetailView(ResponseMixin, APIView):
                         status_code=status.HTTP_404_NOT_FOUND,
                     )
 
-        updated_task = TaskService.update_task(
-            user=request.user,
-            task_id=task.pk,
-            data=update_payload,
-        )
-
-        updated_task = TaskModel.objects.select_related(
-            "project", "assigned_to", "assigned_to__profile"
-        ).get(pk=updated_task.pk)
+        try:
+            updated_task = TaskService.update_task(
+                user=request.user,
+                task=task,
+                data=update_payload,
+                version=version,
+            )
+        except VersionConflict as conflict:
+            return self._error(
+                "VERSION_CONFLICT",
+                "The task was changed by someone else.",
+                {
+                    "current": AdminTaskListSerializer(
+                        conflict.instance, context={"request": request}
+                    ).data
+                },
+                status_code=status.HTTP_409_CONFLICT,
+            )
 
         return self._success(
             data=AdminTaskListSerializer(
@@ -372,13 +351,6 @@ class AdminTaskDetailView(ResponseMixin, APIView):
 
     def delete(self, request, pk):
         user = request.user
-        if not self._is_authorised(user):
-            return self._error(
-                "FORBIDDEN",
-                "Admin or Project Manager access required.",
-                status_code=status.HTTP_403_FORBIDDEN,
-            )
-
         task, err = self._get_task(pk, user)
         if err == "not_found" or err == "forbidden":
             return self._error(
@@ -401,7 +373,7 @@ class AdminTaskDetailView(ResponseMixin, APIView):
                 },
             )
 
-            task.delete()
+            TaskService.delete_task(task=task)
 
         return self._success(message="Task deleted successfully.")
 
@@ -413,11 +385,8 @@ class AdminTaskCommentsView(ResponseMixin, APIView):
     Access: Admin (any task) or Project Manager (only tasks in their projects).
     """
 
-    authentication_classes = [JWTAuthentication]
-    permission_classes = [IsAuthenticated]
-
-    def _is_authorised(self, user):
-        return user.is_staff or user.groups.filter(name="Project Manager").exists()
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated, IsProjectManagerOrStaff]
 
     def _get_task(self, pk, user):
         try:
@@ -428,14 +397,7 @@ class AdminTaskCommentsView(ResponseMixin, APIView):
         if user.is_staff:
             return task, None
 
-        project_ids = list(
-            ProjectsModel.objects.filter(
-                Q(created_by=user) | Q(members__project_member=user)
-            )
-            .distinct()
-            .values_list("id", flat=True)
-        )
-        if task.project.pk not in project_ids:
+        if not ProjectAccessService.has_access(user, task.project_id):
             return None, "forbidden"
 
         return task, None
@@ -443,13 +405,6 @@ class AdminTaskCommentsView(ResponseMixin, APIView):
     @extend_schema(responses=AdminTaskCommentSerializer(many=True))
     def get(self, request, pk):
         user = request.user
-        if not self._is_authorised(user):
-            return self._error(
-                "FORBIDDEN",
-                "Admin or Project Manager access required.",
-                status_code=status.HTTP_403_FORBIDDEN,
-            )
-
         task, err = self._get_task(pk, user)
         if err == "not_found":
             return self._error(
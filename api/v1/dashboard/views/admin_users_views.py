@@ -5,7 +5,7 @@ from django.contrib.auth.models import User, Group
 from django.db.models import Count, Q
 from rest_framework.permissions import IsAdminUser
 from rest_framework.views import APIView
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from core.services.authentication import ClaimsJWTAuthentication
 
 from api.v1.common.responses import ResponseMixin
 from ..serializers.admin_serializers import (
@@ -22,7 +22,7 @@ class AdminUsersView(ResponseMixin, APIView):
     GET  /dashboard/admin/users/  — list all users with search & filters
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAdminDashboardUser]
 
     @extend_schema(responses=AdminUserSerializer(many=True))
@@ -71,7 +71,7 @@ class AdminUserDetailView(ResponseMixin, APIView):
     DELETE /dashboard/admin/users/<pk>/  — delete user
     """
 
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAdminDashboardUser]
 
     def _get_user(self, pk):
@@ -1,17 +1,18 @@
 from datetime import timedelta
 from rest_framework import status
 
-from django.db.models import Count, Q
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.views import APIView
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from core.services.authentication import ClaimsJWTAuthentication
 from django.contrib.auth.models import User, Group
 
 from api.v1.common.responses import ResponseMixin
 from core.services.enums import StatusEnum
 from core.services.project_service import ProjectService
+from core.services.project_access import ProjectAccessService
 from projects.models import ProjectMembers, ProjectsModel
 from tasks.models import CommentModel, TaskHistoryModel, TaskModel
 
@@ -29,7 +30,7 @@ def _pct_change(current: int, previous: int) -> float | None:
 
 
 class DashboardView(ResponseMixin, APIView):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     @extend_schema(responses=DashboardSerializer)
@@ -41,13 +42,7 @@ class DashboardView(ResponseMixin, APIView):
         two_weeks_ago = now - timedelta(days=14)
 
         # Resolve which projects the user can see
-        user_project_ids = list(
-            ProjectsModel.objects.filter(
-                Q(created_by=user) | Q(members__project_member=user)
-            )
-            .distinct()
-            .values_list("id", flat=True)
-        )
+        user_project_ids = ProjectAccessService.project_ids_for(user)
 
         # Base task queryset for the user's projects
         base_qs = TaskModel.objects.filter(project_id__in=user_project_ids)
@@ -89,11 +84,8 @@ class DashboardView(ResponseMixin, APIView):
         projects = (
             ProjectsModel.objects.filter(id__in=user_project_ids)
             .annotate(
-                total_tasks=Count("project_tasks"),
-                completed_tasks=Count(
-                    "project_tasks",
-                    filter=Q(project_tasks__status=StatusEnum.DONE),
-                ),
+                total_tasks=Coalesce("stats__total_tasks", 0),
+                completed_tasks=Coalesce("stats__done_tasks", 0),
             )
             .order_by("-updated_at")[:10]
         )
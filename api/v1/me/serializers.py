@@ -0,0 +1,21 @@
+from rest_framework import serializers
+
+from tasks.models import TaskModel
+from ..tasks.serializers import ProjectInfoSerializer
+
+
+class WorkItemSerializer(serializers.ModelSerializer):
+    project = ProjectInfoSerializer(read_only=True)
+    is_primary = serializers.BooleanField(read_only=True)
+
+    class Meta:
+        model = TaskModel
+        fields = [
+            "id",
+            "title",
+            "status",
+            "priority",
+            "due_date",
+            "project",
+            "is_primary",
+        ]
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import WorkInboxView
+
+urlpatterns = [
+    path("work/", WorkInboxView.as_view(), name="me-work"),
+]
@@ -0,0 +1,64 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+
+from api.v1.common.pagination import KeysetPaginator
+from api.v1.common.responses import ResponseMixin
+from core.services.authentication import ClaimsJWTAuthentication
+from core.services.task_assignment import (
+    INBOX_NULLS_LAST,
+    INBOX_ORDERING,
+    TaskAssignmentService,
+)
+from tasks.models import TaskModel
+from .serializers import WorkItemSerializer
+
+
+class WorkInboxView(ResponseMixin, APIView):
+    """
+    GET /me/work/
+    The open tasks assigned to the user across all projects, soonest due
+    first (undated last), paged with a cursor.
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    paginator = KeysetPaginator(
+        ordering=INBOX_ORDERING,
+        default_page_size=50,
+        max_page_size=200,
+        nulls_last=INBOX_NULLS_LAST,
+    )
+
+    @extend_schema(responses=WorkItemSerializer(many=True))
+    def get(self, request):
+        try:
+            assignments, pagination = self.paginator.paginate(
+                TaskAssignmentService.inbox(request.user), request
+            )
+        except ValidationError as exc:
+            return self._error(
+                "INVALID_INPUT",
+                "Invalid pagination parameters",
+                details=exc.detail,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # The page comes from the assignment index alone; its tasks are one
+        # primary-key lookup, put back in inbox order
+        tasks = TaskModel.objects.select_related("project").in_bulk(
+            [assignment.task_id for assignment in assignments]
+        )
+        rows = []
+        for assignment in assignments:
+            task = tasks.get(assignment.task_id)
+            if task is not None:
+                task.is_primary = task.assigned_to_id == request.user.pk
+                rows.append(task)
+
+        return self._success(
+            data=WorkItemSerializer(rows, many=True).data, pagination=pagination
+        )
@@ -3,7 +3,7 @@ from rest_framework.request import Request
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from core.services.authentication import ClaimsJWTAuthentication
 
 from notifications.models import Notification, NotificationPreference
 from core.services.permissions import NotificationPermissions
@@ -12,7 +12,7 @@ from .serializers import NotificationSerializer, NotificationPreferenceSerialize
 
 
 class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [NotificationPermissions]
     serializer_class = NotificationSerializer
 
@@ -54,7 +54,7 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
 
 
 class NotificationPreferenceViewSet(viewsets.ModelViewSet):
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     permission_classes = [NotificationPermissions]
     serializer_class = NotificationPreferenceSerializer
 
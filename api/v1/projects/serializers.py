@@ -3,12 +3,23 @@ from rest_framework.exceptions import ValidationError
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError as DjangoValidationError
 
-from projects.models import ProjectsModel, ProjectMembers
+from projects.models import ProjectsModel, ProjectMembers, ProjectStats, ProjectDeletionJob
 from ..accounts.serializers import UserSerializer
 from ..tasks.serializers import TaskSerializer
-from core.services.enums import RoleEnum, StatusEnum
+from core.services.enums import DeletionJobStatusEnum, RoleEnum, StatusEnum
+from core.services.presence import PresenceService
+from core.services.project_stats import ProjectStatsService
+from core.services.user_directory import UserDirectoryService
 
 
+# Project lists only carry the newest few tasks of each project;
+# full task lists come from the per-project tasks action
+TASKS_PREVIEW_DEFAULT = 5
+TASKS_PREVIEW_MAX = 20
+
+# Most users a single bulk membership request may add
+BULK_MEMBERS_MAX = 1000
+
 ROLE_MAP = {
     "ADMIN": "Admin",
     "PROJECT_MANAGER": "Project Manager",
@@ -20,14 +31,27 @@ ROLE_MAP = {
 class ProjectProgressMixin:
     # project_progress = serializers.SerializerMethodField()
 
-    def _compute_progress(self, obj):
+    def _task_counts(self, obj):
+        """(total, completed) from the queryset annotations or the ProjectStats row"""
         total_tasks = getattr(obj, "total_tasks", None)
-        if total_tasks is None:
-            total_tasks = obj.project_tasks.count()
-
         completed_tasks = getattr(obj, "completed_tasks", None)
-        if completed_tasks is None:
-            completed_tasks = obj.project_tasks.filter(status=StatusEnum.DONE).count()
+        if total_tasks is None or completed_tasks is None:
+            try:
+                stats = obj.stats
+            except ProjectStats.DoesNotExist:
+                return 0, 0
+            total_tasks, completed_tasks = stats.total_tasks, stats.done_tasks
+        return total_tasks, completed_tasks
+
+    def _overdue_tasks(self, obj):
+        """From the queryset annotation, or counted like it"""
+        overdue_tasks = getattr(obj, "overdue_tasks", None)
+        if overdue_tasks is None:
+            overdue_tasks = ProjectStatsService.overdue_count(obj.pk)
+        return overdue_tasks
+
+    def _compute_progress(self, obj):
+        total_tasks, completed_tasks = self._task_counts(obj)
 
         progress_pct = (
             round((completed_tasks / total_tasks) * 100, 1) if total_tasks else 0.0
@@ -38,6 +62,7 @@ class ProjectProgressMixin:
             "project_name": obj.project_name,
             "total_tasks": total_tasks,
             "completed_tasks": completed_tasks,
+            "overdue_tasks": self._overdue_tasks(obj),
             "progress_pct": progress_pct,
         }
 
@@ -102,6 +127,7 @@ class ProjectListSerializer(ProjectProgressMixin, serializers.ModelSerializer):
     priority = serializers.SerializerMethodField()
     total_tasks = serializers.SerializerMethodField()
     tasks_completed = serializers.SerializerMethodField()
+    overdue_tasks = serializers.SerializerMethodField()
     progress = serializers.SerializerMethodField()
     tasks = serializers.SerializerMethodField()
 
@@ -118,6 +144,7 @@ class ProjectListSerializer(ProjectProgressMixin, serializers.ModelSerializer):
             "progress",
             "total_tasks",
             "tasks_completed",
+            "overdue_tasks",
             "team_members",
             "tasks",
             "created_by",
@@ -136,25 +163,27 @@ class ProjectListSerializer(ProjectProgressMixin, serializers.ModelSerializer):
         return self._enum_to_value(obj.priority)
 
     def get_total_tasks(self, obj):
-        annotated = getattr(obj, "total_tasks", None)
-        return annotated if annotated is not None else obj.project_tasks.count()
+        return self._task_counts(obj)[0]
 
     def get_tasks_completed(self, obj):
-        annotated = getattr(obj, "completed_tasks", None)
-        if annotated is not None:
-            return annotated
-        return obj.project_tasks.filter(status=StatusEnum.DONE).count()
+        return self._task_counts(obj)[1]
+
+    def get_overdue_tasks(self, obj):
+        return self._overdue_tasks(obj)
 
     def get_progress(self, obj):
-        total_tasks = self.get_total_tasks(obj)
-        completed_tasks = self.get_tasks_completed(obj)
+        total_tasks, completed_tasks = self._task_counts(obj)
         return round((completed_tasks / total_tasks) * 100) if total_tasks else 0
 
     def get_tasks(self, obj):
         # Return lightweight task objects; frontend still gets [] when none exist.
-        task_rows = obj.project_tasks.all().only(
-            "id", "title", "status", "priority", "due_date"
-        )
+        # The list view prefetches the preview with a window function.
+        task_rows = getattr(obj, "tasks_preview", None)
+        if task_rows is None:
+            preview_size = self.context.get("tasks_preview", TASKS_PREVIEW_DEFAULT)
+            task_rows = obj.project_tasks.order_by("-created_at", "-id").only(
+                "id", "title", "status", "priority", "due_date"
+            )[:preview_size]
         return [
             {
                 "id": t.id,
@@ -173,6 +202,8 @@ class ProjectsDetailSerializer(ProjectProgressMixin, serializers.ModelSerializer
     members = ProjectMemberSerializer(many=True, read_only=True)
     status = serializers.SerializerMethodField()
     priority = serializers.SerializerMethodField()
+    # Null unless the project is archived (and read-only)
+    archived_at = serializers.DateTimeField(source="archive.archived_at", read_only=True)
 
     class Meta:
         model = ProjectsModel
@@ -256,17 +287,21 @@ class InviteTeamMemberSerializer(serializers.Serializer):
             )
         return data
 
-    def validate_email(self, value):
-        """Validate that user with email exists"""
-        if value and not User.objects.filter(email=value).exists():
-            raise ValidationError("No user found with this email address")
-        return value
-
-    def validate_username(self, value):
-        """Validate that user with username exists"""
-        if value and not User.objects.filter(username=value).exists():
-            raise ValidationError("No user found with this username")
-        return value
+    def validate(self, attrs):
+        """
+        Resolve the user (by email, else username) in one query, annotated
+        with `is_member` of the "project" in the context
+        """
+        email, username = attrs.get("email"), attrs.get("username")
+        user = UserDirectoryService.resolve(
+            email=email, username=username, project=self.context.get("project")
+        )
+        if user is None and email:
+            raise ValidationError({"email": "No user found with this email address"})
+        if user is None and username:
+            raise ValidationError({"username": "No user found with this username"})
+        attrs["user"] = user
+        return attrs
 
 
 class ProjectMemberDetailSerializer(serializers.ModelSerializer):
@@ -283,6 +318,7 @@ class ProjectMemberDetailSerializer(serializers.ModelSerializer):
     role = serializers.CharField(source="role_in_project", read_only=True)
     is_online = serializers.SerializerMethodField()
     task_count = serializers.SerializerMethodField()
+    open_task_count = serializers.SerializerMethodField()
 
     class Meta:
         model = ProjectMembers
@@ -296,6 +332,7 @@ class ProjectMemberDetailSerializer(serializers.ModelSerializer):
             "role",
             "is_online",
             "task_count",
+            "open_task_count",
         ]
 
     def get_avatar(self, obj):
@@ -307,22 +344,28 @@ class ProjectMemberDetailSerializer(serializers.ModelSerializer):
         return None
 
     def get_is_online(self, obj):
-        """Check if user was active in last 5 minutes"""
-        if (
-            hasattr(obj.project_member, "profile")
-            and obj.project_member.profile.last_seen
-        ):
-            from django.utils import timezone
-            from datetime import timedelta
-
-            return timezone.now() - obj.project_member.profile.last_seen < timedelta(
-                minutes=5
-            )
-        return False
+        """Check if user was active in the presence window (reads the loaded profile)"""
+        profile = getattr(obj.project_member, "profile", None)
+        return PresenceService.is_online(
+            obj.project_member_id, profile.last_seen if profile else None
+        )
+
+    def _project_tasks(self, obj):
+        return obj.project_member.assigned_tasks.filter(project_id=obj.project_id)
 
     def get_task_count(self, obj):
         """Get task count for this user in this project"""
-        return obj.project_member.assigned_tasks.filter(project=obj.project).count()
+        annotated = getattr(obj, "task_count", None)
+        if annotated is not None:
+            return annotated
+        return self._project_tasks(obj).count()
+
+    def get_open_task_count(self, obj):
+        """Assigned tasks in this project that are not done"""
+        annotated = getattr(obj, "open_task_count", None)
+        if annotated is not None:
+            return annotated
+        return self._project_tasks(obj).exclude(status=StatusEnum.DONE).count()
 
 
 class TeamStatsSerializer(serializers.Serializer):
@@ -357,6 +400,34 @@ class AddTeamMemberSerializer(serializers.Serializer):
         return mapped_role
 
 
+class BulkTeamMemberEntrySerializer(serializers.Serializer):
+    """One user to add, identified by user_id or email"""
+
+    user_id = serializers.IntegerField(min_value=1, required=False)
+    email = serializers.EmailField(required=False)
+    role = serializers.CharField()
+
+    def validate_role(self, value):
+        normalized = value.strip().upper().replace(" ", "_")
+        mapped_role = ROLE_MAP.get(normalized)
+        if not mapped_role:
+            raise ValidationError(
+                "Invalid role. Allowed values: ADMIN, PROJECT_MANAGER, DEVELOPER, GUEST"
+            )
+        return mapped_role
+
+    def validate(self, attrs):
+        if ("user_id" in attrs) == ("email" in attrs):
+            raise ValidationError("Provide exactly one of user_id or email")
+        return attrs
+
+
+class BulkAddTeamMembersSerializer(serializers.Serializer):
+    members = BulkTeamMemberEntrySerializer(
+        many=True, allow_empty=False, max_length=BULK_MEMBERS_MAX
+    )
+
+
 class UpdateMemberRoleSerializer(serializers.Serializer):
     role = serializers.CharField()
 
@@ -368,3 +439,29 @@ class UpdateMemberRoleSerializer(serializers.Serializer):
                 "Invalid role. Allowed values: ADMIN, PROJECT_MANAGER, DEVELOPER, GUEST"
             )
         return mapped_role
+
+
+class ProjectDeletionJobSerializer(serializers.ModelSerializer):
+    progress_pct = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ProjectDeletionJob
+        fields = [
+            "id",
+            "project_id",
+            "project_name",
+            "status",
+            "current_step",
+            "processed_rows",
+            "total_rows",
+            "progress_pct",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+
+    def get_progress_pct(self, obj):
+        if not obj.total_rows:
+            return 100.0 if obj.status == DeletionJobStatusEnum.COMPLETED else 0.0
+        return round(obj.processed_rows / obj.total_rows * 100, 1)
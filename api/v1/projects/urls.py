@@ -1,9 +1,11 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
-from .viewsets import ProjectsViewSet
+from .viewsets import ProjectsViewSet, ProjectDeletionJobView
 
 router = DefaultRouter()
 router.register(r'', ProjectsViewSet, basename='team-projects')
 
-urlpatterns = router.urls
\ No newline at end of file
+urlpatterns = [
+    path('deletion-jobs/<int:pk>/', ProjectDeletionJobView.as_view(), name='project-deletion-job'),
+] + router.urls
\ No newline at end of file
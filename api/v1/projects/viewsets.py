@@ -1,12 +1,28 @@
 from rest_framework import viewsets, status
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from core.services.authentication import ClaimsJWTAuthentication
 from django.contrib.auth.models import User
+from django.utils import timezone
 from rest_framework.decorators import action
-from django.db.models import Q, Count
+from django.db.models import (
+    Q,
+    Count,
+    F,
+    FilteredRelation,
+    Prefetch,
+    Window,
+    prefetch_related_objects,
+)
+from django.db.models.functions import Coalesce, RowNumber
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import get_object_or_404
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
 from drf_spectacular.types import OpenApiTypes
 
-from projects.models import ProjectsModel, ProjectMembers
+from projects.models import ProjectsModel, ProjectMembers, ProjectDeletionJob
 from .serializers import (
     TaskSerializer,
     ProjectListSerializer,
@@ -17,20 +33,49 @@ from .serializers import (
     TeamStatsSerializer,
     UpdateMemberRoleSerializer,
     AddTeamMemberSerializer,
+    BulkAddTeamMembersSerializer,
+    ProjectDeletionJobSerializer,
+    TASKS_PREVIEW_DEFAULT,
+    TASKS_PREVIEW_MAX,
+)
+from ..tasks.serializers import (
+    BoardCardSerializer,
+    TaskFilterSerializer,
+    TaskImportRowSerializer,
+    TaskImportSerializer,
 )
+from core.services.board import CARD_ORDERING, BoardService
 from core.services.permissions import ProjectPermissions
 from core.services.project_service import ProjectService
+from core.services.permission_context import PermissionContext
+from core.services.project_access import ProjectAccessService
+from core.services.project_archive import ProjectArchiveService
+from core.services.project_deletion import ProjectDeletionService
+from core.services.project_generation import USERS, ProjectGeneration
+from core.services.project_stats import ProjectStatsService
+from core.services.team_stats import TeamStatsService
+from core.services.task_import import TaskImportService
 from core.services.task_service import TaskService
+from core.services.user_directory import UserDirectoryService
+from core.services.versioning import VersionConflict
 from api.v1.common.responses import ResponseMixin
-from core.services.enums import StatusEnum
-from tasks.models import TaskModel
+from api.v1.common.pagination import KeysetPaginator
+from api.v1.common.conditional import (
+    expected_version,
+    not_modified,
+    query_digest,
+    versioned_etag,
+    weak_etag,
+    with_etag,
+)
+from tasks.models import ArchivedTask, TaskModel
 from core.services.audit_service import AuditService
-from core.services.enums import AuditModule
+from core.services.enums import AuditModule, StatusEnum
 
 
 class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
     permission_classes = [ProjectPermissions]
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
     # serializer_class = ProjectsSerializer
 
     def get_serializer_class(self):  # type: ignore
@@ -42,33 +87,162 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
         elif self.action in ["create", "update", "partial_update"]:
             return ProjectWriteSerializer
 
+    # Newest projects first, paged by id instead of OFFSET
+    keyset_paginator = KeysetPaginator(ordering=("-id",))
+    # Same ordering as the task listing
+    tasks_paginator = KeysetPaginator(ordering=("-updated_at", "-id"))
+    # page_size is the number of cards per column
+    board_paginator = KeysetPaginator(
+        ordering=CARD_ORDERING, default_page_size=20, max_page_size=100
+    )
+
+    member_prefetch = ("members", "members__project_member__profile")
+
     def get_queryset(self):  # type: ignore
         user = self.request.user
 
         return (
             ProjectsModel.objects.filter(
-                Q(created_by=user) | Q(members__project_member=user)
-            )
-            .distinct()
-            .prefetch_related(
-                "members", "members__project_member__profile", "project_tasks"
+                pk__in=ProjectAccessService.project_ids_for(user)
             )
-            .select_related("created_by")
+            .prefetch_related(*self.member_prefetch)
+            .select_related("created_by", "archive")
+            # Progress comes from the ProjectStats row, joined on its primary key
             .annotate(
-                total_tasks=Count("project_tasks", distinct=True),
-                completed_tasks=Count(
-                    "project_tasks",
-                    filter=Q(project_tasks__status=StatusEnum.DONE),
-                    distinct=True,
-                ),
+                total_tasks=Coalesce("stats__total_tasks", 0),
+                completed_tasks=Coalesce("stats__done_tasks", 0),
+                overdue_tasks=ProjectStatsService.overdue_tasks(),
             )
         )
 
+    def _get_project_unprefetched(self):
+        """get_object() without the member prefetches, for conditional GETs"""
+        project = get_object_or_404(
+            self.get_queryset()
+            .prefetch_related(None)
+            .select_related("created_by__profile"),
+            pk=self.kwargs["pk"],
+        )
+        self.check_object_permissions(self.request, project)
+        return project
+
+    @staticmethod
+    def _project_etag(kind, project, *extra):
+        return weak_etag(
+            kind,
+            project.pk,
+            *ProjectGeneration.get_many(project.pk, USERS),
+            *extra,
+        )
+
+    @staticmethod
+    def _project_detail_etag(project):
+        # Carries the version, so it round-trips as If-Match. The creator's
+        # profile is in the payload, and presence flushes write its last_seen
+        # without bumping a generation, so last_seen goes in as it is
+        profile = getattr(project.created_by, "profile", None)
+        last_seen = profile.last_seen if profile else None
+        return versioned_etag(
+            "project",
+            project.pk,
+            project.version,
+            *ProjectGeneration.get_many(project.pk, USERS),
+            timezone.localdate(),
+            round(last_seen.timestamp() * 1_000_000) if last_seen else 0,
+        )
+
+    def _version_conflict(self, request, pk):
+        """409 with the project as it is now, for the client to merge and retry"""
+        current = ProjectsDetailSerializer(
+            self.get_queryset().get(pk=pk), context={"request": request}
+        )
+        return self._error(
+            "VERSION_CONFLICT",
+            "The project was changed by someone else.",
+            details={"current": current.data},
+            status_code=status.HTTP_409_CONFLICT,
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        project = self._get_project_unprefetched()
+
+        # Overdue counts change at midnight without a write
+        etag = self._project_detail_etag(project)
+        unchanged = not_modified(request, etag)
+        if unchanged:
+            return unchanged
+
+        prefetch_related_objects([project], *self.member_prefetch)
+        serializer = self.get_serializer(project)
+        return with_etag(Response(serializer.data), etag)
+
+    def _tasks_preview_size(self, request):
+        raw = request.query_params.get("tasks_preview")
+        if raw is None:
+            return TASKS_PREVIEW_DEFAULT
+        try:
+            return max(0, min(int(raw), TASKS_PREVIEW_MAX))
+        except ValueError:
+            raise ValidationError({"tasks_preview": ["A valid integer is required."]})
+
+    def _tasks_preview_prefetch(self, preview_size):
+        """Top-N newest tasks per project, ranked in SQL with ROW_NUMBER()"""
+        if preview_size == 0:
+            tasks = TaskModel.objects.none()
+        else:
+            tasks = (
+                TaskModel.objects.annotate(
+                    preview_rank=Window(
+                        RowNumber(),
+                        partition_by=F("project_id"),
+                        order_by=[F("created_at").desc(), F("id").desc()],
+                    )
+                )
+                .filter(preview_rank__lte=preview_size)
+                .only("id", "project_id", "title", "status", "priority", "due_date")
+                .order_by("-created_at", "-id")
+            )
+        return Prefetch("project_tasks", queryset=tasks, to_attr="tasks_preview")
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                "cursor",
+                OpenApiTypes.STR,
+                description="next_cursor of the previous page",
+            ),
+            OpenApiParameter(
+                "page_size", OpenApiTypes.INT, description="Projects per page (max 200)"
+            ),
+            OpenApiParameter(
+                "tasks_preview",
+                OpenApiTypes.INT,
+                description=f"Newest tasks included per project (default {TASKS_PREVIEW_DEFAULT}, max {TASKS_PREVIEW_MAX})",
+            ),
+        ]
+    )
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
+        try:
+            preview_size = self._tasks_preview_size(request)
+            projects, pagination = self.keyset_paginator.paginate(
+                self.get_queryset().prefetch_related(
+                    self._tasks_preview_prefetch(preview_size)
+                ),
+                request,
+            )
+        except ValidationError as exc:
+            return self._error(
+                "INVALID_INPUT",
+                "Invalid pagination parameters",
+                details=exc.detail,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer = self.get_serializer(projects, many=True)
         return self._success(
-            data=serializer.data, message="Projects retrieved successfully"
+            data=serializer.data,
+            message="Projects retrieved successfully",
+            pagination=pagination,
         )
 
     def create(self, request, *args, **kwargs):
@@ -104,11 +278,23 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
-        updated_project = ProjectService.update_project(
-            user=request.user,
-            project_id=project.id,
-            data=serializer.validated_data,
-        )
+        version, version_error = expected_version(request)
+        if version_error:
+            return self._error(
+                "INVALID_INPUT",
+                version_error,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            updated_project = ProjectService.update_project(
+                user=request.user,
+                project_id=project.id,
+                data=serializer.validated_data,
+                version=version,
+            )
+        except VersionConflict:
+            return self._version_conflict(request, project.pk)
 
         output_serializer = ProjectsDetailSerializer(
             updated_project, context={"request": request}
@@ -132,11 +318,23 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
-        updated_project = ProjectService.update_project(
-            user=request.user,
-            project_id=project.id,
-            data=serializer.validated_data,
-        )
+        version, version_error = expected_version(request)
+        if version_error:
+            return self._error(
+                "INVALID_INPUT",
+                version_error,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            updated_project = ProjectService.update_project(
+                user=request.user,
+                project_id=project.id,
+                data=serializer.validated_data,
+                version=version,
+            )
+        except VersionConflict:
+            return self._version_conflict(request, project.pk)
 
         output_serializer = ProjectsDetailSerializer(
             updated_project, context={"request": request}
@@ -148,17 +346,45 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
             status_code=status.HTTP_200_OK,
         )
 
+    @extend_schema(responses={202: ProjectDeletionJobSerializer})
+    def destroy(self, request, *args, **kwargs):
+        """Queue the project for background deletion; poll the returned job"""
+        project = self.get_object()
+        job, _created = ProjectDeletionService.start(
+            project=project, requested_by=request.user
+        )
+
+        return self._success(
+            data=ProjectDeletionJobSerializer(job).data,
+            message="Project deletion started",
+            status_code=status.HTTP_202_ACCEPTED,
+        )
+
     @extend_schema(
         request=TaskSerializer,
         responses={200: TaskSerializer(many=True), 201: TaskSerializer()},
         methods=["GET", "POST"],
     )
+    @extend_schema(
+        parameters=[
+            TaskFilterSerializer,
+            OpenApiParameter(
+                "cursor",
+                OpenApiTypes.STR,
+                description="next_cursor of the previous page",
+            ),
+            OpenApiParameter(
+                "page_size", OpenApiTypes.INT, description="Tasks per page (max 200)"
+            ),
+        ],
+        methods=["GET"],
+    )
     @action(detail=True, methods=["post", "get"], url_path="tasks")
     def tasks(self, request, pk=None):
         """Handle tasks for a project"""
 
         # get project id from the url parameter
-        project = self.get_object()
+        project = self._get_project_unprefetched()
 
         if request.method == "POST":
             # Create a new task
@@ -172,9 +398,18 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
                     status_code=status.HTTP_400_BAD_REQUEST,
                 )
 
-            task = TaskService.create_task(
-                user=request.user, project_id=project.id, data=serializer.validated_data
-            )
+            try:
+                task = TaskService.create_task(
+                    user=request.user,
+                    project_id=project.id,
+                    data=serializer.validated_data,
+                )
+            except ValueError as exc:
+                return self._error(
+                    "INVALID_INPUT",
+                    str(exc),
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
 
             # Return serializer response
             output_serializer = TaskSerializer(task)
@@ -185,21 +420,166 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
             )
 
         else:  # GET request
-            # List all tasks for this project
-            tasks = (
-                TaskModel.objects.filter(project=project)
-                .select_related("created_by", "assigned_to", "project")
-                .prefetch_related(
-                    "comments", "comments__author", "history", "history__changed_by"
-                )
+            # Each filter/page combination is its own representation
+            etag = self._project_etag("project-tasks", project, query_digest(request))
+            unchanged = not_modified(request, etag)
+            if unchanged:
+                return unchanged
+
+            # List tasks for this project, from the archive once it is archived
+            if ProjectArchiveService.is_archived(project.pk):
+                tasks = ArchivedTask.objects.filter(project=project)
+            else:
+                tasks = TaskModel.objects.filter(project=project)
+            tasks = tasks.select_related(
+                "created_by", "assigned_to", "project"
+            ).prefetch_related(
+                "comments", "comments__author", "history", "history__changed_by"
             )
 
+            try:
+                filters = TaskFilterSerializer(data=request.query_params)
+                filters.is_valid(raise_exception=True)
+                tasks, pagination = self.tasks_paginator.paginate(
+                    filters.filter_queryset(tasks), request
+                )
+            except ValidationError as exc:
+                return self._error(
+                    "INVALID_INPUT",
+                    "Invalid filter or pagination parameters",
+                    details=exc.detail,
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
+
             serializer = TaskSerializer(tasks, many=True)
 
-            return self._success(
-                data=serializer.data, message="Tasks retrieved successfully"
+            return with_etag(
+                self._success(
+                    data=serializer.data,
+                    message="Tasks retrieved successfully",
+                    pagination=pagination,
+                ),
+                etag,
             )
 
+    @extend_schema(
+        request={"multipart/form-data": TaskImportSerializer},
+        responses={201: OpenApiTypes.OBJECT, 200: OpenApiTypes.OBJECT},
+    )
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="tasks/import",
+        parser_classes=[MultiPartParser],
+    )
+    def import_tasks(self, request, pk=None):
+        """Import tasks from an uploaded CSV or NDJSON file"""
+        project = self._get_project_unprefetched()
+
+        serializer = TaskImportSerializer(data=request.data)
+        if not serializer.is_valid():
+            return self._error(
+                "INVALID_INPUT",
+                "Invalid import request",
+                details=serializer.errors,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+        upload = serializer.validated_data["file"]
+
+        report = TaskImportService.import_rows(
+            project=project,
+            user=request.user,
+            rows=TaskImportService.read_rows(
+                upload, serializer.validated_data["format"]
+            ),
+            serializer_class=TaskImportRowSerializer,
+            batch_size=serializer.validated_data.get("batch_size"),
+        )
+
+        return self._success(
+            data=report,
+            message=f"Imported {report['created']} tasks",
+            status_code=(
+                status.HTTP_201_CREATED if report["created"] else status.HTTP_200_OK
+            ),
+        )
+
+    @extend_schema(
+        parameters=[
+            TaskFilterSerializer,
+            OpenApiParameter(
+                "cursor",
+                OpenApiTypes.STR,
+                description="A column's next_cursor; requires status",
+            ),
+            OpenApiParameter(
+                "page_size",
+                OpenApiTypes.INT,
+                description="Cards per column (default 20, max 100)",
+            ),
+        ],
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    @action(detail=True, methods=["get"], url_path="board")
+    def board(self, request, pk=None):
+        """
+        Kanban board: every status column with its card count and first cards.
+        With `status`, the next page of that column only.
+        """
+        project = self._get_project_unprefetched()
+
+        etag = self._project_etag("project-board", project, query_digest(request))
+        unchanged = not_modified(request, etag)
+        if unchanged:
+            return unchanged
+
+        if ProjectArchiveService.is_archived(project.pk):
+            tasks = ArchivedTask.objects.filter(project=project)
+        else:
+            tasks = TaskModel.objects.filter(project=project)
+
+        try:
+            filters = TaskFilterSerializer(data=request.query_params)
+            filters.is_valid(raise_exception=True)
+            tasks = filters.filter_queryset(tasks)
+
+            if "status" in filters.validated_data:
+                rows, pagination = self.board_paginator.paginate(
+                    BoardService.cards(tasks), request
+                )
+                return with_etag(
+                    self._success(
+                        data=BoardCardSerializer(rows, many=True).data,
+                        pagination=pagination,
+                    ),
+                    etag,
+                )
+            if request.query_params.get("cursor"):
+                raise ValidationError({"cursor": ["A column cursor requires status."]})
+            per_column = self.board_paginator.get_page_size(request)
+        except ValidationError as exc:
+            return self._error(
+                "INVALID_INPUT",
+                "Invalid filter or pagination parameters",
+                details=exc.detail,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        columns = []
+        for column, total, rows in BoardService.columns(tasks, per_column):
+            has_next = total > len(rows)
+            columns.append(
+                {
+                    "status": column,
+                    "total": total,
+                    "cards": BoardCardSerializer(rows, many=True).data,
+                    "next_cursor": (
+                        self.board_paginator.cursor_for(rows[-1]) if has_next else None
+                    ),
+                }
+            )
+        return with_etag(self._success(data={"columns": columns}), etag)
+
     # TODO: Re-evaluate on whether to add or invite a member
 
     # @action(detail=True, methods=["post"], url_path="members")
@@ -244,7 +624,9 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
         Required permissions: Admin or Project Manager
         """
         project = self.get_object()
-        serializer = InviteTeamMemberSerializer(data=request.data)
+        serializer = InviteTeamMemberSerializer(
+            data=request.data, context={"project": project}
+        )
 
         if not serializer.is_valid():
             return self._error(
@@ -254,17 +636,8 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Find the user by email or username
-        user_to_invite = None
-        if serializer.validated_data.get("email"):
-            user_to_invite = User.objects.filter(
-                email=serializer.validated_data["email"]
-            ).first()
-        elif serializer.validated_data.get("username"):
-            user_to_invite = User.objects.filter(
-                username=serializer.validated_data["username"]
-            ).first()
-
+        # Resolved by the serializer, membership included, in one query
+        user_to_invite = serializer.validated_data.get("user")
         if not user_to_invite:
             return self._error(
                 "USER_NOT_FOUND",
@@ -272,10 +645,7 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
                 status_code=status.HTTP_404_NOT_FOUND,
             )
 
-        # Check if user is already a member
-        if ProjectMembers.objects.filter(
-            project=project, project_member=user_to_invite
-        ).exists():
+        if user_to_invite.is_member:
             return self._error(
                 "ALREADY_MEMBER",
                 f"{user_to_invite.username} is already a member of this project",
@@ -283,10 +653,10 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
             )
 
             # Create the project membership
-        membership = ProjectMembers.objects.create(
+        membership = ProjectService.add_member(
             project=project,
-            project_member=user_to_invite,
-            role_in_project=serializer.validated_data["role"],
+            user=user_to_invite,
+            role=serializer.validated_data["role"],
         )
 
         AuditService.updated(
@@ -321,6 +691,29 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
             status_code=status.HTTP_201_CREATED,
         )
 
+    @staticmethod
+    def _team_members_queryset(project):
+        """
+        Members with their assigned/open task counts in this project, counted in
+        the same grouped query that loads the user and profile (avatar, last_seen)
+        """
+        project_tasks = FilteredRelation(
+            "project_member__assigned_tasks",
+            condition=Q(project_member__assigned_tasks__project_id=project.pk),
+        )
+        return (
+            ProjectMembers.objects.filter(project=project)
+            .select_related("project_member", "project_member__profile")
+            .annotate(
+                member_tasks=project_tasks,
+                task_count=Count("member_tasks"),
+                open_task_count=Count(
+                    "member_tasks", filter=~Q(member_tasks__status=StatusEnum.DONE)
+                ),
+            )
+            .order_by("pk")
+        )
+
     @extend_schema(
         responses={
             200: ProjectMemberDetailSerializer(many=True),
@@ -338,7 +731,9 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
                 name="search",
                 type=OpenApiTypes.STR,
                 location=OpenApiParameter.QUERY,
-                description="Search by username, first name, last name, or email",
+                description=(
+                    "Prefix search on username, first name, last name or email"
+                ),
                 required=False,
             ),
         ],
@@ -348,11 +743,7 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
     def list_team_members(self, request, pk=None):
         project = self.get_object()
 
-        members = (
-            ProjectMembers.objects.filter(project=project)
-            .select_related("project_member", "project_member__profile")
-            .prefetch_related("project_member__assigned_tasks")
-        )
+        members = self._team_members_queryset(project)
 
         role_filter = request.query_params.get("role")
         if role_filter:
@@ -361,10 +752,9 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
         search_query = request.query_params.get("search")
         if search_query:
             members = members.filter(
-                Q(project_member__username__icontains=search_query)
-                | Q(project_member__first_name__icontains=search_query)
-                | Q(project_member__last_name__icontains=search_query)
-                | Q(project_member__email__icontains=search_query)
+                UserDirectoryService.prefix_match(
+                    search_query, prefix="project_member__"
+                )
             )
 
         serializer = ProjectMemberDetailSerializer(
@@ -410,10 +800,10 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
-        membership = ProjectMembers.objects.create(
+        membership = ProjectService.add_member(
             project=project,
-            project_member=user_to_add,
-            role_in_project=input_serializer.validated_data["role"],
+            user=user_to_add,
+            role=input_serializer.validated_data["role"],
         )
 
         AuditService.updated(
@@ -445,38 +835,67 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
         )
 
     @extend_schema(
+        request=BulkAddTeamMembersSerializer,
         responses={
-            200: TeamStatsSerializer,
+            201: OpenApiResponse(description="Members added"),
+            200: OpenApiResponse(description="Nothing to add"),
+            400: OpenApiResponse(description="Bad Request - Invalid input"),
+            403: OpenApiResponse(description="Forbidden - Insufficient permissions"),
         },
-        description="Get statistics about the project team",
+        description=(
+            "Add many users to the project in one request. Users already in the "
+            "team are skipped and unknown user ids/emails are reported back."
+        ),
     )
-    @action(detail=True, methods=["get"], url_path="team/stats")
-    def team_stats(self, request, pk=None):
-        """Get statistics about the project team"""
+    @action(detail=True, methods=["post"], url_path="team/members/bulk")
+    def bulk_add_team_members(self, request, pk=None):
         project = self.get_object()
 
-        members = ProjectMembers.objects.filter(project=project).select_related(
-            "project_member", "project_member__profile"
+        input_serializer = BulkAddTeamMembersSerializer(data=request.data)
+        if not input_serializer.is_valid():
+            return self._error(
+                "INVALID_INPUT",
+                "Invalid input data",
+                details=input_serializer.errors,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        result = ProjectService.bulk_add_members(
+            project=project,
+            actor=request.user,
+            entries=input_serializer.validated_data["members"],
         )
 
-        # Calculate statistics
-        from django.utils import timezone
-        from datetime import timedelta
+        added = self._team_members_queryset(project).filter(
+            pk__in=[membership.pk for membership in result["added"]]
+        )
+        data = {
+            "added": ProjectMemberDetailSerializer(
+                added, many=True, context={"request": request}
+            ).data,
+            "already_members": result["existing"],
+            "not_found": result["not_found"],
+        }
 
-        online_threshold = timezone.now() - timedelta(minutes=5)
+        return self._success(
+            data=data,
+            message=f"{len(result['added'])} members added to the project team",
+            status_code=(
+                status.HTTP_201_CREATED if result["added"] else status.HTTP_200_OK
+            ),
+        )
 
-        stats = {
-            "total_members": members.count(),
-            "online_members": members.filter(
-                project_member__profile__last_seen__gte=online_threshold
-            ).count(),
-            "admins": members.filter(role_in_project="Admin").count(),
-            "project_managers": members.filter(
-                role_in_project="Project Manager"
-            ).count(),
-            "developers": members.filter(role_in_project="Developer").count(),
-            "guests": members.filter(role_in_project="Guest").count(),
-        }
+    @extend_schema(
+        responses={
+            200: TeamStatsSerializer,
+        },
+        description="Get statistics about the project team",
+    )
+    @action(detail=True, methods=["get"], url_path="team/stats")
+    def team_stats(self, request, pk=None):
+        """Get statistics about the project team"""
+        project = self.get_object()
+        stats = TeamStatsService.for_project(project)
 
         return self._success(
             data=stats, message="Team statistics retrieved successfully"
@@ -536,8 +955,9 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
 
         # Update the role
         old_role = membership.role_in_project
-        membership.role_in_project = serializer.validated_data["role"]
-        membership.save()
+        ProjectService.update_member_role(
+            membership=membership, role=serializer.validated_data["role"]
+        )
 
         output_serializer = ProjectMemberDetailSerializer(
             membership, context={"request": request}
@@ -594,8 +1014,9 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
             )
 
         old_role = membership.role_in_project
-        membership.role_in_project = serializer.validated_data["role"]
-        membership.save()
+        ProjectService.update_member_role(
+            membership=membership, role=serializer.validated_data["role"]
+        )
 
         output_serializer = ProjectMemberDetailSerializer(
             membership, context={"request": request}
@@ -652,7 +1073,7 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
             )
 
         username = membership.project_member.username
-        membership.delete()
+        ProjectService.remove_member(membership=membership)
 
         return self._success(
             message=f"{username} has been removed from the project team",
@@ -689,7 +1110,7 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
             membership = ProjectMembers.objects.get(
                 project=project, project_member=request.user
             )
-            membership.delete()
+            ProjectService.remove_member(membership=membership)
 
             return self._success(
                 message=f"You have successfully left {project.project_name}"
@@ -702,6 +1123,32 @@ class ProjectsViewSet(ResponseMixin, viewsets.ModelViewSet):
             )
 
 
+class ProjectDeletionJobView(ResponseMixin, APIView):
+    """
+    GET /projects/deletion-jobs/<pk>/
+    Progress of a background project deletion, for admins and the requester
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(responses=ProjectDeletionJobSerializer)
+    def get(self, request, pk):
+        job = ProjectDeletionJob.objects.filter(pk=pk).first()
+        can_view = job is not None and (
+            job.requested_by_id == request.user.pk
+            or PermissionContext.for_request(request).is_admin
+        )
+        if not can_view:
+            return self._error(
+                "NOT_FOUND",
+                "Deletion job not found.",
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+
+        return self._success(data=ProjectDeletionJobSerializer(job).data)
+
+
 # class UserViewSet(viewsets.ModelViewSet):
 #     queryset = User.objects.all()
 #     serializer_class = ExtendedUserSerializer
@@ -0,0 +1,81 @@
+from rest_framework import serializers
+
+from projects.models import ProjectsModel
+from tasks.models import CommentModel, TaskModel
+from core.services.search import KINDS
+from ..tasks.serializers import ProjectInfoSerializer
+
+SEARCH_LIMIT_MAX = 50
+
+
+class SearchParamsSerializer(serializers.Serializer):
+    """Query parameters of the search endpoint"""
+
+    q = serializers.CharField(max_length=200)
+    types = serializers.CharField(
+        required=False, help_text=f"Comma-separated subset of {', '.join(KINDS)}"
+    )
+    project = serializers.IntegerField(min_value=1, required=False)
+    limit = serializers.IntegerField(
+        min_value=1, max_value=SEARCH_LIMIT_MAX, default=10
+    )
+
+    def validate_types(self, value):
+        kinds = {kind.strip() for kind in value.split(",") if kind.strip()}
+        unknown = kinds - set(KINDS)
+        if unknown or not kinds:
+            raise serializers.ValidationError(
+                f"Choose from {', '.join(KINDS)}; got {', '.join(sorted(unknown))}."
+            )
+        return kinds
+
+
+class SearchTaskSerializer(serializers.ModelSerializer):
+    project = ProjectInfoSerializer(read_only=True)
+    rank = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = TaskModel
+        fields = [
+            "id",
+            "title",
+            "status",
+            "priority",
+            "due_date",
+            "project",
+            "rank",
+        ]
+
+
+class SearchCommentSerializer(serializers.ModelSerializer):
+    task_title = serializers.CharField(source="task.title", read_only=True)
+    project_id = serializers.IntegerField(source="task.project_id", read_only=True)
+    author = serializers.CharField(source="author.username", default=None)
+    rank = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = CommentModel
+        fields = [
+            "id",
+            "content",
+            "task_id",
+            "task_title",
+            "project_id",
+            "author",
+            "created_at",
+            "rank",
+        ]
+
+
+class SearchProjectSerializer(serializers.ModelSerializer):
+    rank = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = ProjectsModel
+        fields = ["id", "project_name", "description", "status", "rank"]
+
+
+class SearchResultsSerializer(serializers.Serializer):
+    tasks = SearchTaskSerializer(many=True, required=False)
+    comments = SearchCommentSerializer(many=True, required=False)
+    projects = SearchProjectSerializer(many=True, required=False)
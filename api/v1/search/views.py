@@ -0,0 +1,59 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+
+from api.v1.common.responses import ResponseMixin
+from core.services.authentication import ClaimsJWTAuthentication
+from core.services.search import KINDS, SearchService
+from .serializers import (
+    SearchCommentSerializer,
+    SearchParamsSerializer,
+    SearchProjectSerializer,
+    SearchResultsSerializer,
+    SearchTaskSerializer,
+)
+
+RESULT_SERIALIZERS = {
+    "tasks": SearchTaskSerializer,
+    "comments": SearchCommentSerializer,
+    "projects": SearchProjectSerializer,
+}
+
+
+class SearchView(ResponseMixin, APIView):
+    """
+    GET /search/?q=<words>
+    Ranked full-text matches among the tasks, comments and projects the user
+    can see. Each word matches as a prefix.
+    """
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        parameters=[SearchParamsSerializer], responses=SearchResultsSerializer
+    )
+    def get(self, request):
+        params = SearchParamsSerializer(data=request.query_params)
+        if not params.is_valid():
+            return self._error(
+                "INVALID_INPUT",
+                "Invalid search parameters.",
+                details=params.errors,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        results = SearchService.search(
+            user=request.user,
+            text=params.validated_data["q"],
+            kinds=params.validated_data.get("types", KINDS),
+            project_id=params.validated_data.get("project"),
+            limit=params.validated_data["limit"],
+        )
+        return self._success(
+            data={
+                kind: RESULT_SERIALIZERS[kind](rows, many=True).data
+                for kind, rows in results.items()
+            }
+        )
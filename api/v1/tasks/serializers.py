@@ -1,9 +1,14 @@
+from django.contrib.auth.models import User
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
 
 from tasks.models import TaskModel, CommentModel, TaskHistoryModel
 from projects.models import ProjectsModel
+from core.services.enums import PriorityEnum, StatusEnum
+from core.services.task_import import FORMATS as TASK_IMPORT_FORMATS
+from core.services.task_import import TaskImportService
+from core.services.task_tree import MAX_DEPTH, TaskTreeService
 from ..accounts.serializers import UserSerializer
 
 
@@ -54,6 +59,7 @@ class CommentSerializer(serializers.ModelSerializer):
 # Write serializer for creating and updating tasks
 class TaskWriteSerializer(serializers.ModelSerializer):
     # project = serializers.PrimaryKeyRelatedField(read_only=True)
+    # Read-only: a task never changes project, see TaskService._write_changes
     project = ProjectInfoSerializer(read_only=True)
     assigned_to = serializers.PrimaryKeyRelatedField(read_only=True)
 
@@ -67,8 +73,17 @@ class TaskWriteSerializer(serializers.ModelSerializer):
             "priority",
             "due_date",
             "project",
+            "parent",
+            "estimate_hours",
         ]
 
+    def validate_parent(self, value):
+        if self.instance is not None and value != self.instance.parent:
+            raise serializers.ValidationError(
+                "Use the move endpoint to change a task's parent."
+            )
+        return value
+
 
 class TaskListSerializer(serializers.ModelSerializer):
     # created_by = serializers.PrimaryKeyRelatedField(read_only=True)
@@ -87,14 +102,51 @@ class TaskListSerializer(serializers.ModelSerializer):
             # "created_by",
             # "assigned_to",
             "project",
+            "version",
+        ]
+
+
+class CardAssigneeSerializer(serializers.ModelSerializer):
+    avatar = serializers.ImageField(source="profile.avatar", read_only=True)
+
+    class Meta:
+        model = User
+        fields = ["id", "username", "avatar"]
+
+
+class BoardCardSerializer(serializers.ModelSerializer):
+    """A task as drawn on the board; no comments or history"""
+
+    assigned_to = CardAssigneeSerializer(read_only=True)
+
+    class Meta:
+        model = TaskModel
+        fields = [
+            "id",
+            "title",
+            "status",
+            "priority",
+            "due_date",
+            "assigned_to",
+            "version",
         ]
 
 
+class TaskRollupSerializer(serializers.Serializer):
+    """Progress of a task's subtree, the task included"""
+
+    tasks = serializers.IntegerField()
+    done = serializers.IntegerField()
+    estimate_hours = serializers.DecimalField(max_digits=9, decimal_places=2)
+    progress_pct = serializers.IntegerField()
+
+
 class TaskDetailSerializer(serializers.ModelSerializer):
     created_by = AssignedUserSerializer(read_only=True)
     assigned_to = AssignedUserSerializer(read_only=True)
     # comments = CommentSerializer(many=True, read_only=True)
     project = ProjectInfoSerializer(read_only=True)
+    rollup = serializers.SerializerMethodField()
 
     class Meta:
         model = TaskModel
@@ -109,8 +161,98 @@ class TaskDetailSerializer(serializers.ModelSerializer):
             "project",
             # "comments",
             "created_by",
+            "version",
+            "parent",
+            "estimate_hours",
+            "rollup",
+        ]
+
+    @extend_schema_field(TaskRollupSerializer)
+    def get_rollup(self, obj):
+        return TaskRollupSerializer(TaskTreeService.rollup(obj)).data
+
+
+class TaskTreeNodeSerializer(serializers.ModelSerializer):
+    """A task of a subtree with its children, nested"""
+
+    assigned_to = CardAssigneeSerializer(read_only=True)
+    rollup = serializers.SerializerMethodField()
+    children = serializers.SerializerMethodField()
+
+    class Meta:
+        model = TaskModel
+        fields = [
+            "id",
+            "title",
+            "status",
+            "priority",
+            "due_date",
+            "assigned_to",
+            "estimate_hours",
+            "parent",
+            "version",
+            "rollup",
+            "children",
         ]
 
+    @extend_schema_field(TaskRollupSerializer)
+    def get_rollup(self, obj):
+        return TaskRollupSerializer(TaskTreeService.rollup(obj)).data
+
+    @extend_schema_field(OpenApiTypes.OBJECT)
+    def get_children(self, obj):
+        return TaskTreeNodeSerializer(
+            getattr(obj, "children", []), many=True, context=self.context
+        ).data
+
+
+class TaskTreeQuerySerializer(serializers.Serializer):
+    depth = serializers.IntegerField(min_value=0, max_value=MAX_DEPTH, required=False)
+
+
+class TaskMoveSerializer(serializers.Serializer):
+    """The new parent; null moves the task to the top level"""
+
+    parent = serializers.PrimaryKeyRelatedField(
+        queryset=TaskModel.objects.all(), allow_null=True
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Limited to the tasks the requester can see
+        if "tasks" in self.context:
+            self.fields["parent"].queryset = self.context["tasks"]
+
+
+TASK_ASSIGNEES_MAX = 20
+
+
+class TaskAssigneesSerializer(serializers.Serializer):
+    """The task's assignees, primary first; an empty list unassigns it"""
+
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=True,
+        max_length=TASK_ASSIGNEES_MAX,
+    )
+
+    def validate_user_ids(self, value):
+        user_ids = list(dict.fromkeys(value))
+        users = User.objects.in_bulk(user_ids)
+        unknown = [user_id for user_id in user_ids if user_id not in users]
+        if unknown:
+            raise serializers.ValidationError(
+                f"Unknown users: {', '.join(map(str, unknown))}."
+            )
+        return [users[user_id] for user_id in user_ids]
+
+
+class TaskAssigneeListSerializer(serializers.Serializer):
+    """A task's primary assignee id and all its assignees, primary first"""
+
+    assigned_to = serializers.IntegerField(allow_null=True)
+    assignees = CardAssigneeSerializer(many=True)
+
 
 class TaskHistorySerializer(serializers.ModelSerializer):
     changed_by = AssignedUserSerializer(read_only=True)
@@ -138,6 +280,99 @@ class TaskSerializer(serializers.ModelSerializer):
         ]
 
 
+class TaskFilterSerializer(serializers.Serializer):
+    """Query parameters accepted by the task listings"""
+
+    status = serializers.ChoiceField(choices=StatusEnum.choices, required=False)
+    priority = serializers.ChoiceField(choices=PriorityEnum.choices, required=False)
+    assigned_to = serializers.IntegerField(min_value=1, required=False)
+    project = serializers.IntegerField(min_value=1, required=False)
+    due_after = serializers.DateField(required=False)
+    due_before = serializers.DateField(required=False)
+
+    lookups = {
+        "status": "status",
+        "priority": "priority",
+        "assigned_to": "assigned_to_id",
+        "project": "project_id",
+        "due_after": "due_date__gte",
+        "due_before": "due_date__lte",
+    }
+
+    def validate(self, attrs):
+        due_after, due_before = attrs.get("due_after"), attrs.get("due_before")
+        if due_after and due_before and due_after > due_before:
+            raise serializers.ValidationError(
+                {"due_before": "Must not be earlier than due_after."}
+            )
+        return attrs
+
+    def filter_queryset(self, queryset):
+        return queryset.filter(
+            **{self.lookups[name]: value for name, value in self.validated_data.items()}
+        )
+
+
+class TaskImportRowSerializer(TaskWriteSerializer):
+    """One imported row; the assignee is a user id, checked per batch"""
+
+    assigned_to = serializers.IntegerField(min_value=1, allow_null=True, required=False)
+
+    class Meta(TaskWriteSerializer.Meta):
+        fields = [
+            "title",
+            "description",
+            "assigned_to",
+            "status",
+            "priority",
+            "due_date",
+        ]
+
+
+class TaskImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    format = serializers.ChoiceField(
+        choices=TASK_IMPORT_FORMATS,
+        required=False,
+        help_text="Defaults to the file extension",
+    )
+    batch_size = serializers.IntegerField(min_value=1, max_value=5000, required=False)
+
+    def validate(self, attrs):
+        attrs.setdefault("format", TaskImportService.detect_format(attrs["file"].name))
+        if attrs["format"] not in TASK_IMPORT_FORMATS:
+            raise serializers.ValidationError(
+                {"format": f"Use one of: {', '.join(TASK_IMPORT_FORMATS)}."}
+            )
+        return attrs
+
+
+BULK_TASKS_MAX = 500
+
+
+class BulkTaskUpdateSerializer(serializers.Serializer):
+    """The same status, priority, assignee or due date for many tasks"""
+
+    task_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=BULK_TASKS_MAX,
+    )
+    status = serializers.ChoiceField(choices=StatusEnum.choices, required=False)
+    priority = serializers.ChoiceField(choices=PriorityEnum.choices, required=False)
+    assigned_to = serializers.PrimaryKeyRelatedField(
+        queryset=User.objects.all(), allow_null=True, required=False
+    )
+    due_date = serializers.DateField(allow_null=True, required=False)
+
+    def validate(self, attrs):
+        if len(attrs) == 1:
+            raise serializers.ValidationError(
+                "Provide at least one of status, priority, assigned_to or due_date."
+            )
+        return attrs
+
+
 #! Keep at bottom to avoid circular imports
 class ExtendedUserSerializer(UserSerializer):
     user_assigned_tasks = TaskSerializer(
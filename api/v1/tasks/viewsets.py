@@ -1,24 +1,46 @@
+from django.contrib.auth.models import User
 from rest_framework import viewsets, status
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from core.services.authentication import ClaimsJWTAuthentication
 from rest_framework.response import Response
-from django.db.models import Q
+from django.http import Http404
+from rest_framework.generics import get_object_or_404
 from rest_framework.decorators import action
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
 from .serializers import (
+    BulkTaskUpdateSerializer,
     TaskHistorySerializer,
     CommentSerializer,
     CommentWriteSerializer,
     TaskDetailSerializer,
+    TaskAssigneeListSerializer,
+    TaskAssigneesSerializer,
+    TaskFilterSerializer,
     TaskListSerializer,
+    TaskMoveSerializer,
+    TaskTreeNodeSerializer,
+    TaskTreeQuerySerializer,
     TaskWriteSerializer,
 )
-from tasks.models import TaskModel, CommentModel, TaskHistoryModel
+from tasks.models import ArchivedTask, TaskModel, CommentModel, TaskHistoryModel
 from core.services.permissions import TaskPermissions
 from core.services.task_service import TaskService, CommentService
+from core.services.task_tree import TaskTreeService
+from core.services.versioning import VersionConflict
+from core.services.project_access import ProjectAccessService
+from core.services.project_archive import ProjectArchiveService
+from core.services.project_generation import USERS, ProjectGeneration
 from core.services.audit_service import AuditService
 from core.services.enums import AuditModule
+from api.v1.common.conditional import (
+    expected_version,
+    not_modified,
+    versioned_etag,
+    weak_etag,
+    with_etag,
+)
+from api.v1.common.pagination import KeysetPaginator
 
 
 class CommentViewSet(viewsets.ModelViewSet):
@@ -37,7 +59,7 @@ class CommentViewSet(viewsets.ModelViewSet):
 )
 class TaskViewSet(viewsets.ModelViewSet):
     permission_classes = [TaskPermissions]
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [ClaimsJWTAuthentication]
 
     def get_serializer_class(self):  # type: ignore
         """Return appropriate serializer based on action"""
@@ -49,16 +71,12 @@ class TaskViewSet(viewsets.ModelViewSet):
             return TaskDetailSerializer
         return TaskDetailSerializer
 
-    def get_queryset(self):  # type: ignore
-        user = self.request.user
+    def _visibility_filter(self):
+        return ProjectAccessService.task_visibility(self.request.user)
 
+    def get_queryset(self):  # type: ignore
         # Always scope task visibility in non-admin endpoints.
-        queryset = TaskModel.objects.filter(
-            Q(created_by=user)
-            | Q(assigned_to=user)
-            | Q(project__created_by=user)
-            | Q(project__members__project_member=user)
-        ).distinct()
+        queryset = TaskModel.objects.filter(self._visibility_filter())
 
         # Optimize based on action
         if self.action == "list":
@@ -69,7 +87,8 @@ class TaskViewSet(viewsets.ModelViewSet):
             ).prefetch_related(
                 "comments", "comments__author", "comments__author__profile"
             )
-        elif self.action == "assign":
+        elif self.action in ["update", "partial_update", "assign", "move"]:
+            # Everything TaskDetailSerializer renders after the write
             return queryset.select_related(
                 "created_by",
                 "created_by__profile",
@@ -84,6 +103,33 @@ class TaskViewSet(viewsets.ModelViewSet):
         else:
             return queryset.select_related("project")
 
+    # Most recently updated first; new and edited tasks land before the cursor,
+    # so they never shift the pages that follow it
+    keyset_paginator = KeysetPaginator(ordering=("-updated_at", "-id"))
+
+    @extend_schema(
+        parameters=[
+            TaskFilterSerializer,
+            OpenApiParameter(
+                "cursor",
+                OpenApiTypes.STR,
+                description="next_cursor of the previous page",
+            ),
+            OpenApiParameter(
+                "page_size", OpenApiTypes.INT, description="Tasks per page (max 200)"
+            ),
+        ]
+    )
+    def list(self, request, *args, **kwargs):
+        filters = TaskFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+
+        tasks, pagination = self.keyset_paginator.paginate(
+            filters.filter_queryset(self.get_queryset()), request
+        )
+        serializer = self.get_serializer(tasks, many=True)
+        return Response({"results": serializer.data, "pagination": pagination})
+
     # TODO: Figure out how to add project in the API structure
     def create(self, request, *args, **kwargs):
         """Create a new task using the task service"""
@@ -99,24 +145,70 @@ class TaskViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        if ProjectArchiveService.is_archived(project_id):
+            return Response(
+                {"error": "Archived projects are read-only"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
         # create task model using the service
-        task = TaskService.create_task(
-            user=request.user, project_id=project_id, data=serializer.validated_data
-        )
+        try:
+            task = TaskService.create_task(
+                user=request.user,
+                project_id=project_id,
+                data=serializer.validated_data,
+            )
+        except ValueError as exc:
+            return Response({"parent": [str(exc)]}, status=status.HTTP_400_BAD_REQUEST)
 
         # Return with detail serializer to show full created task
         output_serializer = TaskDetailSerializer(task)
         return Response(output_serializer.data, status=status.HTTP_201_CREATED)
 
     # TODO: Implement PUT /api/v1/project/{project_id}/tasks/{task_id} — update a task (e.g., change description, due date)
-    # TODO: GET /api/v1/projects/{project_id}/tasks?status=OPEN&assigned_to=12 - filtering
 
     def retrieve(self, request, *args, **kwargs):
         """Get task details with comments"""
-        instance = self.get_object()
+        try:
+            instance = self.get_object()
+        except Http404:
+            # Tasks of archived projects stay readable
+            instance = self._get_archived_task()
+
+        # Comments and assignees change the project's generation too; the
+        # version lets the ETag round-trip as If-Match
+        etag = versioned_etag(
+            "task",
+            instance.pk,
+            instance.version,
+            *ProjectGeneration.get_many(instance.project_id, USERS),
+        )
+        unchanged = not_modified(request, etag)
+        if unchanged:
+            return unchanged
+
         serializer = self.get_serializer(instance)
+        return with_etag(Response(serializer.data), etag)
 
-        return Response(serializer.data)
+    def _get_archived_task(self):
+        queryset = ArchivedTask.objects.filter(
+            ProjectAccessService.archived_task_visibility(self.request.user)
+        ).select_related(
+            "created_by", "created_by__profile", "assigned_to__profile", "project"
+        )
+        instance = get_object_or_404(queryset, pk=self.kwargs["pk"])
+        self.check_object_permissions(self.request, instance)
+        return instance
+
+    def _version_conflict(self, task):
+        """409 with the task as it is now, for the client to merge and retry"""
+        return Response(
+            {
+                "error": "The task was changed by someone else.",
+                "current": TaskDetailSerializer(task).data,
+            },
+            status=status.HTTP_409_CONFLICT,
+        )
 
     def update(self, request, *args, **kwargs):
         """Update a task with audit logging."""
@@ -125,12 +217,19 @@ class TaskViewSet(viewsets.ModelViewSet):
 
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
+        version, error = expected_version(request)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
 
-        updated_task = TaskService.update_task(
-            user=request.user,
-            task_id=instance.id,
-            data=serializer.validated_data,
-        )
+        try:
+            updated_task = TaskService.update_task(
+                user=request.user,
+                task=instance,
+                data=serializer.validated_data,
+                version=version,
+            )
+        except VersionConflict as conflict:
+            return self._version_conflict(conflict.instance)
 
         output_serializer = TaskDetailSerializer(updated_task)
         return Response(output_serializer.data)
@@ -158,24 +257,147 @@ class TaskViewSet(viewsets.ModelViewSet):
             },
         )
 
-        task.delete()
+        TaskService.delete_task(task=task)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @extend_schema(request=BulkTaskUpdateSerializer, responses=OpenApiTypes.OBJECT)
+    @action(detail=False, methods=["patch"], url_path="bulk")
+    def bulk_update(self, request):
+        """Apply one status, priority, assignee or due date change to many tasks"""
+        serializer = BulkTaskUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = dict(serializer.validated_data)
+        task_ids = set(data.pop("task_ids"))
+
+        # Tasks the user cannot see are reported as not found
+        updated, unchanged_ids = TaskService.bulk_update(
+            user=request.user,
+            tasks=self.get_queryset().filter(pk__in=task_ids),
+            data=data,
+        )
+
+        updated_ids = [task.pk for task in updated]
+        found = {*updated_ids, *unchanged_ids}
+        return Response(
+            {
+                "updated": updated_ids,
+                "unchanged": unchanged_ids,
+                "not_found": sorted(task_ids - found),
+            }
+        )
+
     @action(detail=True, methods=["patch"])
     def assign(self, request, pk=None):
         """Assign a task to a user"""
         task = self.get_object()
         assigned_to_id = request.data.get("assigned_to")
+        version, error = expected_version(request)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
 
-        update_task = TaskService.assign_task(
-            task_id=task.id,
-            altered_by=request.user,
-            assigned_to_id=assigned_to_id,
-        )
+        try:
+            task = TaskService.assign_task(
+                task=task,
+                altered_by=request.user,
+                assigned_to_id=assigned_to_id,
+                version=version,
+            )
+        except VersionConflict as conflict:
+            return self._version_conflict(conflict.instance)
 
-        serializer = self.get_serializer(update_task)
+        serializer = self.get_serializer(task)
         return Response(serializer.data)
 
+    @extend_schema(
+        parameters=[TaskTreeQuerySerializer], responses=TaskTreeNodeSerializer
+    )
+    @action(detail=True, methods=["get"], url_path="tree")
+    def tree(self, request, pk=None):
+        """The task with its subtasks nested, loaded in one query"""
+        task = self.get_object()
+        query = TaskTreeQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        etag = weak_etag(
+            "task-tree",
+            task.pk,
+            query.validated_data.get("depth"),
+            *ProjectGeneration.get_many(task.project_id, USERS),
+        )
+        unchanged = not_modified(request, etag)
+        if unchanged:
+            return unchanged
+
+        TaskTreeService.subtree(
+            task,
+            depth=query.validated_data.get("depth"),
+            queryset=TaskModel.objects.filter(self._visibility_filter()).select_related(
+                "assigned_to__profile"
+            ),
+        )
+        return with_etag(Response(TaskTreeNodeSerializer(task).data), etag)
+
+    @extend_schema(request=TaskMoveSerializer, responses=TaskDetailSerializer)
+    @action(detail=True, methods=["post"], url_path="move")
+    def move(self, request, pk=None):
+        """Move a task, with its subtasks, under another task or to the top level"""
+        task = self.get_object()
+        serializer = TaskMoveSerializer(
+            data=request.data,
+            context={"tasks": TaskModel.objects.filter(self._visibility_filter())},
+        )
+        serializer.is_valid(raise_exception=True)
+        version, error = expected_version(request)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            task = TaskService.move_task(
+                user=request.user,
+                task=task,
+                parent=serializer.validated_data["parent"],
+                version=version,
+            )
+        except VersionConflict as conflict:
+            return self._version_conflict(conflict.instance)
+        except ValueError as exc:
+            return Response({"parent": [str(exc)]}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(TaskDetailSerializer(task).data)
+
+    @staticmethod
+    def _assignee_list(task):
+        assignees = sorted(
+            User.objects.filter(task_assignments__task=task)
+            .select_related("profile")
+            .order_by("task_assignments__id"),
+            key=lambda assignee: assignee.pk != task.assigned_to_id,
+        )
+        return TaskAssigneeListSerializer(
+            {"assigned_to": task.assigned_to_id, "assignees": assignees}
+        ).data
+
+    @extend_schema(
+        request=TaskAssigneesSerializer, responses=TaskAssigneeListSerializer
+    )
+    @action(detail=True, methods=["put"], url_path="assignees")
+    def assignees(self, request, pk=None):
+        """
+        Replace the users assigned to a task. The primary assignee
+        (assigned_to) stays while listed, otherwise the first listed user
+        becomes primary.
+        """
+        task = self.get_object()
+        serializer = TaskAssigneesSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        TaskService.set_assignees(
+            user=request.user,
+            task=task,
+            assignees=serializer.validated_data["user_ids"],
+        )
+        return Response(self._assignee_list(task))
+
     @action(detail=True, methods=["post", "get"], url_path="comments")
     def comments(self, request, pk=None):
         """Handle comments for a task"""
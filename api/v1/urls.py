@@ -8,5 +8,7 @@ urlpatterns = [
     path("calendar/", include("api.v1.Calendar.urls")),
     path("dashboard/", include("api.v1.dashboard.urls")),
     path("notifications/", include("api.v1.notifications.urls")),
+    path("search/", include("api.v1.search.urls")),
+    path("me/", include("api.v1.me.urls")),
     # path("common/", include('api.v1.common.urls))
 ]
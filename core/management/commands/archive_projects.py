@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.services.project_archive import ProjectArchiveService
+
+
+class Command(BaseCommand):
+    help = "Move completed projects' tasks, comments and history to the archive tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project",
+            type=int,
+            action="append",
+            dest="project_ids",
+            help="Only archive this project (repeatable)",
+        )
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=30,
+            help="Only archive projects not updated for this many days (default 30)",
+        )
+
+    def handle(self, *args, **options):
+        projects = ProjectArchiveService.archivable().filter(
+            updated_at__lt=timezone.now() - timedelta(days=options["older_than"])
+        )
+        if options["project_ids"]:
+            projects = projects.filter(pk__in=options["project_ids"])
+
+        # One transaction per project, so a failure only skips that project
+        for project in projects.order_by("pk"):
+            try:
+                archive = ProjectArchiveService.archive(project=project)
+            except ValueError as exc:
+                self.stdout.write(self.style.ERROR(f"{project.project_name}: {exc}"))
+                continue
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Archived {project.project_name} ({archive.task_count} tasks)"
+                )
+            )
@@ -0,0 +1,71 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.services.roles import (
+    PERMISSION_BITS,
+    ROLE_PERMISSIONS,
+    permission_bit,
+    roles_mask,
+)
+
+
+class Command(BaseCommand):
+    help = "Compare list-scan permission checks with the compiled bitmask checks"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=200_000,
+            help="Number of checks per codename/group combination",
+        )
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+
+        # Every role on its own plus a multi-group user, checked against every
+        # known codename and one that no role grants (worst case for list scans)
+        group_sets = [[role] for role in ROLE_PERMISSIONS] + [["Guest", "Developer"]]
+        codenames = list(PERMISSION_BITS) + ["assign_projectsmodel"]
+
+        def list_scan(groups, codename):
+            return any(codename in ROLE_PERMISSIONS.get(group, []) for group in groups)
+
+        def bitmask(mask, bit):
+            return bool(mask & bit)
+
+        # Sanity check: both engines must agree before timing them
+        for groups in group_sets:
+            mask = roles_mask(groups)
+            for codename in codenames:
+                if list_scan(groups, codename) != bitmask(
+                    mask, permission_bit(codename)
+                ):
+                    raise RuntimeError(f"Mismatch for {groups} / {codename}")
+
+        total_checks = iterations * len(group_sets) * len(codenames)
+
+        start = time.perf_counter()
+        for groups in group_sets:
+            for codename in codenames:
+                for _ in range(iterations):
+                    list_scan(groups, codename)
+        list_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for groups in group_sets:
+            mask = roles_mask(groups)
+            for codename in codenames:
+                bit = permission_bit(codename)
+                for _ in range(iterations):
+                    bitmask(mask, bit)
+        mask_elapsed = time.perf_counter() - start
+
+        list_rate = total_checks / list_elapsed
+        mask_rate = total_checks / mask_elapsed
+
+        self.stdout.write(f"Checks per engine: {total_checks:,}")
+        self.stdout.write(f"  list scan: {list_rate:,.0f} checks/s")
+        self.stdout.write(f"  bitmask:   {mask_rate:,.0f} checks/s")
+        self.stdout.write(self.style.SUCCESS(f"Speedup: {mask_rate / list_rate:.1f}x"))
@@ -0,0 +1,62 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from api.v1.tasks.serializers import TaskImportRowSerializer
+from core.services.task_import import FORMATS, TaskImportService
+from projects.models import ProjectsModel
+
+
+class Command(BaseCommand):
+    help = "Import tasks into a project from a CSV or NDJSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_id", type=int)
+        parser.add_argument("path")
+        parser.add_argument(
+            "--format", choices=FORMATS, help="Defaults to the file extension"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Rows per transaction (TASK_IMPORT_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--user", help="Username recorded as creator (default: the project creator)"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            project = ProjectsModel.objects.select_related("created_by").get(
+                pk=options["project_id"]
+            )
+        except ProjectsModel.DoesNotExist:
+            raise CommandError(f"Project {options['project_id']} does not exist")
+
+        user = project.created_by
+        if options["user"]:
+            user = User.objects.filter(username=options["user"]).first()
+            if user is None:
+                raise CommandError(f"User {options['user']} does not exist")
+
+        fmt = options["format"] or TaskImportService.detect_format(options["path"])
+        if fmt not in FORMATS:
+            raise CommandError("Pass --format csv or --format ndjson")
+
+        with open(options["path"], "rb") as stream:
+            report = TaskImportService.import_rows(
+                project=project,
+                user=user,
+                rows=TaskImportService.read_rows(stream, fmt),
+                serializer_class=TaskImportRowSerializer,
+                batch_size=options["batch_size"],
+            )
+
+        for error in report["errors"]:
+            self.stdout.write(
+                self.style.ERROR(f"Row {error['row']}: {error['errors']}")
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {report['created']} tasks, {report['failed']} rows failed"
+            )
+        )
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.utils import aware_utcnow
+
+
+class Command(BaseCommand):
+    help = "Delete expired outstanding and blacklisted JWT tokens in chunks"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of tokens deleted per transaction",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        now = aware_utcnow()
+
+        expired = OutstandingToken.objects.filter(expires_at__lte=now).order_by("id")
+        deleted_outstanding = 0
+        deleted_blacklisted = 0
+
+        # Short transactions keep row locks brief while the API keeps refreshing
+        while True:
+            ids = list(expired.values_list("id", flat=True)[:chunk_size])
+            if not ids:
+                break
+
+            with transaction.atomic():
+                blacklisted, _ = BlacklistedToken.objects.filter(
+                    token_id__in=ids
+                ).delete()
+                outstanding, _ = (
+                    OutstandingToken.objects.filter(id__in=ids).only("id").delete()
+                )
+
+            deleted_blacklisted += blacklisted
+            deleted_outstanding += outstanding
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Pruned {deleted_outstanding} outstanding and "
+                f"{deleted_blacklisted} blacklisted tokens"
+            )
+        )
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.services.project_access import ProjectAccessService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the ProjectAccess visibility index from memberships and creators"
+
+    def handle(self, *args, **kwargs):
+        with transaction.atomic():
+            count = ProjectAccessService.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} project access rows"))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.services.project_stats import ProjectStatsService
+
+
+class Command(BaseCommand):
+    help = "Recount the ProjectStats task and member counters from the source tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project",
+            type=int,
+            action="append",
+            dest="project_ids",
+            help="Only rebuild this project (repeatable)",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            count = ProjectStatsService.rebuild(project_ids=options["project_ids"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt stats for {count} projects"))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.services.task_tree import TaskTreeService
+
+
+class Command(BaseCommand):
+    help = "Recount the subtask rollups of every task from the task paths"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project",
+            type=int,
+            action="append",
+            dest="project_ids",
+            help="Only rebuild this project's tasks (repeatable)",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            count = TaskTreeService.rebuild(project_ids=options["project_ids"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt rollups for {count} tasks"))
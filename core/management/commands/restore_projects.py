@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.services.project_archive import ProjectArchiveService
+from projects.models import ProjectsModel
+
+
+class Command(BaseCommand):
+    help = "Move archived projects' rows back into the live tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument("project_ids", type=int, nargs="+")
+
+    def handle(self, *args, **options):
+        projects = ProjectsModel.objects.filter(pk__in=options["project_ids"])
+        missing = set(options["project_ids"]) - {project.pk for project in projects}
+        if missing:
+            raise CommandError(f"Unknown project ids: {sorted(missing)}")
+
+        for project in projects.order_by("pk"):
+            try:
+                restored = ProjectArchiveService.restore(project=project)
+            except ValueError as exc:
+                self.stdout.write(self.style.ERROR(f"{project.project_name}: {exc}"))
+                continue
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Restored {project.project_name} ({restored} tasks)"
+                )
+            )
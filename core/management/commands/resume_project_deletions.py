@@ -0,0 +1,69 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.services.enums import DeletionJobStatusEnum
+from core.services.project_deletion import ACTIVE_STATUSES, ProjectDeletionService
+from projects.models import ProjectDeletionJob
+
+
+class Command(BaseCommand):
+    help = (
+        "Finish project deletion jobs interrupted by a restart. Each job is "
+        "claimed once its heartbeat goes stale and runs in a background thread"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--include-failed",
+            action="store_true",
+            help="Also retry jobs that stopped with an error",
+        )
+        parser.add_argument(
+            "--poll",
+            type=int,
+            default=30,
+            help="Seconds between checks for jobs that are not stale yet",
+        )
+
+    def handle(self, *args, **options):
+        include_failed = options["include_failed"]
+
+        # A job with a fresh heartbeat may still have a live runner (another
+        # container), so it is only claimed once the heartbeat goes stale
+        threads = {}
+        while True:
+            statuses = list(ACTIVE_STATUSES)
+            if include_failed:
+                statuses.append(DeletionJobStatusEnum.FAILED)
+            jobs = ProjectDeletionJob.objects.filter(status__in=statuses).exclude(
+                pk__in=list(threads)
+            )
+
+            waiting = []
+            for job_id in jobs.order_by("pk").values_list("pk", flat=True):
+                lease = ProjectDeletionService.claim(
+                    job_id, include_failed=include_failed
+                )
+                if lease:
+                    threads[job_id] = ProjectDeletionService.dispatch(job_id, lease)
+                else:
+                    waiting.append(job_id)
+            if not waiting:
+                break
+            # Failed jobs are only retried on the first pass
+            include_failed = False
+            time.sleep(options["poll"])
+
+        for job_id, thread in threads.items():
+            if thread:
+                thread.join()
+            job = ProjectDeletionJob.objects.get(pk=job_id)
+            style = (
+                self.style.SUCCESS
+                if job.status == DeletionJobStatusEnum.COMPLETED
+                else self.style.ERROR
+            )
+            self.stdout.write(
+                style(f"Job {job.pk} ({job.project_name}): {job.status} {job.error}")
+            )
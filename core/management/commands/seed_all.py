@@ -48,6 +48,7 @@ class Command(BaseCommand):
             "seed_avatars",
             "seed_projects",
             "seed_tasks",
+            "rebuild_project_stats",  # seed_tasks writes tasks directly
             "seed_calendar",
             "seed_audit_logs",
             "generate_profiles",
@@ -249,6 +249,7 @@ class Command(BaseCommand):
                     assignment, _ = TaskAssignment.objects.get_or_create(
                         task=task,
                         user=assigned_to,
+                        defaults={"status": task.status, "due_date": task.due_date},
                     )
                     record_seeded(seed_run, assignment)
                     total_assignment_created += 1
@@ -264,6 +265,10 @@ class Command(BaseCommand):
                             assignment, _ = TaskAssignment.objects.get_or_create(
                                 task=task,
                                 user=extra_user,
+                                defaults={
+                                    "status": task.status,
+                                    "due_date": task.due_date,
+                                },
                             )
                             record_seeded(seed_run, assignment)
                             total_assignment_created += 1
@@ -0,0 +1,18 @@
+from core.services.presence import PresenceService
+
+
+class PresenceMiddleware:
+    """
+    Records user activity for presence tracking.
+
+    Runs after the view so users authenticated by DRF (JWT) are visible on the
+    underlying request. Recording is an in-memory write; see PresenceBuffer.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        PresenceService.record_activity(getattr(request, "user", None))
+        return response
@@ -27,3 +27,17 @@ class SeededObject(models.Model):
 
     def __str__(self):
         return f"{self.model_label}:{self.object_id} ({self.seed_run.name})"
+
+
+class Generation(models.Model):
+    """
+    Counter bumped whenever data under its scope changes (see
+    ProjectGeneration). Kept in the database so every worker sees the same
+    value.
+    """
+
+    scope = models.CharField(max_length=50, primary_key=True)
+    value = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.scope}: {self.value}"
@@ -0,0 +1,87 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from core.services.permission_context import PermissionContext
+
+User = get_user_model()
+
+# Claims embedded in every token issued by CustomTokenObtainPairSerializer
+PRINCIPAL_CLAIMS = (
+    "username",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+    "groups",
+    "perm_version",
+)
+
+
+def principal_claims(user):
+    """Claims describing the user's identity and global roles"""
+    return {
+        "username": user.get_username(),
+        "is_active": user.is_active,
+        "is_staff": user.is_staff,
+        "is_superuser": user.is_superuser,
+        "groups": list(user.groups.values_list("name", flat=True)),
+        "perm_version": PermissionContext.get_version(user.pk),
+    }
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that trusts the principal claims while they are fresh.
+
+    Tokens carry the user's permission version. As long as it matches the
+    current version (bumped on any user, group or membership change) the user
+    is rebuilt from the claims without a database round trip. Fields that are
+    not in the token are deferred, and each one costs a query on first access
+    (e.g. `email`), so code on the request path should stick to the claims.
+    Stale or claim-less tokens fall back to the regular database lookup, and
+    so does every token when the cache is per-process (CACHE_SHARED off): a
+    version bumped by one worker would not reach the others.
+    """
+
+    def get_user(self, validated_token):
+        if not settings.CACHE_SHARED or any(
+            claim not in validated_token for claim in PRINCIPAL_CLAIMS
+        ):
+            return super().get_user(validated_token)
+
+        try:
+            # The claim is serialized as a string; restore the field's type
+            user_id = User._meta.get_field(api_settings.USER_ID_FIELD).to_python(
+                validated_token[api_settings.USER_ID_CLAIM]
+            )
+        except KeyError:
+            return super().get_user(validated_token)
+
+        if validated_token["perm_version"] != PermissionContext.get_version(user_id):
+            return super().get_user(validated_token)
+
+        values = {
+            api_settings.USER_ID_FIELD: user_id,
+            "username": validated_token["username"],
+            "is_staff": validated_token["is_staff"],
+            "is_superuser": validated_token["is_superuser"],
+            "is_active": validated_token["is_active"],
+        }
+        # from_db expects values in concrete field order; the rest are deferred
+        field_names = [
+            field.attname
+            for field in User._meta.concrete_fields
+            if field.attname in values
+        ]
+        user = User.from_db(
+            DEFAULT_DB_ALIAS, field_names, [values[name] for name in field_names]
+        )
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        user.token_groups = tuple(validated_token["groups"])
+        return user
@@ -0,0 +1,88 @@
+import datetime
+
+from django.db.models import Case, Count, F, IntegerField, Value, When, Window
+from django.db.models.functions import Coalesce, RowNumber
+
+from core.services.enums import PriorityEnum, StatusEnum
+
+# Board columns, left to right
+COLUMNS = [status.value for status in StatusEnum]
+
+# Card order within a column: priority, then nearest due date, then id.
+# Both sort keys are non-null so the order can be paged with a keyset cursor.
+CARD_ORDERING = ("priority_rank", "due_rank", "id")
+
+CARD_FIELDS = (
+    "id",
+    "project_id",
+    "title",
+    "status",
+    "priority",
+    "due_date",
+    "version",
+    "assigned_to__id",
+    "assigned_to__username",
+    "assigned_to__profile__avatar",
+)
+
+
+class BoardService:
+    """
+    Kanban board of a project: one column per status, cards ordered by
+    priority and due date.
+
+    The board is one query. ROW_NUMBER() and COUNT(*) over a window
+    partitioned by status give every task its place in its column and the
+    column's size, and only the first cards of each column are returned.
+    Further cards are loaded per column with a cursor on the card order.
+    """
+
+    @staticmethod
+    def cards(tasks):
+        """
+        `tasks` limited to the board columns, with the card sort keys and
+        only the columns a card shows
+        """
+        priority_rank = Case(
+            When(priority=PriorityEnum.HIGH, then=Value(0)),
+            When(priority=PriorityEnum.MEDIUM, then=Value(1)),
+            When(priority=PriorityEnum.LOW, then=Value(2)),
+            default=Value(3),
+            output_field=IntegerField(),
+        )
+        return (
+            tasks.filter(status__in=COLUMNS)
+            .annotate(
+                priority_rank=priority_rank,
+                due_rank=Coalesce("due_date", Value(datetime.date.max)),
+            )
+            .select_related("assigned_to__profile")
+            .only(*CARD_FIELDS)
+        )
+
+    @staticmethod
+    def columns(tasks, per_column):
+        """
+        The first `per_column` cards of every column, in one query.
+        Returns [(status, total, cards)] in column order.
+        """
+        order_by = [F(field).asc() for field in CARD_ORDERING]
+        rows = (
+            BoardService.cards(tasks)
+            .annotate(
+                column_position=Window(
+                    RowNumber(), partition_by=F("status"), order_by=order_by
+                ),
+                column_total=Window(Count("id"), partition_by=F("status")),
+            )
+            # Filtering on a window wraps the query, so totals count every card
+            .filter(column_position__lte=per_column)
+            .order_by("status", *CARD_ORDERING)
+        )
+
+        cards = {status: [] for status in COLUMNS}
+        totals = dict.fromkeys(COLUMNS, 0)
+        for row in rows:
+            cards[str(row.status)].append(row)
+            totals[str(row.status)] = row.column_total
+        return [(status, totals[status], cards[status]) for status in COLUMNS]
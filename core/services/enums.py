@@ -85,3 +85,12 @@ class NotificationCategory(models.TextChoices):
     SYSTEM = "SYSTEM", "System"
     REMINDER = "REMINDER", "Reminder"
     DEADLINE = "DEADLINE", "Deadline"
+
+
+class DeletionJobStatusEnum(models.TextChoices):
+    """Progress of a background project deletion"""
+
+    PENDING = "PENDING", "pending"
+    RUNNING = "RUNNING", "running"
+    COMPLETED = "COMPLETED", "completed"
+    FAILED = "FAILED", "failed"
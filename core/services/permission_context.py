@@ -0,0 +1,179 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from core.services.roles import ROLE_MASKS, permission_bit, roles_mask
+
+
+class PermissionContext:
+    """
+    Snapshot of everything the permission classes need to know about a user:
+    their global groups and their role in every project they belong to.
+
+    The snapshot is loaded once per request (attached to the request) and kept
+    across requests in the cache under a per-user version. Bumping the version
+    via `invalidate()` orphans every cached snapshot for that user. With a
+    per-process cache (CACHE_SHARED off) a bump would not reach the other
+    workers, so snapshots are then not kept across requests at all.
+    """
+
+    REQUEST_ATTR = "_permission_context"
+
+    def __init__(self, *, user_id, is_staff, is_superuser, groups, project_roles):
+        self.user_id = user_id
+        self.is_staff = is_staff
+        self.is_superuser = is_superuser
+        self.groups = frozenset(groups)
+        self.project_roles = project_roles
+        self.global_mask = roles_mask(self.groups)
+
+    # Lookups
+
+    def has_global_permission(self, codename):
+        """True if any of the user's global groups grants the permission"""
+        return self.has_global_bit(permission_bit(codename))
+
+    def has_global_bit(self, bit):
+        return bool(self.global_mask & bit)
+
+    def effective_mask(self, project_id):
+        """Global role mask combined with the user's role in the given project"""
+        role = self.project_role(project_id)
+        return self.global_mask | ROLE_MASKS.get(role, 0)
+
+    def has_project_bit(self, project_id, bit):
+        return bool(self.effective_mask(project_id) & bit)
+
+    def in_group(self, name):
+        return name in self.groups
+
+    def project_role(self, project_id):
+        """Role the user holds in the given project, or None if not a member"""
+        return self.project_roles.get(int(project_id))
+
+    def is_member(self, project_id):
+        return int(project_id) in self.project_roles
+
+    # Role flags (dashboard gates)
+
+    @property
+    def is_admin(self):
+        return self.is_superuser or self.is_staff or self.in_group("Admin")
+
+    @property
+    def is_project_manager(self):
+        return self.in_group("Project Manager")
+
+    # Loading
+
+    @classmethod
+    def anonymous(cls):
+        return cls(
+            user_id=None,
+            is_staff=False,
+            is_superuser=False,
+            groups=(),
+            project_roles={},
+        )
+
+    @classmethod
+    def for_request(cls, request):
+        """Return the context for request.user, loading it at most once per request"""
+        # Store on the underlying HttpRequest so DRF and plain Django views share it
+        http_request = getattr(request, "_request", request)
+        user = request.user
+
+        context = getattr(http_request, cls.REQUEST_ATTR, None)
+        if context is not None and context.user_id == getattr(user, "pk", None):
+            return context
+
+        context = cls.for_user(user)
+        setattr(http_request, cls.REQUEST_ATTR, context)
+        return context
+
+    @classmethod
+    def for_user(cls, user):
+        if not user or not user.is_authenticated:
+            return cls.anonymous()
+
+        if settings.CACHE_SHARED:
+            key = cls._context_key(user.pk, cls.get_version(user.pk))
+            payload = cache.get(key)
+            if payload is None:
+                payload = cls._load_payload(user)
+                cache.set(key, payload, cls._timeout())
+        else:
+            payload = cls._load_payload(user)
+
+        return cls(
+            user_id=user.pk,
+            is_staff=user.is_staff,
+            is_superuser=user.is_superuser,
+            groups=payload["groups"],
+            project_roles=payload["project_roles"],
+        )
+
+    @staticmethod
+    def _load_payload(user):
+        from projects.models import ProjectMembers
+
+        # Users authenticated from fresh token claims already carry their groups
+        groups = getattr(user, "token_groups", None)
+        if groups is None:
+            groups = list(user.groups.values_list("name", flat=True))
+        project_roles = dict(
+            ProjectMembers.objects.filter(project_member_id=user.pk).values_list(
+                "project_id", "role_in_project"
+            )
+        )
+        return {"groups": groups, "project_roles": project_roles}
+
+    # Versioning
+
+    @staticmethod
+    def _timeout():
+        return getattr(settings, "PERMISSION_CACHE_TIMEOUT", 300)
+
+    @staticmethod
+    def _version_key(user_id):
+        return f"permissions:version:{user_id}"
+
+    @staticmethod
+    def _context_key(user_id, version):
+        return f"permissions:context:{user_id}:{version}"
+
+    @classmethod
+    def get_version(cls, user_id):
+        """
+        Current permission version for a user.
+        Missing versions are seeded from the clock so an evicted counter never
+        comes back with a value an older snapshot was stored under.
+        """
+        key = cls._version_key(user_id)
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, time.time_ns(), None)
+            version = cache.get(key)
+        return version
+
+    @classmethod
+    def _invalidate_now(cls, user_ids):
+        for user_id in user_ids:
+            key = cls._version_key(user_id)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, time.time_ns(), None)
+
+    @classmethod
+    def invalidate(cls, *user_ids):
+        """
+        Bump the version for each user so their cached snapshots are ignored.
+        Deferred until the write commits, so a concurrent request cannot cache
+        the old roles under the new version.
+        """
+        user_ids = {uid for uid in user_ids if uid is not None}
+        if user_ids:
+            transaction.on_commit(lambda: cls._invalidate_now(user_ids))
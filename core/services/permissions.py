@@ -1,7 +1,8 @@
 from rest_framework import permissions
 
-from core.services.roles import ROLE_PERMISSIONS
-from projects.models import ProjectMembers
+from core.services.permission_context import PermissionContext
+from core.services.project_archive import ProjectArchiveService
+from core.services.roles import compile_permission_map, permission_bit
 
 
 class IsAdminDashboardUser(permissions.BasePermission):
@@ -17,33 +18,46 @@ class IsAdminDashboardUser(permissions.BasePermission):
         user = request.user
         if not user or not user.is_authenticated:
             return False
-        return (
-            user.is_superuser
-            or user.is_staff
-            or user.groups.filter(name="Admin").exists()
-            or user.groups.filter(name="Project Manager").exists()
-        )
+
+        context = PermissionContext.for_request(request)
+        return context.is_admin or context.is_project_manager
+
+
+class IsProjectManagerOrStaff(permissions.BasePermission):
+    """
+    Allows access to staff users and users in the Project Manager group.
+    Denials are answered in the standard error envelope (see ResponseMixin).
+    """
+
+    message = "Admin or Project Manager access required."
+    code = "FORBIDDEN"
+
+    def has_permission(self, request, view):  # type: ignore
+        user = request.user
+        if not user or not user.is_authenticated:
+            return False
+
+        context = PermissionContext.for_request(request)
+        return context.is_staff or context.is_project_manager
 
 
 class UserPermissions(permissions.BasePermission):
     """Permission class for users based on predefined role permissions"""
 
+    view_bit = permission_bit("view_user")
+    change_bit = permission_bit("change_user")
+    delete_bit = permission_bit("delete_user")
+
     def has_permission(self, request, view):  # type: ignore
         if not request.user.is_authenticated and view.action != "create":
             return False
 
-        # Get user's groups
-        user_groups = request.user.groups.values_list("name", flat=True)
+        # Get user's groups (loaded once per request)
+        context = PermissionContext.for_request(request)
 
         if view.action == "list":
             # only roles with view_user permission can list all users
-            return any(
-                # If the current request is trying to list all users,
-                # allow it only if the user belongs to at least one group
-                # that has the view_user permission
-                "view_user" in ROLE_PERMISSIONS.get(group, [])
-                for group in user_groups
-            )
+            return context.has_global_bit(self.view_bit)
         elif view.action == "create":
             # Any user can register
             return True
@@ -52,10 +66,7 @@ class UserPermissions(permissions.BasePermission):
             return True
         elif view.action == "destroy":
             # Only roles with delete_user permissions can delete
-            return any(
-                "delete_user" in ROLE_PERMISSIONS.get(group, [])
-                for group in user_groups
-            )
+            return context.has_global_bit(self.delete_bit)
         else:
             return False
 
@@ -64,22 +75,14 @@ class UserPermissions(permissions.BasePermission):
         if request.user == obj:
             return True
 
-        user_groups = request.user.groups.values_list("name", flat=True)
+        context = PermissionContext.for_request(request)
 
         if view.action == "retrieve":
-            return any(
-                "view_user" in ROLE_PERMISSIONS.get(group, []) for group in user_groups
-            )
+            return context.has_global_bit(self.view_bit)
         elif view.action in ["update", "partial_update"]:
-            return any(
-                "change_user" in ROLE_PERMISSIONS.get(group, [])
-                for group in user_groups
-            )
+            return context.has_global_bit(self.change_bit)
         elif view.action == "destroy":
-            return any(
-                "delete_user" in ROLE_PERMISSIONS.get(group, [])
-                for group in user_groups
-            )
+            return context.has_global_bit(self.delete_bit)
 
         return False
 
@@ -87,6 +90,40 @@ class UserPermissions(permissions.BasePermission):
 class ProjectPermissions(permissions.BasePermission):
     """Permission class for projects based on predefined role permissions"""
 
+    # Granted to the Admin and Project Manager roles only
+    manage_members_bit = permission_bit("add_projectmembers")
+
+    permission_bits = compile_permission_map(
+        {
+            "create": "add_projectsmodel",
+            "update": "change_projectsmodel",
+            "partial_update": "change_projectsmodel",
+            "list": "view_projectsmodel",
+            "retrieve": "view_projectsmodel",
+            "assign_project": "assign_projectsmodel",
+            "destroy": "delete_projectsmodel",
+            "tasks": "add_taskmodel",
+            "import_tasks": "add_taskmodel",
+            "board": "view_taskmodel",
+        }
+    )
+
+    object_permission_bits = compile_permission_map(
+        {
+            "list": "view_projectsmodel",
+            "retrieve": "view_projectsmodel",
+            "update": "change_projectsmodel",
+            "partial_update": "change_projectsmodel",
+            "destroy": "delete_projectsmodel",
+            "import_tasks": "add_taskmodel",
+            "board": "view_taskmodel",
+            # "assign_project": "assign_projectsmodel",
+            # "add_members": "add_projectmembers",
+            # "tasks": "add_taskmodel",
+            # "tasks": "view_taskmodel",
+        }
+    )
+
     def has_permission(self, request, view):  # type: ignore
         if not request.user.is_authenticated:
             return False
@@ -98,6 +135,7 @@ class ProjectPermissions(permissions.BasePermission):
         team_actions = {
             "invite_team_member",
             "add_team_member",
+            "bulk_add_team_members",
             "update_team_member",
             "update_member_role",
             "remove_team_member",
@@ -108,143 +146,118 @@ class ProjectPermissions(permissions.BasePermission):
         if view.action in team_actions:
             return True
 
-        user_groups = request.user.groups.values_list("name", flat=True)
-        permissions_map = {
-            "create": "add_projectsmodel",
-            "update": "change_projectsmodel",
-            "partial_update": "change_projectsmodel",
-            "list": "view_projectsmodel",
-            "retrieve": "view_projectsmodel",
-            "assign_project": "assign_projectsmodel",
-            "destroy": "delete_projectsmodel",
-            "tasks": "add_taskmodel",
-        }
+        context = PermissionContext.for_request(request)
 
-        required_permission = permissions_map.get(view.action)
-        if not required_permission:
+        required_bit = self.permission_bits.get(view.action)
+        if not required_bit:
             return False
 
-        return any(
-            required_permission in ROLE_PERMISSIONS.get(group, [])
-            for group in user_groups
-        )
+        return context.has_global_bit(required_bit)
 
     def has_object_permission(self, request, view, obj):  # type: ignore
         """Object-level permissons for projects
         Creator of the project always has access, or user must have the appropriate permissions
         """
 
+        # Archived projects are read-only for everyone until restored
+        if (
+            request.method not in permissions.SAFE_METHODS
+            and view.action != "destroy"
+            and ProjectArchiveService.is_archived(obj.pk)
+        ):
+            self.message = "Archived projects are read-only."
+            self.code = "FORBIDDEN"
+            return False
+
         if request.user.is_staff or request.user.is_superuser:
             return True
 
         # Project creator has full access
-        if obj.created_by == request.user:
+        if obj.created_by_id == request.user.id:
             return True
 
-        user_groups = request.user.groups.values_list("name", flat=True)
+        context = PermissionContext.for_request(request)
 
         # For team management actions, check if user has appropriate role in THIS project
         if view.action in [
             "invite_team_member",
             "add_team_member",
+            "bulk_add_team_members",
             "update_team_member",
             "remove_team_member",
             "update_member_role",
         ]:
-            # Check if user is Admin or Project Manager globally OR in this specific project
-            has_global_permission = any(
-                "add_projectmembers" in ROLE_PERMISSIONS.get(group, [])
-                for group in user_groups
-            )
-
-            if has_global_permission:
-                return True
-
-            # Check project-specific role
-            try:
-                membership = ProjectMembers.objects.get(
-                    project=obj, project_member=request.user
-                )
-                return membership.role_in_project in ["Admin", "Project Manager"]
-            except ProjectMembers.DoesNotExist:
-                return False
+            # Admin or Project Manager globally OR in this specific project
+            return context.has_project_bit(obj.pk, self.manage_members_bit)
 
         # Team visibility: Admin or Project Manager only
         if view.action in ["list_team_members", "team_stats"]:
-            has_global_permission = any(
-                "add_projectmembers" in ROLE_PERMISSIONS.get(group, [])
-                for group in user_groups
-            )
-            if has_global_permission:
-                return True
-
-            try:
-                membership = ProjectMembers.objects.get(
-                    project=obj, project_member=request.user
-                )
-                return membership.role_in_project in ["Admin", "Project Manager"]
-            except ProjectMembers.DoesNotExist:
-                return False
+            return context.has_project_bit(obj.pk, self.manage_members_bit)
 
         # For leaving project, any member can leave
         if view.action == "leave_project":
-            return ProjectMembers.objects.filter(
-                project=obj, project_member=request.user
-            ).exists()
+            return context.is_member(obj.pk)
 
-        permissions_map = {
-            "list": "view_projectsmodel",
-            "retrieve": "view_projectsmodel",
-            "update": "change_projectsmodel",
-            "partial_update": "change_projectsmodel",
-            "destroy": "delete_projectsmodel",
-            # "assign_project": "assign_projectsmodel",
-            # "add_members": "add_projectmembers",
-            # "tasks": "add_taskmodel",
-            # "tasks": "view_taskmodel",
-        }
-
-        required_permissions = permissions_map.get(view.action)
-        if not required_permissions:
+        required_bit = self.object_permission_bits.get(view.action)
+        if not required_bit:
             return False
 
-        return any(
-            required_permissions in ROLE_PERMISSIONS.get(group, [])
-            for group in user_groups
-        )
+        return context.has_global_bit(required_bit)
 
 
 class TaskPermissions(permissions.BasePermission):
     """Permission class for tasks based on predefined role permissions"""
 
-    def has_permission(self, request, view):  # type: ignore
-        if not request.user.is_authenticated:
-            return False
-
-        user_groups = request.user.groups.values_list("name", flat=True)
-
-        permissions_map = {
+    permission_bits = compile_permission_map(
+        {
             "create": "add_taskmodel",
             "update": "change_taskmodel",
+            "partial_update": "change_taskmodel",
             "list": "view_taskmodel",
             "retrieve": "view_taskmodel",
             "destroy": "delete_taskmodel",
             "update_status": "change_taskmodel",
             "update_priority": "change_taskmodel",
             "assign": "change_taskmodel",  # assign a task to a user
+            "bulk_update": "change_taskmodel",
+            "move": "change_taskmodel",
+            "tree": "view_taskmodel",
+            "assignees": "change_taskmodel",
             "comments": "view_commentmodel",  # retrieve comments
             "comments": "add_commentmodel",  # add a comment
             "task_logs": "view_taskhistorymodel",  # view task logs
         }
+    )
+
+    object_permission_bits = compile_permission_map(
+        {
+            "update": "change_taskmodel",
+            "partial_update": "change_taskmodel",
+            "retrieve": "view_taskmodel",
+            "destroy": "delete_taskmodel",
+            "update_status": "change_taskmodel",
+            "update_priority": "change_taskmodel",
+            "assign": "change_taskmodel",
+            "move": "change_taskmodel",
+            "tree": "view_taskmodel",
+            "assignees": "change_taskmodel",
+            "comments": "view_commentmodel",
+            "comments": "add_commentmodel",
+            "task_logs": "view_taskhistorymodel",
+        }
+    )
 
-        required_permission = permissions_map.get(view.action)
-        if not required_permission:
+    def has_permission(self, request, view):  # type: ignore
+        if not request.user.is_authenticated:
             return False
 
-        return any(
-            required_permission in ROLE_PERMISSIONS.get(group, [])
-            for group in user_groups
-        )
+        context = PermissionContext.for_request(request)
+
+        required_bit = self.permission_bits.get(view.action)
+        if not required_bit:
+            return False
+
+        return context.has_global_bit(required_bit)
 
     def has_object_permission(self, request, view, obj):  # type: ignore
         """Object-level permissons for tasks
@@ -255,59 +268,51 @@ class TaskPermissions(permissions.BasePermission):
             return True
 
         # Task creator has full access
-        if obj.created_by == request.user:
+        if obj.created_by_id == request.user.id:
             return True
 
-        user_groups = request.user.groups.values_list("name", flat=True)
+        context = PermissionContext.for_request(request)
 
-        permissions_map = {
-            "update": "change_taskmodel",
-            "partial_update": "change_taskmodel",
-            "retrieve": "view_taskmodel",
-            "destroy": "delete_taskmodel",
-            "update_status": "change_taskmodel",
-            "update_priority": "change_taskmodel",
-            "assign": "change_taskmodel",
-            "comments": "view_commentmodel",
-            "comments": "add_commentmodel",
-            "task_logs": "view_taskhistorymodel",
-        }
-
-        required_permissions = permissions_map.get(view.action)
-        if not required_permissions:
+        required_bit = self.object_permission_bits.get(view.action)
+        if not required_bit:
             return False
 
-        return any(
-            required_permissions in ROLE_PERMISSIONS.get(group, [])
-            for group in user_groups
-        )
+        return context.has_global_bit(required_bit)
 
 
 class CalendarEventPermissions(permissions.BasePermission):
     """Permission class for calendar based on predefined role permissions"""
 
-    def has_permission(self, request, view):  # type: ignore
-        if not request.user.is_authenticated:
-            return False
-
-        user_groups = request.user.groups.values_list("name", flat=True)
-
-        permissions_map = {
+    permission_bits = compile_permission_map(
+        {
             "create": "add_calendarevent",
             "update": "change_calendarevent",
             "partial_update": "change_calendarevent",
             "list": "view_calendarevent",
             "retrieve": "view_calendarevent",
         }
+    )
+
+    object_permission_bits = compile_permission_map(
+        {
+            "list": "view_calendarevent",
+            "retrieve": "view_calendarevent",
+            "update": "change_calendarevent",
+            "partial_update": "change_calendarevent",
+        }
+    )
+
+    def has_permission(self, request, view):  # type: ignore
+        if not request.user.is_authenticated:
+            return False
 
-        required_permission = permissions_map.get(view.action)
-        if not required_permission:
+        context = PermissionContext.for_request(request)
+
+        required_bit = self.permission_bits.get(view.action)
+        if not required_bit:
             return False
 
-        return any(
-            required_permission in ROLE_PERMISSIONS.get(group, [])
-            for group in user_groups
-        )
+        return context.has_global_bit(required_bit)
 
     def has_object_permission(self, request, view, obj):  # type: ignore
         """Object-level permissons for calendar
@@ -315,38 +320,23 @@ class CalendarEventPermissions(permissions.BasePermission):
         """
 
         # Event creator has full access
-        if obj.created_by == request.user:
+        if obj.created_by_id == request.user.id:
             return True
 
-        user_groups = request.user.groups.values_list("name", flat=True)
+        context = PermissionContext.for_request(request)
 
-        permissions_map = {
-            "list": "view_calendarevent",
-            "retrieve": "view_calendarevent",
-            "update": "change_calendarevent",
-            "partial_update": "change_calendarevent",
-        }
-
-        required_permissions = permissions_map.get(view.action)
-        if not required_permissions:
+        required_bit = self.object_permission_bits.get(view.action)
+        if not required_bit:
             return False
 
-        return any(
-            required_permissions in ROLE_PERMISSIONS.get(group, [])
-            for group in user_groups
-        )
+        return context.has_global_bit(required_bit)
 
 
 class NotificationPermissions(permissions.BasePermission):
     """Permissions for notification endpoints"""
 
-    def has_permission(self, request, view):  # type: ignore
-        if not request.user.is_authenticated:
-            return False
-
-        user_groups = request.user.groups.values_list("name", flat=True)
-
-        permissions_map = {
+    permission_bits = compile_permission_map(
+        {
             # NotificationViewSet
             "list": "view_notification",
             "retrieve": "view_notification",
@@ -358,15 +348,19 @@ class NotificationPermissions(permissions.BasePermission):
             "update": "change_notificationpreference",
             "partial_update": "change_notificationpreference",
         }
+    )
+
+    def has_permission(self, request, view):  # type: ignore
+        if not request.user.is_authenticated:
+            return False
+
+        context = PermissionContext.for_request(request)
 
-        required_permission = permissions_map.get(view.action)
-        if not required_permission:
+        required_bit = self.permission_bits.get(view.action)
+        if not required_bit:
             return False
 
-        return any(
-            required_permission in ROLE_PERMISSIONS.get(group, [])
-            for group in user_groups
-        )
+        return context.has_global_bit(required_bit)
 
     def has_object_permission(self, request, view, obj):  # type: ignore
         # Notifications are only accessible by their recipient.
@@ -0,0 +1,178 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, connection
+from django.db.models import Case, DateTimeField, Q, Value, When
+from django.utils import timezone
+
+from accounts.models import UserProfile
+
+logger = logging.getLogger(__name__)
+
+# A user counts as online if they were active within this window
+ONLINE_WINDOW = timedelta(seconds=getattr(settings, "PRESENCE_ONLINE_WINDOW", 300))
+
+# How often a worker writes its buffered activity to the database
+FLUSH_INTERVAL = getattr(settings, "PRESENCE_FLUSH_INTERVAL", 30)
+
+# A user's last_seen is rewritten at most this often (seconds)
+WRITE_THROTTLE = getattr(settings, "PRESENCE_WRITE_THROTTLE", 60)
+
+
+class PresenceBuffer:
+    """
+    Per-worker buffer of user activity.
+
+    Requests only record a timestamp in memory; the buffer is written out with a
+    single UPDATE at most every FLUSH_INTERVAL seconds, and each user's
+    last_seen is rewritten at most every WRITE_THROTTLE seconds.
+
+    The request that finds a flush due runs it. Serving workers also run
+    start_flusher(), so a worker that goes idle still writes its buffer and
+    whatever is left is written when the process exits.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}  # user_id -> last activity not yet written
+        self._written = {}  # user_id -> last_seen value last written by this worker
+        self._last_flush = time.monotonic()
+        self._flusher_pid = None  # process the flusher thread was started in
+
+    def touch(self, user_id):
+        now = timezone.now()
+        with self._lock:
+            written = self._written.get(user_id)
+            if written is None or (now - written).total_seconds() >= WRITE_THROTTLE:
+                self._pending[user_id] = now
+            # The thread does not survive a fork (gunicorn --preload), so a
+            # forked worker starts its own
+            forked = self._flusher_pid not in (None, os.getpid())
+
+        if forked:
+            self.start_flusher()
+        self.flush_if_due()
+
+    def start_flusher(self):
+        """Flush from a background thread while idle, and once more on exit"""
+        with self._lock:
+            if self._flusher_pid is None:
+                atexit.register(self.flush)
+            self._flusher_pid = os.getpid()
+        threading.Thread(
+            target=self._flush_periodically, name="presence-flush", daemon=True
+        ).start()
+
+    def _flush_periodically(self):
+        while True:
+            time.sleep(FLUSH_INTERVAL)
+            try:
+                self.flush_if_due()
+            except Exception:
+                logger.exception("Presence flush thread failed")
+            finally:
+                connection.close()
+
+    def flush_if_due(self):
+        """flush() if FLUSH_INTERVAL has passed since the last one, else 0"""
+        with self._lock:
+            due = time.monotonic() - self._last_flush >= FLUSH_INTERVAL
+        return self.flush() if due else 0
+
+    def pending_user_ids(self):
+        with self._lock:
+            return list(self._pending)
+
+    def is_pending(self, user_id):
+        with self._lock:
+            return user_id in self._pending
+
+    def flush(self):
+        """
+        Write all buffered timestamps in one bulk UPDATE.
+        Runs on whichever request is due, so a failed write is logged and its
+        batch put back for the next flush instead of failing that request.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+
+        if not pending:
+            return 0
+
+        try:
+            updated = UserProfile.objects.filter(user_id__in=pending).update(
+                last_seen=Case(
+                    *[
+                        When(user_id=user_id, then=Value(seen))
+                        for user_id, seen in pending.items()
+                    ],
+                    output_field=DateTimeField(),
+                )
+            )
+        except DatabaseError:
+            logger.exception("Presence flush of %d users failed", len(pending))
+            with self._lock:
+                # Activity recorded since the swap is newer and wins
+                self._pending = {**pending, **self._pending}
+            return 0
+
+        with self._lock:
+            self._written.update(pending)
+            # Forget users whose throttle window has passed to keep memory bounded
+            cutoff = timezone.now() - timedelta(seconds=WRITE_THROTTLE)
+            self._written = {
+                user_id: seen
+                for user_id, seen in self._written.items()
+                if seen >= cutoff
+            }
+        return updated
+
+    def clear(self):
+        with self._lock:
+            self._pending.clear()
+            self._written.clear()
+
+
+# Activity not yet flushed when a worker is killed (rather than shut down) is
+# lost, which at worst shows a user offline for a moment. The flusher is started
+# from team_track/wsgi.py so only serving processes run it, not tests or
+# management commands
+presence_buffer = PresenceBuffer()
+
+
+class PresenceService:
+    @staticmethod
+    def record_activity(user):
+        if user is not None and user.is_authenticated:
+            presence_buffer.touch(user.pk)
+
+    @staticmethod
+    def online_since():
+        return timezone.now() - ONLINE_WINDOW
+
+    @staticmethod
+    def is_online(user_id, last_seen):
+        """Online check for a user whose profile is already loaded"""
+        if presence_buffer.is_pending(user_id):
+            return True
+        return last_seen is not None and last_seen >= PresenceService.online_since()
+
+    @staticmethod
+    def online_user_ids(project):
+        """Ids of the project's members active within ONLINE_WINDOW (one query)"""
+        member_ids = project.members.values_list("project_member_id", flat=True)
+
+        # Users with activity this worker has not flushed yet are online too
+        return set(
+            UserProfile.objects.filter(
+                Q(last_seen__gte=PresenceService.online_since())
+                | Q(user_id__in=presence_buffer.pending_user_ids()),
+                user_id__in=member_ids,
+            ).values_list("user_id", flat=True)
+        )
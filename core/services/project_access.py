@@ -0,0 +1,133 @@
+from django.db.models import Q
+
+from projects.models import ProjectAccess, ProjectMembers, ProjectsModel
+from core.services.task_assignment import TaskAssignmentService
+
+# Role recorded for a creator who is not (or no longer) a member of the project.
+# Creators keep full access to their projects.
+CREATOR_ROLE = "Project Manager"
+
+
+class ProjectAccessService:
+    """Maintains and queries the ProjectAccess visibility index"""
+
+    @staticmethod
+    def project_ids_for(user):
+        """
+        Subquery of the project ids the user can see.
+        Use as `filter(project_id__in=...)` so scoping stays a single semi-join.
+        """
+        return ProjectAccess.objects.filter(user_id=user.pk).values("project_id")
+
+    @staticmethod
+    def task_visibility(user, prefix=""):
+        """
+        Q for the tasks the user can see: their projects' tasks plus tasks they
+        created or are assigned. `prefix` points it at a related task
+        (e.g. "task__").
+        """
+        return (
+            Q(**{f"{prefix}created_by": user})
+            | Q(**{f"{prefix}id__in": TaskAssignmentService.task_ids_for(user)})
+            | Q(
+                **{
+                    f"{prefix}project_id__in": ProjectAccessService.project_ids_for(
+                        user
+                    )
+                }
+            )
+        )
+
+    @staticmethod
+    def archived_task_visibility(user):
+        """
+        task_visibility() for ArchivedTask: assignments of archived projects
+        live in ArchivedTaskAssignment
+        """
+        return (
+            Q(created_by=user)
+            | Q(assigned_to=user)
+            | Q(id__in=TaskAssignmentService.archived_task_ids_for(user))
+            | Q(project_id__in=ProjectAccessService.project_ids_for(user))
+        )
+
+    @staticmethod
+    def has_access(user, project_id):
+        return ProjectAccess.objects.filter(
+            user_id=user.pk, project_id=project_id
+        ).exists()
+
+    @staticmethod
+    def grant(*, user_id, project_id, role):
+        ProjectAccess.objects.update_or_create(
+            user_id=user_id, project_id=project_id, defaults={"role": role}
+        )
+
+    @staticmethod
+    def grant_many(*, project_id, roles_by_user):
+        """Upsert access rows for many members of one project in a single query"""
+        ProjectAccess.objects.bulk_create(
+            [
+                ProjectAccess(user_id=user_id, project_id=project_id, role=role)
+                for user_id, role in roles_by_user.items()
+            ],
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["user", "project"],
+            update_fields=["role"],
+        )
+
+    @staticmethod
+    def revoke(*, user_id, project_id):
+        """
+        Drop a member's access row, falling back to the creator row if the
+        user still owns the project.
+        Never inserts, so it is safe to call while the project is being deleted.
+        """
+        is_creator = ProjectsModel.objects.filter(
+            pk=project_id, created_by_id=user_id
+        ).exists()
+        rows = ProjectAccess.objects.filter(user_id=user_id, project_id=project_id)
+
+        if is_creator:
+            rows.update(role=CREATOR_ROLE)
+        else:
+            rows.delete()
+
+    @staticmethod
+    def grant_creator(project):
+        """Make sure the creator can see the project without overriding a member role"""
+        ProjectAccess.objects.get_or_create(
+            user_id=project.created_by_id,
+            project_id=project.pk,
+            defaults={"role": CREATOR_ROLE},
+        )
+
+    @staticmethod
+    def rebuild():
+        """Recreate the whole index from memberships and project creators"""
+        rows = {
+            (project_id, user_id): CREATOR_ROLE
+            for project_id, user_id in ProjectsModel.objects.values_list(
+                "id", "created_by_id"
+            )
+        }
+        # Membership roles win over the creator fallback
+        rows.update(
+            {
+                (project_id, user_id): role
+                for project_id, user_id, role in ProjectMembers.objects.values_list(
+                    "project_id", "project_member_id", "role_in_project"
+                )
+            }
+        )
+
+        ProjectAccess.objects.all().delete()
+        ProjectAccess.objects.bulk_create(
+            [
+                ProjectAccess(project_id=project_id, user_id=user_id, role=role)
+                for (project_id, user_id), role in rows.items()
+            ],
+            batch_size=1000,
+        )
+        return len(rows)
@@ -0,0 +1,186 @@
+from django.db import connection, transaction
+
+from Calendar.models import CalendarEvent, TaskDeadlineSync
+from projects.models import ProjectArchive, ProjectsModel
+from tasks.models import (
+    ArchivedComment,
+    ArchivedTask,
+    ArchivedTaskAssignment,
+    ArchivedTaskHistory,
+    CommentModel,
+    TaskAssignment,
+    TaskHistoryModel,
+    TaskModel,
+)
+from core.services.audit_service import AuditService
+from core.services.enums import AuditModule, EventTypesEnum, ProjectStatusEnum
+from core.services.project_generation import ProjectGeneration
+from core.services.project_stats import ProjectStatsService
+
+# (live model, archive model, lookup to the project id), parents first
+TABLES = [
+    (TaskModel, ArchivedTask, "project_id"),
+    (CommentModel, ArchivedComment, "task__project_id"),
+    (TaskHistoryModel, ArchivedTaskHistory, "task__project_id"),
+    (TaskAssignment, ArchivedTaskAssignment, "task__project_id"),
+]
+
+
+class ProjectArchiveService:
+    """
+    Moves a completed project's tasks, comments, history and assignments into
+    the archive tables and back, keeping their ids.
+
+    Each table moves with one INSERT ... SELECT and one DELETE inside a single
+    transaction, so rows never pass through Python. A project with a
+    ProjectArchive row is read-only (see ProjectPermissions).
+    """
+
+    @staticmethod
+    def is_archived(project_id):
+        return ProjectArchive.objects.filter(project_id=project_id).exists()
+
+    @staticmethod
+    def archivable():
+        """Completed projects that are not archived yet"""
+        return ProjectsModel.objects.filter(
+            status=ProjectStatusEnum.COMPLETED, archive__isnull=True
+        )
+
+    # Set-based row moves
+
+    @staticmethod
+    def _pk_subquery(queryset):
+        sql, params = queryset.order_by().values("pk").query.sql_with_params()
+        pk_column = connection.ops.quote_name(queryset.model._meta.pk.column)
+        return f"{pk_column} IN ({sql})", params
+
+    @staticmethod
+    def _copy_rows(queryset, target):
+        """INSERT the queryset's rows into `target`, matching columns by field name"""
+        quote = connection.ops.quote_name
+        source = queryset.model
+        # Generated columns (search vectors) are computed by the database
+        fields = [
+            field for field in target._meta.concrete_fields if not field.generated
+        ]
+
+        columns = ", ".join(quote(field.column) for field in fields)
+        select = ", ".join(
+            quote(source._meta.get_field(field.name).column) for field in fields
+        )
+        where, params = ProjectArchiveService._pk_subquery(queryset)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {quote(target._meta.db_table)} ({columns}) "
+                f"SELECT {select} FROM {quote(source._meta.db_table)} WHERE {where}",
+                params,
+            )
+            return cursor.rowcount
+
+    @staticmethod
+    def _delete_rows(queryset):
+        """DELETE without loading rows, cascading or sending signals"""
+        where, params = ProjectArchiveService._pk_subquery(queryset)
+        table = connection.ops.quote_name(queryset.model._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {table} WHERE {where}", params)
+            return cursor.rowcount
+
+    @staticmethod
+    def _move(tables, project_id, *, to_archive):
+        """Copy parents first, then delete children first"""
+        counts = {}
+        for live, archived, lookup in tables:
+            source, target = (live, archived) if to_archive else (archived, live)
+            counts[target] = ProjectArchiveService._copy_rows(
+                source.objects.filter(**{lookup: project_id}), target
+            )
+        for live, archived, lookup in reversed(tables):
+            source = live if to_archive else archived
+            ProjectArchiveService._delete_rows(
+                source.objects.filter(**{lookup: project_id})
+            )
+        return counts
+
+    # Archive / restore
+
+    @staticmethod
+    @transaction.atomic
+    def archive(*, project, archived_by=None):
+        project = ProjectsModel.objects.select_for_update().get(pk=project.pk)
+        if project.status != ProjectStatusEnum.COMPLETED:
+            raise ValueError("Only completed projects can be archived")
+        if ProjectArchiveService.is_archived(project.pk):
+            raise ValueError("Project is already archived")
+
+        # Deadline reminders go away; other events stay on the project
+        events = CalendarEvent.objects.filter(linked_task__project_id=project.pk)
+        ProjectArchiveService._delete_rows(
+            events.filter(event_type=EventTypesEnum.DEADLINE)
+        )
+        events.update(linked_task=None)
+        ProjectArchiveService._delete_rows(
+            TaskDeadlineSync.objects.filter(task__project_id=project.pk)
+        )
+
+        counts = ProjectArchiveService._move(TABLES, project.pk, to_archive=True)
+        archive = ProjectArchive.objects.create(
+            project=project,
+            archived_by=archived_by,
+            task_count=counts[ArchivedTask],
+            comment_count=counts[ArchivedComment],
+            history_count=counts[ArchivedTaskHistory],
+        )
+
+        # ProjectStats keeps the final counts (rebuild skips archived projects)
+        ProjectGeneration.bump(project.pk)
+        AuditService.updated(
+            module=AuditModule.PROJECT,
+            actor=archived_by,
+            target=project,
+            project=project,
+            description=f'Archived project "{project.project_name}"',
+            metadata={
+                "project_id": project.pk,
+                "project_name": project.project_name,
+                "tasks_archived": archive.task_count,
+                "action_type": "project_archived",
+            },
+        )
+        return archive
+
+    @staticmethod
+    @transaction.atomic
+    def restore(*, project, restored_by=None):
+        project = ProjectsModel.objects.select_for_update().get(pk=project.pk)
+        deleted, _ = ProjectArchive.objects.filter(project=project).delete()
+        if not deleted:
+            raise ValueError("Project is not archived")
+
+        counts = ProjectArchiveService._move(TABLES, project.pk, to_archive=False)
+
+        # What the Calendar post_save signal would have done for each task
+        tasks = TaskModel.objects.filter(
+            project=project, due_date__isnull=False, assigned_to__isnull=False
+        ).select_related("assigned_to")
+        for task in tasks:
+            sync, _ = TaskDeadlineSync.objects.get_or_create(task=task)
+            sync.sync_to_calendar()
+
+        ProjectStatsService.rebuild(project_ids=[project.pk])
+        ProjectGeneration.bump(project.pk)
+        AuditService.updated(
+            module=AuditModule.PROJECT,
+            actor=restored_by,
+            target=project,
+            project=project,
+            description=f'Restored project "{project.project_name}" from the archive',
+            metadata={
+                "project_id": project.pk,
+                "project_name": project.project_name,
+                "tasks_restored": counts[TaskModel],
+                "action_type": "project_restored",
+            },
+        )
+        return counts[TaskModel]
@@ -0,0 +1,333 @@
+import logging
+import threading
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from audit.models import GlobalAuditLog
+from Calendar.models import CalendarEvent, ProjectMilestone, TaskDeadlineSync
+from notifications.models import Notification
+from projects.models import (
+    ProjectAccess,
+    ProjectDeletionJob,
+    ProjectMembers,
+    ProjectsModel,
+)
+from tasks.models import (
+    ArchivedComment,
+    ArchivedTask,
+    ArchivedTaskAssignment,
+    ArchivedTaskHistory,
+    CommentModel,
+    TaskAssignment,
+    TaskHistoryModel,
+    TaskModel,
+)
+from core.services.audit_service import AuditService
+from core.services.enums import AuditModule, DeletionJobStatusEnum
+
+logger = logging.getLogger(__name__)
+
+DELETE = None
+
+# (step, model, lookup to the project id, field to null out or DELETE).
+# Children go before their parents, so every chunk is a plain DELETE/UPDATE
+# that never cascades. Access rows go first so the project disappears from
+# member listings as soon as the job starts.
+STEPS = [
+    ("access", ProjectAccess, "project_id", DELETE),
+    ("task_calendar_events", CalendarEvent, "linked_task__project_id", DELETE),
+    ("task_deadline_syncs", TaskDeadlineSync, "task__project_id", DELETE),
+    ("task_assignments", TaskAssignment, "task__project_id", DELETE),
+    ("comments", CommentModel, "task__project_id", DELETE),
+    ("task_history", TaskHistoryModel, "task__project_id", "task"),
+    ("archived_comments", ArchivedComment, "task__project_id", DELETE),
+    ("archived_task_history", ArchivedTaskHistory, "task__project_id", DELETE),
+    ("archived_assignments", ArchivedTaskAssignment, "task__project_id", DELETE),
+    # Subtasks may sort after their parent, so detach them before deleting
+    ("archived_task_parents", ArchivedTask, "parent__project_id", "parent"),
+    ("archived_tasks", ArchivedTask, "project_id", DELETE),
+    ("task_parents", TaskModel, "parent__project_id", "parent"),
+    ("tasks", TaskModel, "project_id", DELETE),
+    ("calendar_events", CalendarEvent, "linked_project_id", DELETE),
+    ("milestones", ProjectMilestone, "project_id", DELETE),
+    ("notifications", Notification, "project_id", "project"),
+    ("audit_logs", GlobalAuditLog, "project_id", "project"),
+]
+
+ACTIVE_STATUSES = [DeletionJobStatusEnum.PENDING, DeletionJobStatusEnum.RUNNING]
+
+
+class LeaseLost(Exception):
+    """Another runner took the deletion job over"""
+
+
+class ProjectDeletionService:
+    """
+    Deletes a project in ordered, bounded chunks outside the request.
+
+    Each chunk commits on its own together with the job's progress, so a job
+    interrupted by a restart resumes where it stopped: on boot
+    (resume_project_deletions), or when the project is deleted again after
+    the job's heartbeat has gone stale.
+
+    The heartbeat doubles as the runner's lease. A runner starts with the
+    heartbeat it claimed and only saves progress while the job still carries
+    the heartbeat it last wrote, so two runners never work on one job.
+    """
+
+    @staticmethod
+    def _batch_size():
+        return getattr(settings, "PROJECT_DELETION_BATCH_SIZE", 500)
+
+    @staticmethod
+    def _stale_before():
+        seconds = getattr(settings, "PROJECT_DELETION_STALE_AFTER", 600)
+        return timezone.now() - timedelta(seconds=seconds)
+
+    @staticmethod
+    def claim(job_id, *, include_failed=False):
+        """
+        Take over a job whose runner has stopped (or a failed one, with
+        `include_failed`). The conditional UPDATE lets only one of several
+        concurrent callers win. Returns the lease to run() it with, or None.
+        """
+        stalled = Q(
+            status__in=ACTIVE_STATUSES,
+            heartbeat_at__lt=ProjectDeletionService._stale_before(),
+        )
+        if include_failed:
+            stalled |= Q(status=DeletionJobStatusEnum.FAILED)
+
+        now = timezone.now()
+        claimed = ProjectDeletionJob.objects.filter(stalled, pk=job_id).update(
+            heartbeat_at=now
+        )
+        return now if claimed else None
+
+    @staticmethod
+    def start(*, project, requested_by):
+        """Queue deletion of the project, returning (job, created)"""
+        job = ProjectDeletionJob.objects.filter(
+            project_id=project.pk, status__in=ACTIVE_STATUSES
+        ).first()
+        if job:
+            lease = ProjectDeletionService.claim(job.pk)
+            if lease:
+                logger.warning("Re-dispatching stalled project deletion job %s", job.pk)
+                transaction.on_commit(
+                    lambda: ProjectDeletionService.dispatch(job.pk, lease)
+                )
+            return job, False
+
+        try:
+            with transaction.atomic():
+                job = ProjectDeletionJob.objects.create(
+                    project_id=project.pk,
+                    project_name=project.project_name,
+                    requested_by=requested_by,
+                )
+        except IntegrityError:
+            # Another request queued it first
+            job = ProjectDeletionJob.objects.get(
+                project_id=project.pk, status__in=ACTIVE_STATUSES
+            )
+            return job, False
+
+        # A new job is leased to its creator
+        transaction.on_commit(
+            lambda: ProjectDeletionService.dispatch(job.pk, job.heartbeat_at)
+        )
+        return job, True
+
+    @staticmethod
+    def dispatch(job_id, lease):
+        """Run the job in a background thread, which is returned"""
+        if not getattr(settings, "PROJECT_DELETION_ASYNC", True):
+            ProjectDeletionService.run(job_id, lease)
+            return None
+
+        thread = threading.Thread(
+            target=ProjectDeletionService._run_in_thread,
+            args=(job_id, lease),
+            name=f"project-deletion-{job_id}",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    @staticmethod
+    def _run_in_thread(job_id, lease):
+        try:
+            ProjectDeletionService.run(job_id, lease)
+        finally:
+            connection.close()
+
+    # Chunk operations
+
+    @staticmethod
+    def _step_queryset(model, lookup, project_id):
+        return model.objects.filter(**{lookup: project_id})
+
+    @staticmethod
+    def _delete_chunk(queryset, batch_size):
+        """DELETE one batch by primary key, without loading rows or sending signals"""
+        model = queryset.model
+        ids = queryset.order_by("pk").values("pk")[:batch_size]
+        sql, params = ids.query.sql_with_params()
+
+        table = connection.ops.quote_name(model._meta.db_table)
+        pk_column = connection.ops.quote_name(model._meta.pk.column)
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {table} WHERE {pk_column} IN ({sql})", params)
+            return cursor.rowcount
+
+    @staticmethod
+    def _null_chunk(queryset, field, batch_size):
+        ids = queryset.order_by("pk").values("pk")[:batch_size]
+        return queryset.model.objects.filter(pk__in=ids).update(**{field: None})
+
+    @staticmethod
+    def _delete_members_chunk(project_id, batch_size):
+        # Through the ORM so the membership signals (permissions, stats) still run
+        memberships = list(
+            ProjectMembers.objects.filter(project_id=project_id).order_by("pk")[
+                :batch_size
+            ]
+        )
+        for membership in memberships:
+            membership.delete()
+        return len(memberships)
+
+    @staticmethod
+    def remaining_rows(project_id):
+        total = sum(
+            ProjectDeletionService._step_queryset(model, lookup, project_id).count()
+            for _step, model, lookup, _action in STEPS
+        )
+        total += ProjectMembers.objects.filter(project_id=project_id).count()
+        total += ProjectsModel.objects.filter(pk=project_id).count()
+        return total
+
+    # Runner
+
+    @staticmethod
+    def _save(job, *fields):
+        """
+        Save `fields` with a fresh heartbeat, or raise LeaseLost if another
+        runner has claimed the job since this one last saved
+        """
+        now = timezone.now()
+        saved = ProjectDeletionJob.objects.filter(
+            pk=job.pk, heartbeat_at=job.heartbeat_at
+        ).update(heartbeat_at=now, **{field: getattr(job, field) for field in fields})
+        if not saved:
+            raise LeaseLost(job.pk)
+        job.heartbeat_at = now
+
+    @staticmethod
+    def _advance(job, step, chunk):
+        """Run chunks of one step until it has no rows left"""
+        job.current_step = step
+        ProjectDeletionService._save(job, "current_step")
+
+        while True:
+            with transaction.atomic():
+                done = chunk()
+                if not done:
+                    return
+                job.processed_rows += done
+                ProjectDeletionService._save(job, "processed_rows")
+
+    @staticmethod
+    def run(job_id, lease):
+        """Run the job with the `lease` from start() or claim()"""
+        job = ProjectDeletionJob.objects.get(pk=job_id)
+        if job.status == DeletionJobStatusEnum.COMPLETED:
+            return job
+        if job.heartbeat_at != lease:
+            logger.info("Project deletion job %s is held by another runner", job.pk)
+            return job
+
+        project_id = job.project_id
+        batch_size = ProjectDeletionService._batch_size()
+
+        job.status = DeletionJobStatusEnum.RUNNING
+        job.started_at = job.started_at or timezone.now()
+        job.error = ""
+        job.total_rows = job.processed_rows + ProjectDeletionService.remaining_rows(
+            project_id
+        )
+        try:
+            ProjectDeletionService._save(
+                job, "status", "started_at", "error", "total_rows"
+            )
+        except LeaseLost:
+            logger.info("Project deletion job %s is held by another runner", job.pk)
+            return job
+
+        try:
+            for step, model, lookup, action in STEPS:
+                queryset = ProjectDeletionService._step_queryset(
+                    model, lookup, project_id
+                )
+                if action is DELETE:
+                    chunk = partial(
+                        ProjectDeletionService._delete_chunk, queryset, batch_size
+                    )
+                else:
+                    chunk = partial(
+                        ProjectDeletionService._null_chunk, queryset, action, batch_size
+                    )
+                ProjectDeletionService._advance(job, step, chunk)
+
+            ProjectDeletionService._advance(
+                job,
+                "members",
+                partial(
+                    ProjectDeletionService._delete_members_chunk, project_id, batch_size
+                ),
+            )
+
+            job.current_step = "project"
+            with transaction.atomic():
+                # Only the ProjectStats and ProjectArchive rows are left to cascade
+                deleted, _ = ProjectsModel.objects.filter(pk=project_id).delete()
+                job.processed_rows += 1 if deleted else 0
+                job.status = DeletionJobStatusEnum.COMPLETED
+                job.finished_at = timezone.now()
+                ProjectDeletionService._save(
+                    job, "current_step", "processed_rows", "status", "finished_at"
+                )
+
+                AuditService.deleted(
+                    module=AuditModule.PROJECT,
+                    actor=job.requested_by,
+                    target_type=ProjectsModel.__name__,
+                    target_id=project_id,
+                    target_label=job.project_name,
+                    description=f'Deleted project "{job.project_name}"',
+                    metadata={
+                        "project_name": job.project_name,
+                        "deletion_job_id": job.pk,
+                        "rows_deleted": job.processed_rows,
+                    },
+                )
+        except LeaseLost:
+            # The new runner carries on; this one's last chunk was rolled back
+            logger.warning("Project deletion job %s was taken over", job.pk)
+        except Exception as exc:
+            logger.exception("Project deletion job %s failed", job.pk)
+            job.status = DeletionJobStatusEnum.FAILED
+            job.error = str(exc)
+            job.finished_at = timezone.now()
+            try:
+                ProjectDeletionService._save(job, "status", "error", "finished_at")
+            except LeaseLost:
+                pass
+
+        return job
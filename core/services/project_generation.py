@@ -0,0 +1,63 @@
+from django.db.models import F
+
+from core.models import Generation
+
+# Generation shared by all projects for user-level data (names, avatars)
+# embedded in project and task payloads
+USERS = "users"
+
+
+class ProjectGeneration:
+    """
+    Counters that change whenever a project's payload may change.
+
+    Core signals bump a project's generation when the project, its members,
+    tasks or comments are written, and the shared users generation when a user
+    or profile changes. Conditional GETs build their ETags from these, so an
+    unchanged resource is answered without touching its rows.
+
+    The counters are Generation rows bumped by an UPDATE in the writer's
+    transaction. Every worker reads the same value, and the new value becomes
+    visible together with the write it stands for.
+    """
+
+    @staticmethod
+    def get_many(*scopes):
+        """Current generations of `scopes`, in order, in one query"""
+        values = dict(
+            Generation.objects.filter(
+                scope__in=[str(scope) for scope in scopes]
+            ).values_list("scope", "value")
+        )
+        return tuple(values.get(str(scope), 0) for scope in scopes)
+
+    @classmethod
+    def get(cls, scope):
+        return cls.get_many(scope)[0]
+
+    @staticmethod
+    def bump(*scopes):
+        """
+        Bump within the caller's transaction. The row lock it takes is held
+        until commit, so concurrent bumps of a scope never collapse into one.
+        """
+        scopes = sorted({str(scope) for scope in scopes if scope is not None})
+        if not scopes:
+            return
+
+        bumped = Generation.objects.filter(scope__in=scopes).update(
+            value=F("value") + 1
+        )
+        if bumped < len(scopes):
+            # First bump of a scope: create its row (a concurrent creator wins
+            # the insert), then bump the rows that were missing
+            existing = set(
+                Generation.objects.filter(scope__in=scopes).values_list(
+                    "scope", flat=True
+                )
+            )
+            missing = [scope for scope in scopes if scope not in existing]
+            Generation.objects.bulk_create(
+                [Generation(scope=scope) for scope in missing], ignore_conflicts=True
+            )
+            Generation.objects.filter(scope__in=missing).update(value=F("value") + 1)
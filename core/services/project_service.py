@@ -1,10 +1,25 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+
 from projects.models import ProjectsModel, ProjectMembers
 from core.services.audit_service import AuditService
 from core.services.enums import AuditModule
+from core.services.permission_context import PermissionContext
+from core.services.project_access import ProjectAccessService
+from core.services.project_generation import ProjectGeneration
+from core.services.project_stats import ProjectStatsService
+from core.services.team_stats import TeamStatsService
+from core.services.versioning import VersionConflict, refresh_row, versioned_update
 
 
 class ProjectService:
+    # Membership writes run in a transaction so the ProjectAccess index
+    # (maintained by core signals) commits or rolls back with them.
+
     @staticmethod
+    @transaction.atomic
     def create_project(*, user, data):
         # Create a project
         project = ProjectsModel.objects.create(
@@ -36,10 +51,131 @@ class ProjectService:
 
         return project
 
-    # @staticmethod
-    # def add_members(*, data):
-    #     """Add users to a project and their respective roles"""
-    #     return ProjectMembers.objects.create()
+    @staticmethod
+    def _lock_memberships(project):
+        """
+        Serialize membership inserts into `project` (until commit), so a bulk
+        add's check for existing members cannot race a concurrent add
+        """
+        list(
+            ProjectsModel.objects.select_for_update(no_key=True)
+            .filter(pk=project.pk)
+            .values_list("pk", flat=True)
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def add_member(*, project, user, role):
+        """Add a user to a project with the given role"""
+        ProjectService._lock_memberships(project)
+        return ProjectMembers.objects.create(
+            project=project,
+            project_member=user,
+            role_in_project=role,
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def update_member_role(*, membership, role):
+        membership.role_in_project = role
+        membership.save(update_fields=["role_in_project"])
+        return membership
+
+    @staticmethod
+    @transaction.atomic
+    def remove_member(*, membership):
+        membership.delete()
+
+    @staticmethod
+    @transaction.atomic
+    def bulk_add_members(*, project, actor, entries):
+        """
+        Add many users to a project at once.
+        `entries` are dicts with a "role" and either a "user_id" or an "email".
+        Returns {"added": [ProjectMembers], "existing": [user ids], "not_found": [...]}
+        """
+        user_ids = {entry["user_id"] for entry in entries if entry.get("user_id")}
+        emails = {entry["email"].lower() for entry in entries if entry.get("email")}
+
+        # Resolve every identifier in one query
+        users_by_id, users_by_email = {}, {}
+        users = (
+            User.objects.annotate(email_lower=Lower("email"))
+            .filter(Q(pk__in=user_ids) | Q(email_lower__in=emails))
+            .order_by("pk")
+        )
+        for user in users:
+            users_by_id[user.pk] = user
+            users_by_email.setdefault(user.email.lower(), user)
+
+        roles_by_user, not_found = {}, []
+        for entry in entries:
+            if entry.get("user_id"):
+                user = users_by_id.get(entry["user_id"])
+            else:
+                user = users_by_email.get(entry["email"].lower())
+
+            if user is None:
+                not_found.append(entry.get("user_id") or entry["email"])
+            else:
+                # The first entry for a user wins
+                roles_by_user.setdefault(user.pk, entry["role"])
+
+        ProjectService._lock_memberships(project)
+        existing = set(
+            ProjectMembers.objects.filter(
+                project=project, project_member_id__in=roles_by_user
+            ).values_list("project_member_id", flat=True)
+        )
+        new_roles = {
+            user_id: role
+            for user_id, role in roles_by_user.items()
+            if user_id not in existing
+        }
+
+        added = ProjectMembers.objects.bulk_create(
+            [
+                ProjectMembers(
+                    project=project, project_member_id=user_id, role_in_project=role
+                )
+                for user_id, role in new_roles.items()
+            ],
+            batch_size=1000,
+        )
+
+        if added:
+            # bulk_create skips the membership signals; apply their effects in bulk
+            ProjectAccessService.grant_many(
+                project_id=project.pk, roles_by_user=new_roles
+            )
+            ProjectStatsService.member_count_changed(project.pk, len(added))
+            PermissionContext.invalidate(*new_roles)
+            TeamStatsService.invalidate(project.pk)
+            ProjectGeneration.bump(project.pk)
+
+            # One summarizing entry, which also means one notification pass
+            AuditService.updated(
+                module=AuditModule.PROJECT,
+                actor=actor,
+                target=project,
+                project=project,
+                description=(
+                    f'Added {len(added)} members to project "{project.project_name}"'
+                ),
+                metadata={
+                    "project_id": project.pk,
+                    "project_name": project.project_name,
+                    "member_ids": list(new_roles),
+                    "members_added": len(added),
+                    "action_type": "project_members_added",
+                },
+            )
+
+        return {
+            "added": added,
+            "existing": sorted(existing),
+            "not_found": not_found,
+        }
 
     @staticmethod
     def _serialize_value(value):
@@ -48,24 +184,42 @@ class ProjectService:
         return str(value)
 
     @staticmethod
-    def update_project(*, user, project_id, data):
+    @transaction.atomic
+    def update_project(*, user, project_id, data, version=None):
+        """
+        Write the changed columns with one UPDATE guarded by the project's
+        version. Raises VersionConflict when `version` (what the client read)
+        is given and the project has moved past it; without it a lost race
+        is redone against the fresh row.
+        """
         project = ProjectsModel.objects.get(id=project_id)
-        changed_fields = {}
 
-        for field, new_value in data.items():
-            old_value = getattr(project, field)
-            old_serialized = ProjectService._serialize_value(old_value)
-            new_serialized = ProjectService._serialize_value(new_value)
+        while True:
+            if version is not None and project.version != version:
+                raise VersionConflict(project)
+
+            changed_fields, update_fields = {}, []
+            for field, new_value in data.items():
+                old_value = getattr(project, field)
+                old_serialized = ProjectService._serialize_value(old_value)
+                new_serialized = ProjectService._serialize_value(new_value)
+
+                if old_serialized != new_serialized:
+                    changed_fields[field] = {
+                        "old": old_serialized,
+                        "new": new_serialized,
+                    }
 
-            if old_serialized != new_serialized:
-                changed_fields[field] = {
-                    "old": old_serialized,
-                    "new": new_serialized,
-                }
+                setattr(project, field, new_value)
+                update_fields.append(field)
 
-            setattr(project, field, new_value)
+            if not update_fields or versioned_update(project, update_fields):
+                break
+            refresh_row(project)
 
-        project.save()
+        if update_fields:
+            # The UPDATE skips post_save; apply what its receivers would have done
+            ProjectGeneration.bump(project.pk)
 
         if changed_fields:
             AuditService.updated(
@@ -0,0 +1,251 @@
+from collections import Counter, defaultdict
+
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from projects.models import ProjectMembers, ProjectsModel, ProjectStats
+from tasks.models import TaskModel
+from core.services.enums import StatusEnum
+
+# ProjectStats counter for each task status
+STATUS_FIELDS = {
+    StatusEnum.TO_DO.value: "todo_tasks",
+    StatusEnum.IN_PROGRESS.value: "in_progress_tasks",
+    StatusEnum.IN_REVIEW.value: "in_review_tasks",
+    StatusEnum.DONE.value: "done_tasks",
+}
+
+TASK_FIELDS = ["total_tasks", *STATUS_FIELDS.values(), "overdue_tasks"]
+
+
+class ProjectStatsService:
+    """
+    Maintains the ProjectStats counters.
+
+    Task and membership writes apply deltas with a single F-expression UPDATE
+    in the caller's transaction. `rebuild` recounts from the source tables and
+    is the repair path (see the rebuild_project_stats command).
+    """
+
+    @staticmethod
+    def _task_counts(status, due_date, today):
+        """Counters a single task contributes to"""
+        status = str(status) if status else None
+        counts = {"total_tasks": 1}
+
+        status_field = STATUS_FIELDS.get(status)
+        if status_field:
+            counts[status_field] = 1
+
+        if due_date and due_date < today and status != StatusEnum.DONE.value:
+            counts["overdue_tasks"] = 1
+        return counts
+
+    @staticmethod
+    def _apply(project_id, delta):
+        delta = {field: value for field, value in delta.items() if value}
+        if not delta:
+            return
+
+        today = timezone.localdate()
+        updated = ProjectStats.objects.filter(
+            project_id=project_id, overdue_as_of=today
+        ).update(
+            # Clamped so a drifted counter can never fail the >= 0 check
+            **{
+                field: Greatest(F(field) + value, Value(0))
+                for field, value in delta.items()
+            },
+            updated_at=timezone.now(),
+        )
+
+        # No row, or its overdue count is from an earlier day: recount the project.
+        # The task write is already applied, so the recount includes it.
+        if not updated:
+            ProjectStatsService.rebuild(project_ids=[project_id])
+
+    @staticmethod
+    def task_created(task):
+        today = timezone.localdate()
+        ProjectStatsService._apply(
+            task.project_id,
+            ProjectStatsService._task_counts(task.status, task.due_date, today),
+        )
+
+    @staticmethod
+    def tasks_created(tasks):
+        """Batch form of task_created, with one UPDATE per project"""
+        today = timezone.localdate()
+        deltas = defaultdict(Counter)
+        for task in tasks:
+            deltas[task.project_id].update(
+                ProjectStatsService._task_counts(task.status, task.due_date, today)
+            )
+        for project_id, delta in deltas.items():
+            ProjectStatsService._apply(project_id, delta)
+
+    @staticmethod
+    def _change_delta(task, old_status, old_due_date, today):
+        old = ProjectStatsService._task_counts(old_status, old_due_date, today)
+        new = ProjectStatsService._task_counts(task.status, task.due_date, today)
+        return {field: new.get(field, 0) - old.get(field, 0) for field in TASK_FIELDS}
+
+    @staticmethod
+    def task_changed(task, *, old_status, old_due_date):
+        today = timezone.localdate()
+        ProjectStatsService._apply(
+            task.project_id,
+            ProjectStatsService._change_delta(task, old_status, old_due_date, today),
+        )
+
+    @staticmethod
+    def tasks_changed(changes):
+        """
+        Batch form of task_changed for (task, old_status, old_due_date) tuples,
+        with one UPDATE per project
+        """
+        today = timezone.localdate()
+        deltas = defaultdict(Counter)
+        for task, old_status, old_due_date in changes:
+            deltas[task.project_id].update(
+                ProjectStatsService._change_delta(task, old_status, old_due_date, today)
+            )
+        for project_id, delta in deltas.items():
+            ProjectStatsService._apply(project_id, delta)
+
+    @staticmethod
+    def task_deleted(task):
+        today = timezone.localdate()
+        counts = ProjectStatsService._task_counts(task.status, task.due_date, today)
+        ProjectStatsService._apply(
+            task.project_id, {field: -value for field, value in counts.items()}
+        )
+
+    @staticmethod
+    def tasks_deleted(tasks):
+        """Batch form of task_deleted, with one UPDATE per project"""
+        today = timezone.localdate()
+        deltas = defaultdict(Counter)
+        for task in tasks:
+            deltas[task.project_id].subtract(
+                ProjectStatsService._task_counts(task.status, task.due_date, today)
+            )
+        for project_id, delta in deltas.items():
+            ProjectStatsService._apply(project_id, delta)
+
+    @staticmethod
+    def overdue_tasks():
+        """
+        Expression for a project's overdue task count, to annotate projects
+        with. The counter is used while its overdue_as_of is today; one from an
+        earlier day is only recounted by the project's next write, so until
+        then the tasks are counted live. Archived projects keep the count they
+        were archived with.
+        """
+        today = timezone.localdate()
+        live = (
+            TaskModel.objects.filter(project=OuterRef("pk"), due_date__lt=today)
+            .exclude(status=StatusEnum.DONE)
+            .order_by()
+            .values("project")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+        return Case(
+            When(stats__overdue_as_of=today, then=F("stats__overdue_tasks")),
+            When(archive__isnull=False, then=Coalesce("stats__overdue_tasks", 0)),
+            default=Coalesce(Subquery(live), 0),
+            output_field=IntegerField(),
+        )
+
+    @staticmethod
+    def overdue_count(project_id):
+        """overdue_tasks() for a single project"""
+        return (
+            ProjectsModel.objects.filter(pk=project_id)
+            .annotate(overdue=ProjectStatsService.overdue_tasks())
+            .values_list("overdue", flat=True)
+            .first()
+        ) or 0
+
+    @staticmethod
+    def member_count_changed(project_id, delta):
+        """
+        Membership writes only touch member_count, which does not go stale.
+        Never inserts, so it is safe to call while the project is being deleted.
+        """
+        ProjectStats.objects.filter(project_id=project_id).update(
+            member_count=Greatest(F("member_count") + delta, Value(0)),
+            updated_at=timezone.now(),
+        )
+
+    @staticmethod
+    def ensure(project):
+        ProjectStats.objects.get_or_create(
+            project=project, defaults={"overdue_as_of": timezone.localdate()}
+        )
+
+    @staticmethod
+    def rebuild(project_ids=None):
+        """
+        Recount the stats of the given projects (all projects by default).
+        Archived projects keep the counts they were archived with.
+        """
+        today = timezone.localdate()
+
+        projects = ProjectsModel.objects.filter(archive__isnull=True)
+        tasks = TaskModel.objects.all()
+        members = ProjectMembers.objects.all()
+        if project_ids is not None:
+            projects = projects.filter(pk__in=project_ids)
+            tasks = tasks.filter(project_id__in=project_ids)
+            members = members.filter(project_id__in=project_ids)
+
+        task_counts = {
+            row.pop("project_id"): row
+            for row in tasks.values("project_id").annotate(
+                total_tasks=Count("id"),
+                **{
+                    field: Count("id", filter=Q(status=status))
+                    for status, field in STATUS_FIELDS.items()
+                },
+                overdue_tasks=Count(
+                    "id",
+                    filter=Q(due_date__lt=today) & ~Q(status=StatusEnum.DONE),
+                ),
+            )
+        }
+        member_counts = dict(
+            members.values("project_id")
+            .annotate(count=Count("id"))
+            .values_list("project_id", "count")
+        )
+
+        rows = [
+            ProjectStats(
+                project_id=project_id,
+                overdue_as_of=today,
+                member_count=member_counts.get(project_id, 0),
+                **task_counts.get(project_id, {}),
+            )
+            for project_id in projects.values_list("id", flat=True)
+        ]
+        ProjectStats.objects.bulk_create(
+            rows,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["project"],
+            update_fields=[*TASK_FIELDS, "overdue_as_of", "member_count", "updated_at"],
+        )
+        return len(rows)
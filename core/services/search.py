@@ -0,0 +1,110 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, Q
+
+from projects.models import SEARCH_CONFIG, ProjectsModel
+from tasks.models import CommentModel, TaskModel
+from core.services.project_access import ProjectAccessService
+
+# Result kinds, in response order
+KINDS = ("tasks", "comments", "projects")
+
+# Longer queries are cut to their first words
+MAX_TERMS = 8
+
+
+class SearchService:
+    """
+    Full-text search over the search_vector columns, which PostgreSQL keeps
+    up to date and GIN-indexes.
+
+    Every word of the query has to match, each as a prefix so results show up
+    while the user types. Visibility is part of the same statement (the
+    ProjectAccess semi-join the listings use), and results are ranked.
+    """
+
+    @staticmethod
+    def parse(text):
+        """SearchQuery for the words of `text`, or None when it has none"""
+        words = re.findall(r"\w+", text or "")[:MAX_TERMS]
+        if not words:
+            return None
+        # \w+ words cannot carry tsquery operators, so the raw syntax is safe
+        return SearchQuery(
+            " & ".join(f"{word}:*" for word in words),
+            search_type="raw",
+            config=SEARCH_CONFIG,
+        )
+
+    @staticmethod
+    def _ranked(queryset, query):
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(rank=SearchRank(F("search_vector"), query))
+            .order_by("-rank", "-pk")
+            .defer("search_vector")
+        )
+
+    @staticmethod
+    def task_match(query):
+        """
+        Q for tasks whose own text or whose project's text matches `query`.
+        Both sides are GIN lookups, so the planner can OR the index scans.
+        """
+        return Q(search_vector=query) | Q(
+            project_id__in=ProjectsModel.objects.filter(search_vector=query).values(
+                "pk"
+            )
+        )
+
+    @staticmethod
+    def tasks(user, query, project_id=None):
+        tasks = TaskModel.objects.filter(ProjectAccessService.task_visibility(user))
+        if project_id is not None:
+            tasks = tasks.filter(project_id=project_id)
+        return (
+            SearchService._ranked(tasks, query)
+            .select_related("project")
+            .defer("project__search_vector")
+        )
+
+    @staticmethod
+    def comments(user, query, project_id=None):
+        comments = CommentModel.objects.filter(
+            ProjectAccessService.task_visibility(user, prefix="task__")
+        )
+        if project_id is not None:
+            comments = comments.filter(task__project_id=project_id)
+        return (
+            SearchService._ranked(comments, query)
+            .select_related("task", "author")
+            .defer("task__search_vector")
+        )
+
+    @staticmethod
+    def projects(user, query, project_id=None):
+        projects = ProjectsModel.objects.filter(
+            pk__in=ProjectAccessService.project_ids_for(user)
+        )
+        if project_id is not None:
+            projects = projects.filter(pk=project_id)
+        return SearchService._ranked(projects, query)
+
+    @staticmethod
+    def search(*, user, text, kinds=KINDS, project_id=None, limit=10):
+        """
+        Top `limit` matches of each kind, one query per kind.
+        Returns {kind: [instances with .rank]}; empty lists without search words.
+        """
+        query = SearchService.parse(text)
+        results = {}
+        for kind in KINDS:
+            if kind not in kinds:
+                continue
+            if query is None:
+                results[kind] = []
+                continue
+            finder = getattr(SearchService, kind)
+            results[kind] = list(finder(user, query, project_id)[:limit])
+        return results
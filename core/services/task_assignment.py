@@ -0,0 +1,115 @@
+from django.db.models import F, OuterRef, Q, Subquery
+
+from tasks.models import ArchivedTaskAssignment, TaskAssignment, TaskModel
+from core.services.enums import StatusEnum
+
+OPEN_STATUSES = [status.value for status in StatusEnum if status != StatusEnum.DONE]
+
+# Tasks without a status are open too
+OPEN = Q(status__in=OPEN_STATUSES) | Q(status__isnull=True)
+
+# Inbox order: soonest due first, undated (null) last, then by assignment.
+# It matches task_assignment_queue_idx, so pages are read off the index in
+# order; INBOX_NULLS_LAST tells the paginator how due_date sorts
+INBOX_ORDERING = ("due_date", "id")
+INBOX_NULLS_LAST = ("due_date",)
+
+
+class TaskAssignmentService:
+    """
+    Task assignees.
+
+    Every assignee has a TaskAssignment row; the task's assigned_to is its
+    primary assignee and always one of them. Each row carries a copy of its
+    task's status and due date, so a user's work is read from the
+    (user, status, due_date) index without touching the task table. Task
+    writes keep the copies current with a single UPDATE in the caller's
+    transaction.
+    """
+
+    @staticmethod
+    def task_ids_for(user, **filters):
+        """
+        Subquery of the ids of the tasks assigned to `user`. `filters` apply
+        to the assignments, e.g. due_date__lte on the copied due dates.
+        """
+        return TaskAssignment.objects.filter(user=user, **filters).values("task_id")
+
+    @staticmethod
+    def archived_task_ids_for(user):
+        """task_ids_for() over the assignments of archived projects"""
+        return ArchivedTaskAssignment.objects.filter(user=user).values("task_id")
+
+    @staticmethod
+    def inbox(user):
+        """The user's assignments to open tasks, in INBOX_ORDERING"""
+        return (
+            TaskAssignment.objects.filter(OPEN, user=user)
+            .order_by(F("due_date").asc(nulls_last=True), "id")
+            .only("task_id", "status", "due_date")
+        )
+
+    @staticmethod
+    def _assignments(task, user_ids):
+        return [
+            TaskAssignment(
+                task=task, user_id=user_id, status=task.status, due_date=task.due_date
+            )
+            for user_id in user_ids
+        ]
+
+    @staticmethod
+    def tasks_created(tasks):
+        """Assignments for the primary assignees of new tasks, in one INSERT"""
+        assignments = []
+        for task in tasks:
+            if task.assigned_to_id:
+                assignments += TaskAssignmentService._assignments(
+                    task, [task.assigned_to_id]
+                )
+        TaskAssignment.objects.bulk_create(assignments, ignore_conflicts=True)
+
+    @staticmethod
+    def primaries_changed(changes):
+        """
+        For (task, old_assignee_id) pairs whose assigned_to changed: the old
+        primary assignee is replaced by the new one
+        """
+        replaced = Q()
+        for task, old_assignee_id in changes:
+            if old_assignee_id and old_assignee_id != task.assigned_to_id:
+                replaced |= Q(task=task, user_id=old_assignee_id)
+        if replaced:
+            TaskAssignment.objects.filter(replaced).delete()
+        TaskAssignmentService.tasks_created([task for task, _ in changes])
+
+    @staticmethod
+    def sync(tasks):
+        """Copy the tasks' current status and due date onto their assignments"""
+        if not tasks:
+            return
+        task = TaskModel.objects.filter(pk=OuterRef("task_id"))
+        TaskAssignment.objects.filter(task__in=tasks).update(
+            status=Subquery(task.values("status")[:1]),
+            due_date=Subquery(task.values("due_date")[:1]),
+        )
+
+    @staticmethod
+    def replace(task, user_ids):
+        """
+        Make `user_ids` the task's assignees, touching only the difference.
+        Returns (added_ids, removed_ids).
+        """
+        current = set(
+            TaskAssignment.objects.filter(task=task).values_list("user_id", flat=True)
+        )
+        wanted = set(user_ids)
+        added, removed = wanted - current, current - wanted
+
+        if removed:
+            TaskAssignment.objects.filter(task=task, user_id__in=removed).delete()
+        TaskAssignment.objects.bulk_create(
+            TaskAssignmentService._assignments(task, sorted(added)),
+            ignore_conflicts=True,
+        )
+        return sorted(added), sorted(removed)
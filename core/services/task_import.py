@@ -0,0 +1,190 @@
+import codecs
+import csv
+import json
+import os
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from Calendar.models import TaskDeadlineSync
+from tasks.models import TaskModel
+from core.services.audit_service import AuditService
+from core.services.enums import AuditAction, AuditModule
+from core.services.project_generation import ProjectGeneration
+from core.services.project_stats import ProjectStatsService
+from core.services.task_assignment import TaskAssignmentService
+
+FORMATS = ("csv", "ndjson")
+
+# The report keeps the first errors only, so a bad file cannot exhaust memory
+MAX_REPORTED_ERRORS = 1000
+
+
+class TaskImportService:
+    """
+    Streams task rows from a CSV or NDJSON file into a project.
+
+    Rows are read one at a time and validated a batch at a time. Each batch's
+    valid rows go in with one bulk_create in their own transaction, so memory
+    stays flat and a bad row only fails itself. The import writes one summary
+    audit entry (one notification pass) and reports failed rows by number.
+    """
+
+    @staticmethod
+    def detect_format(filename):
+        extension = os.path.splitext(filename or "")[1].lower().lstrip(".")
+        return {"jsonl": "ndjson"}.get(extension, extension)
+
+    @staticmethod
+    def _decode_lines(stream):
+        """The stream's lines as text, decoded one line at a time"""
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        for line in stream:
+            yield decoder.decode(line)
+        yield decoder.decode(b"", final=True)
+
+    @staticmethod
+    def _parse(text, fmt):
+        if fmt == "csv":
+            for row in csv.DictReader(text):
+                # Empty cells mean "not set"
+                yield {key: value for key, value in row.items() if key and value}, None
+            return
+
+        for line in text:
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError as exc:
+                yield None, {"non_field_errors": [f"Invalid JSON: {exc}"]}
+                continue
+            if not isinstance(data, dict):
+                yield None, {"non_field_errors": ["Each line must be a JSON object."]}
+                continue
+            yield data, None
+
+    @staticmethod
+    def read_rows(stream, fmt):
+        """
+        Yield (row_number, data, errors) from a binary stream. Rows are numbered
+        from 1, not counting the CSV header or blank NDJSON lines.
+
+        A row that is not UTF-8 or not parseable as CSV ends the file: it is
+        yielded as the last, failed row, so the rows before it still import.
+        """
+        rows = TaskImportService._parse(TaskImportService._decode_lines(stream), fmt)
+        number = 0
+        try:
+            for number, (data, errors) in enumerate(rows, start=1):
+                yield number, data, errors
+        except (UnicodeDecodeError, csv.Error) as exc:
+            error = f"Unreadable row, the rest of the file was skipped: {exc}"
+            yield number + 1, None, {"non_field_errors": [error]}
+
+    @staticmethod
+    def _fail(report, number, errors):
+        report["failed"] += 1
+        if len(report["errors"]) < MAX_REPORTED_ERRORS:
+            report["errors"].append({"row": number, "errors": errors})
+
+    @staticmethod
+    def _build_batch(*, project, user, batch, serializer_class, report):
+        valid = []
+        for number, data, errors in batch:
+            if errors:
+                TaskImportService._fail(report, number, errors)
+                continue
+            serializer = serializer_class(data=data)
+            if not serializer.is_valid():
+                TaskImportService._fail(report, number, serializer.errors)
+                continue
+            valid.append((number, dict(serializer.validated_data)))
+
+        # One query resolves the batch's assignees
+        assignee_ids = {
+            data["assigned_to"] for _, data in valid if data.get("assigned_to")
+        }
+        known_ids = set(
+            User.objects.filter(pk__in=assignee_ids).values_list("pk", flat=True)
+        )
+
+        tasks = []
+        for number, data in valid:
+            assignee_id = data.pop("assigned_to", None)
+            if assignee_id and assignee_id not in known_ids:
+                TaskImportService._fail(
+                    report, number, {"assigned_to": ["Unknown user."]}
+                )
+                continue
+            tasks.append(
+                TaskModel(
+                    project=project,
+                    created_by=user,
+                    assigned_to_id=assignee_id,
+                    **data,
+                )
+            )
+        return tasks
+
+    @staticmethod
+    @transaction.atomic
+    def _insert(project, tasks):
+        TaskModel.objects.bulk_create(tasks)
+
+        # bulk_create skips post_save; apply what its receivers would have done
+        ProjectStatsService.tasks_created(tasks)
+        TaskDeadlineSync.create_for_new_tasks(tasks)
+        TaskAssignmentService.tasks_created(tasks)
+        ProjectGeneration.bump(project.pk)
+
+    @staticmethod
+    def _audit(project, user, report):
+        AuditService.log(
+            module=AuditModule.TASK,
+            action=AuditAction.CREATED,
+            actor=user,
+            target_type=TaskModel.__name__,
+            target_label=f"{report['created']} tasks",
+            project=project,
+            description=(
+                f'Imported {report["created"]} tasks into "{project.project_name}"'
+            ),
+            metadata={
+                "project_id": project.pk,
+                "project_name": project.project_name,
+                "created": report["created"],
+                "failed": report["failed"],
+                "action_type": "task_imported",
+            },
+        )
+
+    @staticmethod
+    def import_rows(*, project, user, rows, serializer_class, batch_size=None):
+        """
+        Import (row_number, data, errors) rows, validating each with
+        `serializer_class` (assigned_to as a user id).
+        Returns {"created", "failed", "errors"}.
+        """
+        batch_size = batch_size or getattr(settings, "TASK_IMPORT_BATCH_SIZE", 1000)
+        report = {"created": 0, "failed": 0, "errors": []}
+
+        rows = iter(rows)
+        try:
+            while batch := list(islice(rows, batch_size)):
+                tasks = TaskImportService._build_batch(
+                    project=project,
+                    user=user,
+                    batch=batch,
+                    serializer_class=serializer_class,
+                    report=report,
+                )
+                if tasks:
+                    TaskImportService._insert(project, tasks)
+                    report["created"] += len(tasks)
+        finally:
+            # Committed batches stay, so the import is recorded even if it fails
+            TaskImportService._audit(project, user, report)
+        return report
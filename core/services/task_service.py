@@ -1,12 +1,25 @@
+from collections import defaultdict
+
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
 
+from Calendar.models import TaskDeadlineSync
 from tasks.models import TaskModel, CommentModel, TaskHistoryModel
 from projects.models import ProjectsModel
 from core.services.audit_service import AuditService
-from .enums import TaskFieldEnum, AuditModule
+from core.services.project_generation import ProjectGeneration
+from core.services.project_stats import ProjectStatsService
+from core.services.task_assignment import TaskAssignmentService
+from core.services.task_tree import TaskTreeService
+from core.services.versioning import VersionConflict, refresh_row, versioned_update
+from .enums import TaskFieldEnum, AuditAction, AuditModule
 
 
 class TaskService:
+    # Task writes run in a transaction so the ProjectStats counters
+    # commit or roll back with them.
+
     TRACKED_FIELDS = {
         "status": TaskFieldEnum.STATUS,
         "priority": TaskFieldEnum.PRIORITY,
@@ -34,23 +47,101 @@ class TaskService:
         return str(value)
 
     @staticmethod
-    def _record_change(*, task, changed_by, field_enum, old_value, new_value):
-        TaskHistoryModel.objects.create(
-            task=task,
-            changed_by=changed_by,
-            field_changed=field_enum,
-            old_value=old_value,
-            new_value=new_value,
+    def _write_changes(*, task, user, data, version=None):
+        """
+        Unit of work behind the single-task writes; call inside
+        transaction.atomic. The changed columns go out in one conditional
+        UPDATE guarded by the task's version, so writers never wait on a lock
+        and never silently overwrite each other: with `version` (what the
+        client read) a lost race raises VersionConflict, without it the diff
+        is redone against the fresh row. History rows go in with one
+        bulk_create. Returns {field: {"old": ..., "new": ...}} for the tracked
+        fields.
+
+        The project is fixed: stats, rollups, paths and generations are only
+        kept for the task's own project, so moving a task between projects
+        raises ValueError.
+        """
+        if {"project", "project_id"} & data.keys():
+            raise ValueError("A task cannot be moved to another project")
+        if version is not None and task.version != version:
+            refresh_row(task)
+
+        while True:
+            if version is not None and task.version != version:
+                raise VersionConflict(task)
+            old_status, old_due_date = task.status, task.due_date
+            old_estimate = task.estimate_hours
+            old_assignee_id = task.assigned_to_id
+
+            history, changed_fields, update_fields = [], {}, []
+            for field, new_val in data.items():
+                if field in TaskService.TRACKED_FIELDS:
+                    old_serialized = TaskService._serialize_value(
+                        field, getattr(task, field)
+                    )
+                    new_serialized = TaskService._serialize_value(field, new_val)
+                    if old_serialized == new_serialized:
+                        continue
+
+                    history.append(
+                        TaskHistoryModel(
+                            task=task,
+                            changed_by=user,
+                            field_changed=TaskService.TRACKED_FIELDS[field],
+                            old_value=old_serialized,
+                            new_value=new_serialized,
+                        )
+                    )
+                    changed_fields[field] = {
+                        "old": old_serialized,
+                        "new": new_serialized,
+                    }
+
+                setattr(task, field, new_val)
+                update_fields.append(field)
+
+            if not update_fields:
+                return changed_fields
+            if versioned_update(task, update_fields):
+                break
+            # Another write landed since `task` was read
+            refresh_row(task)
+
+        TaskHistoryModel.objects.bulk_create(history)
+        if "status" in changed_fields or "due_date" in changed_fields:
+            ProjectStatsService.task_changed(
+                task, old_status=old_status, old_due_date=old_due_date
+            )
+        TaskTreeService.task_changed(
+            task, old_status=old_status, old_estimate=old_estimate
         )
+        if "assigned_to" in changed_fields:
+            TaskAssignmentService.primaries_changed([(task, old_assignee_id)])
+        if "status" in changed_fields or "due_date" in changed_fields:
+            TaskAssignmentService.sync([task])
+
+        # The UPDATE skips post_save; apply what its receivers would have done
+        ProjectGeneration.bump(task.project_id)
+        TaskService._sync_deadlines([task])
+        return changed_fields
 
     @staticmethod
+    @transaction.atomic
     def create_task(*, user, project_id, data):
+        """
+        Create a task, as a subtask when data has a `parent`.
+        Raises ValueError when the parent cannot take it.
+        """
+        data = dict(data)
+        parent = data.pop("parent", None)
         project = ProjectsModel.objects.get(id=project_id)
-        task = TaskModel.objects.create(
-            project=project,
-            created_by=user,
-            **data,
-        )
+        task = TaskModel(project=project, created_by=user, **data)
+        TaskTreeService.place(task, parent)
+        task.save()
+        ProjectStatsService.task_created(task)
+        TaskTreeService.task_created(task)
+        TaskAssignmentService.tasks_created([task])
 
         AuditService.created(
             module=AuditModule.TASK,
@@ -66,45 +157,24 @@ class TaskService:
                 "due_date": str(task.due_date) if task.due_date else "",
                 "project_id": project.pk,
                 "project_name": project.project_name,
+                "parent_id": task.parent_id,
             },
         )
 
         return task
 
     @staticmethod
-    def update_task(*, user, task_id, data):
+    @transaction.atomic
+    def update_task(*, user, task, data, version=None):
         """
         Generic audited update for all tracked task fields.
-        Expects validated serializer data.
+        Expects validated serializer data and the task as loaded by the view,
+        which is returned updated in place. Raises VersionConflict when
+        `version` is given and the task has moved past it.
         """
-        task = TaskModel.objects.select_related("project").get(id=task_id)
-        changed_fields = {}
-
-        for field, new_val in data.items():
-            if field not in TaskService.TRACKED_FIELDS:
-                setattr(task, field, new_val)
-                continue
-
-            old_val = getattr(task, field)
-            old_serialized = TaskService._serialize_value(field, old_val)
-            new_serialized = TaskService._serialize_value(field, new_val)
-
-            if old_serialized != new_serialized:
-                TaskService._record_change(
-                    task=task,
-                    changed_by=user,
-                    field_enum=TaskService.TRACKED_FIELDS[field],
-                    old_value=old_serialized,
-                    new_value=new_serialized,
-                )
-                changed_fields[field] = {
-                    "old": old_serialized,
-                    "new": new_serialized,
-                }
-
-            setattr(task, field, new_val)
-
-        task.save()
+        changed_fields = TaskService._write_changes(
+            task=task, user=user, data=data, version=version
+        )
 
         if changed_fields:
             status_change = changed_fields.get("status", {})
@@ -131,28 +201,148 @@ class TaskService:
 
         return task
 
+    # Fields the bulk endpoint may change
+    BULK_FIELDS = ("status", "priority", "assigned_to", "due_date")
+
+    # Changes that the Calendar deadline sync copies onto the task's event
+    CALENDAR_FIELDS = {"priority", "assigned_to", "due_date"}
+
     @staticmethod
-    def assign_task(*, altered_by, task_id, assigned_to_id):
-        task = TaskModel.objects.select_related("project", "assigned_to").get(
-            id=task_id
+    @transaction.atomic
+    def bulk_update(*, user, tasks, data):
+        """
+        Apply the same tracked-field changes to many tasks in a fixed number of
+        queries. Rows are locked once (in id order) and written with one
+        bulk_update; history rows go in with one bulk_create and each project
+        in the batch gets a single audit entry. Returns (updated_tasks,
+        unchanged_ids).
+        """
+        now = timezone.now()
+        locked = list(
+            tasks.select_for_update(of=("self",))
+            .select_related("project", "assigned_to")
+            .order_by("pk")
         )
 
+        history, stats_changes, updated, unchanged_ids = [], [], [], []
+        tree_changes, assignee_changes = [], []
+        changed_fields = set()
+        for task in locked:
+            old_status, old_due_date = task.status, task.due_date
+            old_assignee_id = task.assigned_to_id
+            task_changes = set()
+            for field, new_val in data.items():
+                old_serialized = TaskService._serialize_value(
+                    field, getattr(task, field)
+                )
+                new_serialized = TaskService._serialize_value(field, new_val)
+                if old_serialized == new_serialized:
+                    continue
+
+                history.append(
+                    TaskHistoryModel(
+                        task=task,
+                        changed_by=user,
+                        field_changed=TaskService.TRACKED_FIELDS[field],
+                        old_value=old_serialized,
+                        new_value=new_serialized,
+                        timestamp=now,
+                    )
+                )
+                setattr(task, field, new_val)
+                task_changes.add(field)
+
+            if not task_changes:
+                unchanged_ids.append(task.pk)
+                continue
+
+            # bulk_update does not apply auto_now; the rows are locked, so the
+            # versions can be bumped in Python
+            task.updated_at = now
+            task.version += 1
+            changed_fields |= task_changes
+            updated.append(task)
+            stats_changes.append((task, old_status, old_due_date))
+            if task.path:
+                tree_changes.append((task, old_status, task.estimate_hours))
+            if "assigned_to" in task_changes:
+                assignee_changes.append((task, old_assignee_id))
+
+        if not updated:
+            return [], unchanged_ids
+
+        TaskModel.objects.bulk_update(
+            updated,
+            [*sorted(changed_fields), "updated_at", "version"],
+            batch_size=500,
+        )
+        TaskHistoryModel.objects.bulk_create(history, batch_size=500)
+        ProjectStatsService.tasks_changed(stats_changes)
+        TaskTreeService.tasks_changed(tree_changes)
+        TaskAssignmentService.primaries_changed(assignee_changes)
+        if changed_fields & {"status", "due_date"}:
+            TaskAssignmentService.sync(updated)
+
+        # bulk_update skips post_save; apply what its receivers would have done
+        project_ids = {task.project_id for task in updated}
+        ProjectGeneration.bump(*project_ids)
+        if changed_fields & TaskService.CALENDAR_FIELDS:
+            TaskService._sync_deadlines(updated)
+
+        # One entry per project, so notifications stay scoped to its members
+        changes = {
+            field: TaskService._serialize_value(field, data[field])
+            for field in sorted(changed_fields)
+        }
+        by_project = defaultdict(list)
+        for task in updated:
+            by_project[task.project].append(task.pk)
+        for project, task_ids in by_project.items():
+            AuditService.log(
+                module=AuditModule.TASK,
+                action=AuditAction.UPDATED,
+                actor=user,
+                target_type=TaskModel.__name__,
+                target_label=f"{len(task_ids)} tasks",
+                project=project,
+                description=(
+                    f'Updated {len(task_ids)} tasks in "{project.project_name}"'
+                ),
+                metadata={
+                    "task_ids": task_ids,
+                    "project_id": project.pk,
+                    "project_name": project.project_name,
+                    "changes": changes,
+                    "action_type": "task_bulk_updated",
+                },
+            )
+        return updated, unchanged_ids
+
+    @staticmethod
+    def _sync_deadlines(tasks):
+        for task in tasks:
+            if task.due_date and task.assigned_to:
+                sync, _ = TaskDeadlineSync.objects.get_or_create(
+                    task=task, defaults={"auto_sync_enabled": True}
+                )
+                if sync.auto_sync_enabled:
+                    sync.sync_to_calendar()
+
+    @staticmethod
+    @transaction.atomic
+    def assign_task(*, altered_by, task, assigned_to_id, version=None):
         new_user = None
         if assigned_to_id is not None:
-            new_user = User.objects.get(id=assigned_to_id)
-
-        old_serialized = TaskService._serialize_value("assigned_to", task.assigned_to)
-        new_serialized = TaskService._serialize_value("assigned_to", new_user)
-
-        if old_serialized != new_serialized:
-            TaskService._record_change(
-                task=task,
-                changed_by=altered_by,
-                field_enum=TaskFieldEnum.ASSIGNED_TO,
-                old_value=old_serialized,
-                new_value=new_serialized,
-            )
+            new_user = User.objects.select_related("profile").get(id=assigned_to_id)
 
+        changed_fields = TaskService._write_changes(
+            task=task,
+            user=altered_by,
+            data={"assigned_to": new_user},
+            version=version,
+        )
+
+        if changed_fields:
             AuditService.updated(
                 module=AuditModule.TASK,
                 actor=altered_by,
@@ -164,35 +354,57 @@ class TaskService:
                     "task_title": task.title,
                     "project_id": task.project.pk if task.project else None,
                     "project_name": task.project.project_name if task.project else "",
-                    "changes": {
-                        "assigned_to": {
-                            "old": old_serialized,
-                            "new": new_serialized,
-                        }
-                    },
+                    "changes": changed_fields,
                     "assigned_to_id": new_user.pk if new_user else None,
                 },
             )
 
-        task.assigned_to = new_user
-        task.save()
         return task
 
     @staticmethod
-    def update_task_status(*, user, task_id, status):
-        task = TaskModel.objects.select_related("project").get(id=task_id)
-        old_serialized = TaskService._serialize_value("status", task.status)
-        new_serialized = TaskService._serialize_value("status", status)
-
-        if old_serialized != new_serialized:
-            TaskService._record_change(
-                task=task,
-                changed_by=user,
-                field_enum=TaskFieldEnum.STATUS,
-                old_value=old_serialized,
-                new_value=new_serialized,
+    @transaction.atomic
+    def set_assignees(*, user, task, assignees):
+        """
+        Make `assignees` (users, primary first) the task's assignees. The
+        current primary assignee stays primary while still listed; otherwise
+        the first listed user takes over. Returns (added_ids, removed_ids).
+        """
+        added, removed = TaskAssignmentService.replace(
+            task, [assignee.pk for assignee in assignees]
+        )
+
+        if task.assigned_to not in assignees:
+            primary = assignees[0] if assignees else None
+            TaskService._write_changes(
+                task=task, user=user, data={"assigned_to": primary}
             )
 
+        if added or removed:
+            ProjectGeneration.bump(task.project_id)
+            AuditService.updated(
+                module=AuditModule.TASK,
+                actor=user,
+                target=task,
+                project=task.project,
+                description=f'Updated assignees of task "{task.title}"',
+                metadata={
+                    "task_id": task.pk,
+                    "task_title": task.title,
+                    "project_id": task.project_id,
+                    "project_name": task.project.project_name if task.project else "",
+                    "changes": {"assignees": {"added": added, "removed": removed}},
+                },
+            )
+        return added, removed
+
+    @staticmethod
+    @transaction.atomic
+    def update_task_status(*, user, task, status, version=None):
+        changed_fields = TaskService._write_changes(
+            task=task, user=user, data={"status": status}, version=version
+        )
+
+        if changed_fields:
             AuditService.updated(
                 module=AuditModule.TASK,
                 actor=user,
@@ -200,7 +412,7 @@ class TaskService:
                 project=task.project,
                 description=(
                     f'Completed task "{task.title}"'
-                    if str(new_serialized).upper() == "DONE"
+                    if str(changed_fields["status"]["new"]).upper() == "DONE"
                     else f'Updated task "{task.title}"'
                 ),
                 metadata={
@@ -208,36 +420,71 @@ class TaskService:
                     "task_title": task.title,
                     "project_id": task.project.pk,
                     "project_name": task.project.project_name if task.project else "",
-                    "changes": {
-                        "status": {
-                            "old": old_serialized,
-                            "new": new_serialized,
-                        }
-                    },
+                    "changes": changed_fields,
                 },
             )
 
-        task.status = status
-        task.save()
         return task
 
     @staticmethod
-    def update_task_priority(*, user, task_id, priority):
-        task = TaskModel.objects.get(id=task_id)
-        old_serialized = TaskService._serialize_value("priority", task.priority)
-        new_serialized = TaskService._serialize_value("priority", priority)
-
-        if old_serialized != new_serialized:
-            TaskService._record_change(
-                task=task,
-                changed_by=user,
-                field_enum=TaskFieldEnum.PRIORITY,
-                old_value=old_serialized,
-                new_value=new_serialized,
+    @transaction.atomic
+    def delete_task(*, task):
+        """Delete the task and, through the parent cascade, its subtasks"""
+        subtasks = list(
+            TaskTreeService.descendants(task).only(
+                "id", "project_id", "status", "due_date", "estimate_hours"
             )
+        )
+        task.delete()
+        ProjectStatsService.tasks_deleted([task, *subtasks])
+        TaskTreeService.task_deleted(task, subtasks)
 
-        task.priority = priority
-        task.save()
+    @staticmethod
+    @transaction.atomic
+    def move_task(*, user, task, parent, version=None):
+        """
+        Move the task and its subtasks under `parent` (None for top level).
+        Raises ValueError when the parent cannot take it, and VersionConflict
+        when `version` is given and the task has moved past it.
+        """
+        # Locked for the whole move, so its subtree and rollups move with it
+        TaskModel.objects.select_for_update().filter(pk=task.pk).values("pk").get()
+        refresh_row(task)
+        if version is not None and task.version != version:
+            raise VersionConflict(task)
+
+        old_parent_id = task.parent_id
+        new_parent_id = parent.pk if parent else None
+        if old_parent_id == new_parent_id:
+            return task
+
+        versioned_update(task, TaskTreeService.move(task, parent))
+        ProjectGeneration.bump(task.project_id)
+
+        AuditService.updated(
+            module=AuditModule.TASK,
+            actor=user,
+            target=task,
+            project=task.project,
+            description=f'Moved task "{task.title}"',
+            metadata={
+                "task_id": task.pk,
+                "task_title": task.title,
+                "project_id": task.project_id,
+                "project_name": task.project.project_name if task.project else "",
+                "changes": {
+                    "parent": {"old": old_parent_id, "new": new_parent_id},
+                },
+            },
+        )
+        return task
+
+    @staticmethod
+    @transaction.atomic
+    def update_task_priority(*, user, task, priority, version=None):
+        TaskService._write_changes(
+            task=task, user=user, data={"priority": priority}, version=version
+        )
         return task
 
 
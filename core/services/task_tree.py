@@ -0,0 +1,279 @@
+from collections import Counter, defaultdict
+from decimal import Decimal
+
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Greatest, Length, Replace, Substr
+
+from tasks.models import TaskModel
+from core.services.enums import StatusEnum
+
+# Levels below a top-level task; keeps paths well inside their column
+MAX_DEPTH = 10
+
+ROLLUP_FIELDS = (
+    "descendant_count",
+    "descendant_done_count",
+    "descendant_estimate_hours",
+)
+
+
+def ancestor_ids(path):
+    """Ancestor ids of a materialized path, root first"""
+    return [int(pk) for pk in path.split("/") if pk]
+
+
+class TaskTreeService:
+    """
+    Parent/child tasks stored as a materialized path.
+
+    A task's path lists its ancestors' ids, so a subtree is one indexed
+    prefix match and the ancestors are known without a query. Each task
+    carries rollups over its descendants (count, done count, estimate), and
+    every write applies its delta to the ancestors with a single F-expression
+    UPDATE, so reading a subtree's progress is reading one row.
+    `rebuild` recounts the rollups and is the repair path (see the
+    rebuild_task_rollups command).
+    """
+
+    @staticmethod
+    def subtree_prefix(task):
+        """Path prefix shared by all of `task`'s descendants"""
+        return f"{task.path}{task.pk}/"
+
+    @staticmethod
+    def descendants(task):
+        return TaskModel.objects.filter(
+            path__startswith=TaskTreeService.subtree_prefix(task)
+        )
+
+    @staticmethod
+    def place(task, parent):
+        """Set the parent and path of a task about to be inserted"""
+        if parent is None:
+            task.parent, task.path = None, ""
+            return
+
+        # Locked so a concurrent move cannot change the path being copied
+        parent = (
+            TaskModel.objects.select_for_update()
+            .only("id", "project_id", "path")
+            .get(pk=parent.pk)
+        )
+        if parent.project_id != task.project_id:
+            raise ValueError("A subtask must belong to its parent's project")
+        path = TaskTreeService.subtree_prefix(parent)
+        if len(ancestor_ids(path)) > MAX_DEPTH:
+            raise ValueError(f"Tasks can be nested at most {MAX_DEPTH} levels deep")
+        task.parent, task.path = parent, path
+
+    # Rollups
+
+    @staticmethod
+    def _is_done(status):
+        return 1 if status and str(status) == StatusEnum.DONE.value else 0
+
+    @staticmethod
+    def contribution(task):
+        """What `task` and its descendants add to each ancestor's rollups"""
+        return {
+            "descendant_count": 1 + task.descendant_count,
+            "descendant_done_count": TaskTreeService._is_done(task.status)
+            + task.descendant_done_count,
+            "descendant_estimate_hours": (task.estimate_hours or 0)
+            + task.descendant_estimate_hours,
+        }
+
+    @staticmethod
+    def rollup(task):
+        """Progress of the subtree rooted at `task`, from its own row"""
+        tasks = 1 + task.descendant_count
+        done = TaskTreeService._is_done(task.status) + task.descendant_done_count
+        return {
+            "tasks": tasks,
+            "done": done,
+            "estimate_hours": (task.estimate_hours or 0)
+            + task.descendant_estimate_hours,
+            "progress_pct": round(done * 100 / tasks),
+        }
+
+    @staticmethod
+    def _apply(task_ids, delta, sign=1):
+        delta = {field: sign * value for field, value in delta.items() if value}
+        if not task_ids or not delta:
+            return
+        TaskModel.objects.filter(pk__in=task_ids).update(
+            # Clamped so a drifted rollup can never go negative
+            **{
+                field: Greatest(
+                    F(field) + value,
+                    Value(0),
+                    output_field=TaskModel._meta.get_field(field),
+                )
+                for field, value in delta.items()
+            }
+        )
+
+    @staticmethod
+    def task_created(task):
+        TaskTreeService._apply(
+            ancestor_ids(task.path), TaskTreeService.contribution(task)
+        )
+
+    @staticmethod
+    def _change_delta(task, old_status, old_estimate):
+        return {
+            "descendant_done_count": TaskTreeService._is_done(task.status)
+            - TaskTreeService._is_done(old_status),
+            "descendant_estimate_hours": (task.estimate_hours or 0)
+            - (old_estimate or 0),
+        }
+
+    @staticmethod
+    def task_changed(task, *, old_status, old_estimate):
+        TaskTreeService._apply(
+            ancestor_ids(task.path),
+            TaskTreeService._change_delta(task, old_status, old_estimate),
+        )
+
+    @staticmethod
+    def tasks_changed(changes):
+        """
+        Batch form of task_changed for (task, old_status, old_estimate)
+        tuples, with one UPDATE per distinct delta
+        """
+        deltas = defaultdict(Counter)
+        for task, old_status, old_estimate in changes:
+            delta = TaskTreeService._change_delta(task, old_status, old_estimate)
+            for ancestor_id in ancestor_ids(task.path):
+                deltas[ancestor_id].update(delta)
+
+        by_delta = defaultdict(list)
+        for ancestor_id, delta in deltas.items():
+            by_delta[tuple(sorted(delta.items()))].append(ancestor_id)
+        for delta, ids in by_delta.items():
+            TaskTreeService._apply(ids, dict(delta))
+
+    @staticmethod
+    def _own_contribution(task):
+        return {
+            "descendant_count": 1,
+            "descendant_done_count": TaskTreeService._is_done(task.status),
+            "descendant_estimate_hours": task.estimate_hours or 0,
+        }
+
+    @staticmethod
+    def task_deleted(task, descendants):
+        """
+        Take a deleted task and its deleted `descendants` (as loaded before
+        the delete) out of the remaining ancestors' rollups
+        """
+        delta = Counter()
+        for node in (task, *descendants):
+            delta.update(TaskTreeService._own_contribution(node))
+        TaskTreeService._apply(ancestor_ids(task.path), delta, sign=-1)
+
+    @staticmethod
+    def move(task, parent):
+        """
+        Move `task` and its subtree under `parent` (None for top level).
+        Call inside transaction.atomic with `task` freshly read and locked.
+        Rewrites the subtree's paths with one UPDATE and moves the task's
+        contribution from the old ancestors to the new ones. Returns the
+        fields of `task` to write.
+        """
+        prefix = TaskTreeService.subtree_prefix(task)
+        old_path = task.path
+
+        # Lock the subtree so nothing is added under it mid-move; place()
+        # locks the new parent
+        descendant_paths = list(
+            TaskTreeService.descendants(task)
+            .select_for_update()
+            .values_list("path", flat=True)
+        )
+        TaskTreeService.place(task, parent)
+        if task.path.startswith(prefix):
+            raise ValueError("A task cannot be moved under its own subtree")
+
+        # Levels the subtree spans below the task
+        height = max(
+            (
+                len(ancestor_ids(path)) - len(ancestor_ids(prefix)) + 1
+                for path in descendant_paths
+            ),
+            default=0,
+        )
+        if len(ancestor_ids(task.path)) + height > MAX_DEPTH:
+            raise ValueError(f"Tasks can be nested at most {MAX_DEPTH} levels deep")
+
+        if descendant_paths and task.path != old_path:
+            new_prefix = TaskTreeService.subtree_prefix(task)
+            # Bump the versions too, so a descendant's optimistic write that
+            # read the old path conflicts and retries with the new one
+            TaskModel.objects.filter(path__startswith=prefix).update(
+                path=Concat(Value(new_prefix), Substr("path", len(prefix) + 1)),
+                version=F("version") + 1,
+            )
+
+        contribution = TaskTreeService.contribution(task)
+        TaskTreeService._apply(ancestor_ids(old_path), contribution, sign=-1)
+        TaskTreeService._apply(ancestor_ids(task.path), contribution)
+        return ["parent", "path"]
+
+    # Reads
+
+    @staticmethod
+    def subtree(task, *, depth=None, queryset=None):
+        """
+        `task` with its descendants attached as nested `children` lists, in
+        one query. `depth` limits how many levels below `task` are loaded.
+        """
+        prefix = TaskTreeService.subtree_prefix(task)
+        tasks = (queryset if queryset is not None else TaskModel.objects).filter(
+            path__startswith=prefix
+        )
+        if depth is not None:
+            # Levels below `task`: the number of ids the path adds to the prefix
+            levels = Length("path") - Length(Replace("path", Value("/"), Value("")))
+            tasks = tasks.alias(levels=levels).filter(
+                levels__lte=len(ancestor_ids(prefix)) + depth - 1
+            )
+
+        nodes = {task.pk: task}
+        task.children = []
+        for node in tasks.order_by("path", "id"):
+            node.children = []
+            nodes[node.pk] = node
+        for node in nodes.values():
+            if node is not task and node.parent_id in nodes:
+                nodes[node.parent_id].children.append(node)
+        return task
+
+    @staticmethod
+    def rebuild(project_ids=None):
+        """
+        Recount the rollups of the given projects' tasks (all by default) from
+        their paths. Returns the number of tasks written.
+        """
+        tasks = TaskModel.objects.only(
+            "id", "path", "status", "estimate_hours", *ROLLUP_FIELDS
+        )
+        if project_ids is not None:
+            tasks = tasks.filter(project_id__in=project_ids)
+        tasks = list(tasks)
+
+        rollups = defaultdict(Counter)
+        for task in tasks:
+            own = TaskTreeService._own_contribution(task)
+            for ancestor_id in ancestor_ids(task.path):
+                rollups[ancestor_id].update(own)
+
+        for task in tasks:
+            counts = rollups.get(task.pk, {})
+            task.descendant_count = counts.get("descendant_count", 0)
+            task.descendant_done_count = counts.get("descendant_done_count", 0)
+            task.descendant_estimate_hours = counts.get(
+                "descendant_estimate_hours", Decimal(0)
+            )
+        TaskModel.objects.bulk_update(tasks, ROLLUP_FIELDS, batch_size=1000)
+        return len(tasks)
@@ -0,0 +1,98 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from projects.models import ProjectMembers
+from core.services.enums import RoleEnum
+from core.services.presence import PresenceService, presence_buffer
+from core.services.project_generation import ProjectGeneration
+
+# TeamStatsSerializer field for each project role
+ROLE_FIELDS = {
+    "admins": RoleEnum.ADMIN,
+    "project_managers": RoleEnum.PROJECT_MANAGER,
+    "developers": RoleEnum.DEVELOPER,
+    "guests": RoleEnum.GUEST,
+}
+
+# Generation shared by every project, for stats that span several projects
+ALL_PROJECTS = "team:all"
+
+
+class TeamStatsService:
+    """
+    Team sidebar statistics, one conditional-aggregate query each.
+
+    Results are cached under a membership generation that core signals bump on
+    every membership change, so role counts are never stale. The generations
+    are Generation rows bumped in the writer's transaction (see
+    ProjectGeneration), so every worker sees a bump, whatever the cache
+    backend. Online counts are kept for at most TEAM_STATS_CACHE_TIMEOUT
+    seconds.
+    """
+
+    @staticmethod
+    def _timeout():
+        return getattr(settings, "TEAM_STATS_CACHE_TIMEOUT", 30)
+
+    @staticmethod
+    def _scope(project_id):
+        return f"team:{project_id}"
+
+    @classmethod
+    def get_generation(cls, scope):
+        return ProjectGeneration.get(scope)
+
+    @classmethod
+    def invalidate(cls, *project_ids):
+        """
+        Bump the generation of each project and of the cross-project stats,
+        within the caller's transaction
+        """
+        ProjectGeneration.bump(*map(cls._scope, project_ids), ALL_PROJECTS)
+
+    @staticmethod
+    def _online_filter():
+        # Activity this worker has not flushed yet counts as online too
+        return Q(
+            project_member__profile__last_seen__gte=PresenceService.online_since()
+        ) | Q(project_member_id__in=presence_buffer.pending_user_ids())
+
+    @classmethod
+    def for_project(cls, project):
+        generation = cls.get_generation(cls._scope(project.pk))
+        key = f"team_stats:project:{project.pk}:{generation}"
+        stats = cache.get(key)
+        if stats is None:
+            stats = ProjectMembers.objects.filter(project=project).aggregate(
+                total_members=Count("id"),
+                online_members=Count("id", filter=cls._online_filter()),
+                **{
+                    field: Count("id", filter=Q(role_in_project=role))
+                    for field, role in ROLE_FIELDS.items()
+                },
+            )
+            cache.set(key, stats, cls._timeout())
+        return stats
+
+    @classmethod
+    def for_user(cls, user):
+        """Members across the user's projects (every project for staff)"""
+        scope = ALL_PROJECTS if user.is_staff else f"user:{user.pk}"
+        key = f"team_stats:{scope}:{cls.get_generation(ALL_PROJECTS)}"
+        stats = cache.get(key)
+        if stats is None:
+            memberships = ProjectMembers.objects.all()
+            if not user.is_staff:
+                memberships = memberships.filter(
+                    project_id__in=user.project_memberships.values("project_id")
+                )
+            stats = memberships.aggregate(
+                total_members=Count("project_member", distinct=True),
+                online_members=Count(
+                    "project_member", distinct=True, filter=cls._online_filter()
+                ),
+                admin_members=Count("id", filter=Q(role_in_project=RoleEnum.ADMIN)),
+            )
+            cache.set(key, stats, cls._timeout())
+        return stats
@@ -0,0 +1,165 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives, rare false positives)"""
+
+    def __init__(self, size_bits, hash_count):
+        self.size_bits = size_bits
+        self.hash_count = hash_count
+        self.bits = bytearray((size_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        # Double hashing: derive every position from two 64-bit halves of one digest
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size_bits for i in range(self.hash_count)]
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+
+class BlacklistCache:
+    """
+    Per-process memory of blacklisted jtis, in front of the token_blacklist tables.
+
+    - The LRU holds recently blacklisted jtis and answers "blacklisted" exactly.
+    - The Bloom filter remembers every jti this process saw blacklisted, even after
+      LRU eviction. A miss means this process never saw it blacklisted, which is
+      NOT proof for tokens blacklisted by other workers, so callers only skip the
+      database on a miss when a later atomic write catches reuse anyway.
+    """
+
+    def __init__(self, max_entries, bloom_bits, bloom_hashes):
+        self.max_entries = max_entries
+        self.bloom_bits = bloom_bits
+        self.bloom_hashes = bloom_hashes
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self._recent = OrderedDict()
+        self._bloom = BloomFilter(self.bloom_bits, self.bloom_hashes)
+
+    def add(self, jti):
+        with self._lock:
+            self._recent[jti] = True
+            self._recent.move_to_end(jti)
+            if len(self._recent) > self.max_entries:
+                self._recent.popitem(last=False)
+
+            # Past ~1 entry per 10 bits the false positive rate climbs quickly;
+            # start over from the LRU contents
+            if self._bloom.count * 10 >= self.bloom_bits:
+                self._bloom = BloomFilter(self.bloom_bits, self.bloom_hashes)
+                for recent_jti in self._recent:
+                    self._bloom.add(recent_jti)
+            else:
+                self._bloom.add(jti)
+
+    def is_blacklisted(self, jti):
+        with self._lock:
+            if jti in self._recent:
+                self._recent.move_to_end(jti)
+                return True
+            return False
+
+    def might_be_blacklisted(self, jti):
+        with self._lock:
+            return jti in self._bloom
+
+
+blacklist_cache = BlacklistCache(
+    max_entries=getattr(settings, "TOKEN_BLACKLIST_CACHE_SIZE", 10_000),
+    bloom_bits=getattr(settings, "TOKEN_BLACKLIST_BLOOM_BITS", 1 << 20),
+    bloom_hashes=getattr(settings, "TOKEN_BLACKLIST_BLOOM_HASHES", 7),
+)
+
+
+class CachedRefreshToken(RefreshToken):
+    """
+    Refresh token whose blacklist check goes through the in-process cache.
+
+    Known blacklisted jtis are rejected without a query. Everything else is
+    checked against the database unless `defer_blacklist_check` is set, which
+    callers only do when they blacklist the token right after verifying it.
+    """
+
+    defer_blacklist_check = False
+
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+
+        if blacklist_cache.is_blacklisted(jti):
+            raise TokenError(_("Token is blacklisted"))
+
+        if self.defer_blacklist_check and not blacklist_cache.might_be_blacklisted(jti):
+            return
+
+        try:
+            super().check_blacklist()
+        except TokenError:
+            blacklist_cache.add(jti)
+            raise
+
+    def _outstanding_token(self, user):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        return OutstandingToken.objects.get_or_create(
+            jti=jti,
+            defaults={
+                "user": user,
+                "created_at": self.current_time,
+                "token": str(self),
+                "expires_at": datetime_from_epoch(self.payload["exp"]),
+            },
+        )
+
+    def blacklist(self, user=None):
+        """
+        Blacklist the token, returning (BlacklistedToken, created).
+        `created` is False when the token was already blacklisted, which makes
+        this the race-free reuse check for rotated refresh tokens.
+        Pass the already loaded user to avoid looking it up again.
+        """
+        if user is None:
+            result = super().blacklist()
+        else:
+            token, _created = self._outstanding_token(user)
+            result = BlacklistedToken.objects.get_or_create(token=token)
+
+        blacklist_cache.add(self.payload[api_settings.JTI_CLAIM])
+        return result
+
+    def outstand(self, user=None):
+        if user is None:
+            return super().outstand()
+        return self._outstanding_token(user)
+
+
+class RotatingRefreshToken(CachedRefreshToken):
+    """Used by the refresh endpoint, which always blacklists the token it rotates"""
+
+    defer_blacklist_check = True
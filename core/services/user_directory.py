@@ -0,0 +1,146 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Case, Exists, OuterRef, Q, Value, When
+from django.db.models.functions import Greatest, Upper
+
+from projects.models import ProjectMembers
+from core.services.project_generation import USERS, ProjectGeneration
+
+# Columns the directory matches, each with a trigram index on UPPER(column)
+# (accounts migration 0010)
+DIRECTORY_FIELDS = ("username", "first_name", "last_name", "email")
+
+# Longer queries are cut to their first words
+MAX_WORDS = 3
+
+
+class UserDirectoryService:
+    """
+    People search for autocomplete and invite dialogs.
+
+    Every word of the query has to start one of the user's names or email;
+    with pg_trgm installed a close misspelling matches too. Matching runs on
+    the trigram indexes, so it does not scan the user table. Ranked results
+    are cached per query under the users generation, so a user change is
+    visible at once and the cache only absorbs repeated keystrokes.
+    """
+
+    _trigram_enabled = None
+
+    @classmethod
+    def trigram_enabled(cls):
+        """Whether pg_trgm is installed; checked once per process"""
+        if cls._trigram_enabled is None:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                cls._trigram_enabled = cursor.fetchone() is not None
+        return cls._trigram_enabled
+
+    @staticmethod
+    def _words(text):
+        return (text or "").split()[:MAX_WORDS]
+
+    @staticmethod
+    def _word_prefix_match(word, prefix=""):
+        match = Q()
+        for field in DIRECTORY_FIELDS:
+            match |= Q(**{f"{prefix}{field}__istartswith": word})
+        return match
+
+    @classmethod
+    def prefix_match(cls, text, prefix=""):
+        """
+        Q requiring every word of `text` to start a name or the email.
+        `prefix` points it at a related user (e.g. "project_member__").
+        """
+        match = Q()
+        for word in cls._words(text):
+            match &= cls._word_prefix_match(word, prefix)
+        return match
+
+    @staticmethod
+    def _fuzzy_match(word):
+        match = Q()
+        for field in DIRECTORY_FIELDS:
+            # The annotated UPPER(column) matches the index expression
+            match |= Q(**{f"{field}_upper__trigram_word_similar": word.upper()})
+        return match
+
+    @classmethod
+    def _ranked(cls, words):
+        users = User.objects.filter(is_active=True)
+        prefix_match = cls.prefix_match(" ".join(words))
+
+        # Exact username, then username prefix, then any prefix match
+        rank = Case(
+            When(username__iexact=" ".join(words), then=Value(3.0)),
+            When(username__istartswith=words[0], then=Value(2.0)),
+            When(prefix_match, then=Value(1.0)),
+            default=Value(0.0),
+        )
+
+        if not cls.trigram_enabled():
+            return users.filter(prefix_match).annotate(rank=rank)
+
+        users = users.annotate(
+            **{f"{field}_upper": Upper(field) for field in DIRECTORY_FIELDS}
+        )
+        match = Q()
+        for word in words:
+            match &= cls._word_prefix_match(word) | cls._fuzzy_match(word)
+        similarity = Greatest(
+            *(
+                TrigramWordSimilarity(" ".join(words), field)
+                for field in DIRECTORY_FIELDS
+            )
+        )
+        return users.filter(match).annotate(rank=rank + similarity)
+
+    @classmethod
+    def search(cls, text, *, limit=8):
+        """Top `limit` active users matching `text`, best first"""
+        words = cls._words(text)
+        if not words:
+            return []
+
+        # Hashed so any query makes a valid cache key
+        digest = hashlib.sha1(" ".join(words).lower().encode()).hexdigest()
+        generation = ProjectGeneration.get(USERS)
+        key = f"user_directory:{generation}:{limit}:{digest}"
+        users = cache.get(key)
+        if users is None:
+            users = list(
+                cls._ranked(words)
+                .select_related("profile")
+                .order_by("-rank", "username")[:limit]
+            )
+            cache.set(key, users, getattr(settings, "DIRECTORY_CACHE_TIMEOUT", 60))
+        return users
+
+    @staticmethod
+    def resolve(*, email=None, username=None, project=None):
+        """
+        The user with this email (or else username) in one query, or None.
+        With `project`, the user is annotated with `is_member`.
+        """
+        if email:
+            users = User.objects.filter(email=email)
+        elif username:
+            users = User.objects.filter(username=username)
+        else:
+            return None
+
+        if project is not None:
+            users = users.annotate(
+                is_member=Exists(
+                    ProjectMembers.objects.filter(
+                        project=project, project_member=OuterRef("pk")
+                    )
+                )
+            )
+        return users.select_related("profile").first()
@@ -0,0 +1,46 @@
+from django.db.models import F
+from django.utils import timezone
+
+
+class VersionConflict(Exception):
+    """The row moved past the version the client read"""
+
+    def __init__(self, instance):
+        super().__init__(
+            f"{type(instance).__name__} {instance.pk} is at version {instance.version}"
+        )
+        # Reloaded, so callers can answer with the current state
+        self.instance = instance
+
+
+def refresh_row(instance):
+    """
+    Copy the row's current columns onto `instance`. Unlike refresh_from_db it
+    keeps cached relations whose key did not change.
+    """
+    current = type(instance)._base_manager.get(pk=instance.pk)
+    for field in instance._meta.concrete_fields:
+        setattr(instance, field.attname, getattr(current, field.attname))
+
+
+def versioned_update(instance, fields):
+    """
+    Write `fields` of `instance` with a single
+    UPDATE ... WHERE id = %s AND version = %s that also bumps the version.
+    Returns False, writing nothing, when the row has moved past
+    instance.version. Signals do not run; callers apply their effects.
+    """
+    now = timezone.now()
+    updated = (
+        type(instance)
+        ._base_manager.filter(pk=instance.pk, version=instance.version)
+        .update(
+            **{field: getattr(instance, field) for field in fields},
+            updated_at=now,
+            version=F("version") + 1,
+        )
+    )
+    if updated:
+        instance.version += 1
+        instance.updated_at = now
+    return bool(updated)
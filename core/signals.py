@@ -0,0 +1,124 @@
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+from django.contrib.auth.models import User
+
+from accounts.models import UserProfile
+from projects.models import ProjectMembers, ProjectsModel
+from tasks.models import CommentModel, TaskModel
+from core.services.permission_context import PermissionContext
+from core.services.project_access import ProjectAccessService
+from core.services.project_generation import USERS, ProjectGeneration
+from core.services.project_stats import ProjectStatsService
+from core.services.team_stats import TeamStatsService
+
+
+@receiver(post_save, sender=ProjectsModel, dispatch_uid="core_project_created")
+def grant_creator_access(sender, instance, created, **kwargs):
+    if created:
+        ProjectAccessService.grant_creator(instance)
+        ProjectStatsService.ensure(instance)
+
+
+@receiver(post_save, sender=ProjectMembers, dispatch_uid="core_access_membership_saved")
+def grant_member_access(sender, instance, **kwargs):
+    """ProjectService wraps membership writes in a transaction, so the index commits with them"""
+    ProjectAccessService.grant(
+        user_id=instance.project_member_id,
+        project_id=instance.project_id,
+        role=instance.role_in_project,
+    )
+
+
+@receiver(
+    post_delete, sender=ProjectMembers, dispatch_uid="core_access_membership_deleted"
+)
+def revoke_member_access(sender, instance, **kwargs):
+    ProjectAccessService.revoke(
+        user_id=instance.project_member_id, project_id=instance.project_id
+    )
+
+
+@receiver(post_save, sender=ProjectMembers, dispatch_uid="core_stats_membership_saved")
+def count_added_member(sender, instance, created, **kwargs):
+    if created:
+        ProjectStatsService.member_count_changed(instance.project_id, 1)
+
+
+@receiver(
+    post_delete, sender=ProjectMembers, dispatch_uid="core_stats_membership_deleted"
+)
+def count_removed_member(sender, instance, **kwargs):
+    ProjectStatsService.member_count_changed(instance.project_id, -1)
+
+
+@receiver(post_save, sender=ProjectMembers, dispatch_uid="core_membership_saved")
+@receiver(post_delete, sender=ProjectMembers, dispatch_uid="core_membership_deleted")
+def invalidate_permissions_on_membership_change(sender, instance, **kwargs):
+    """A membership or role change alters the member's per-project roles"""
+    PermissionContext.invalidate(instance.project_member_id)
+
+
+@receiver(post_save, sender=ProjectMembers, dispatch_uid="core_team_stats_saved")
+@receiver(post_delete, sender=ProjectMembers, dispatch_uid="core_team_stats_deleted")
+def invalidate_team_stats_on_membership_change(sender, instance, **kwargs):
+    TeamStatsService.invalidate(instance.project_id)
+
+
+@receiver(post_save, sender=User, dispatch_uid="core_user_saved")
+@receiver(post_delete, sender=User, dispatch_uid="core_user_deleted")
+def invalidate_permissions_on_user_change(sender, instance, **kwargs):
+    """Staff/superuser/active flags are embedded in tokens; stale tokens reload the user"""
+    PermissionContext.invalidate(instance.pk)
+
+
+@receiver(
+    m2m_changed, sender=User.groups.through, dispatch_uid="core_user_groups_changed"
+)
+def invalidate_permissions_on_group_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if not reverse:
+        # user.groups.add/remove/set/clear
+        if action in {"post_add", "post_remove", "post_clear"}:
+            PermissionContext.invalidate(instance.pk)
+        return
+
+    # group.user_set.add/remove/clear
+    if action in {"post_add", "post_remove"} and pk_set:
+        PermissionContext.invalidate(*pk_set)
+    elif action == "pre_clear":
+        PermissionContext.invalidate(*instance.user_set.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=ProjectsModel, dispatch_uid="core_generation_project_saved")
+@receiver(
+    post_delete, sender=ProjectsModel, dispatch_uid="core_generation_project_deleted"
+)
+def bump_generation_on_project_change(sender, instance, **kwargs):
+    ProjectGeneration.bump(instance.pk)
+
+
+@receiver(post_save, sender=ProjectMembers, dispatch_uid="core_generation_member_saved")
+@receiver(
+    post_delete, sender=ProjectMembers, dispatch_uid="core_generation_member_deleted"
+)
+@receiver(post_save, sender=TaskModel, dispatch_uid="core_generation_task_saved")
+@receiver(post_delete, sender=TaskModel, dispatch_uid="core_generation_task_deleted")
+def bump_generation_on_project_child_change(sender, instance, **kwargs):
+    ProjectGeneration.bump(instance.project_id)
+
+
+@receiver(post_save, sender=CommentModel, dispatch_uid="core_generation_comment_saved")
+@receiver(
+    post_delete, sender=CommentModel, dispatch_uid="core_generation_comment_deleted"
+)
+def bump_generation_on_comment_change(sender, instance, **kwargs):
+    ProjectGeneration.bump(instance.task.project_id)
+
+
+@receiver(post_save, sender=User, dispatch_uid="core_generation_user_saved")
+@receiver(post_delete, sender=User, dispatch_uid="core_generation_user_deleted")
+@receiver(post_save, sender=UserProfile, dispatch_uid="core_generation_profile_saved")
+def bump_generation_on_user_change(sender, instance, **kwargs):
+    """Usernames and avatars are embedded in project and task payloads"""
+    ProjectGeneration.bump(USERS)
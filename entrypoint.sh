@@ -5,5 +5,8 @@ python manage.py migrate --noinput --fake-initial || true
 python manage.py collectstatic --no-input
 python manage.py init_roles || true
 python manage.py seed_all || true
+python manage.py prune_tokens || true
+# In the background, so a backlog of deletions does not hold up boot
+python manage.py resume_project_deletions &
 
 exec gunicorn team_track.wsgi:application --bind 0.0.0.0:8000 --workers 3 --timeout 120
\ No newline at end of file
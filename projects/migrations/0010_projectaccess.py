@@ -0,0 +1,85 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:11
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_project_access(apps, schema_editor):
+    ProjectsModel = apps.get_model("projects", "ProjectsModel")
+    ProjectMembers = apps.get_model("projects", "ProjectMembers")
+    ProjectAccess = apps.get_model("projects", "ProjectAccess")
+
+    # Creators first, then membership roles override them
+    rows = {
+        (project_id, user_id): "Project Manager"
+        for project_id, user_id in ProjectsModel.objects.values_list(
+            "id", "created_by_id"
+        )
+    }
+    rows.update(
+        {
+            (project_id, user_id): role
+            for project_id, user_id, role in ProjectMembers.objects.values_list(
+                "project_id", "project_member_id", "role_in_project"
+            )
+        }
+    )
+
+    ProjectAccess.objects.bulk_create(
+        [
+            ProjectAccess(project_id=project_id, user_id=user_id, role=role)
+            for (project_id, user_id), role in rows.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0009_alter_projectsmodel_priority_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectAccess",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("role", models.CharField(max_length=50)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="access",
+                        to="projects.projectsmodel",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="project_access",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "project"), name="unique_project_access"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_project_access, migrations.RunPython.noop),
+    ]
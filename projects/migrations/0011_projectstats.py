@@ -0,0 +1,90 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:24
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+STATUS_FIELDS = {
+    "TO_DO": "todo_tasks",
+    "IN_PROGRESS": "in_progress_tasks",
+    "IN_REVIEW": "in_review_tasks",
+    "DONE": "done_tasks",
+}
+
+
+def backfill_project_stats(apps, schema_editor):
+    ProjectsModel = apps.get_model("projects", "ProjectsModel")
+    ProjectMembers = apps.get_model("projects", "ProjectMembers")
+    ProjectStats = apps.get_model("projects", "ProjectStats")
+    TaskModel = apps.get_model("tasks", "TaskModel")
+
+    today = django.utils.timezone.localdate()
+    task_counts = {
+        row.pop("project_id"): row
+        for row in TaskModel.objects.values("project_id").annotate(
+            total_tasks=Count("id"),
+            **{
+                field: Count("id", filter=Q(status=status))
+                for status, field in STATUS_FIELDS.items()
+            },
+            overdue_tasks=Count("id", filter=Q(due_date__lt=today) & ~Q(status="DONE")),
+        )
+    }
+    member_counts = dict(
+        ProjectMembers.objects.values("project_id")
+        .annotate(count=Count("id"))
+        .values_list("project_id", "count")
+    )
+
+    ProjectStats.objects.bulk_create(
+        [
+            ProjectStats(
+                project_id=project_id,
+                overdue_as_of=today,
+                member_count=member_counts.get(project_id, 0),
+                **task_counts.get(project_id, {}),
+            )
+            for project_id in ProjectsModel.objects.values_list("id", flat=True)
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0010_projectaccess"),
+        ("tasks", "0010_alter_taskmodel_description"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectStats",
+            fields=[
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="projects.projectsmodel",
+                    ),
+                ),
+                ("total_tasks", models.PositiveIntegerField(default=0)),
+                ("todo_tasks", models.PositiveIntegerField(default=0)),
+                ("in_progress_tasks", models.PositiveIntegerField(default=0)),
+                ("in_review_tasks", models.PositiveIntegerField(default=0)),
+                ("done_tasks", models.PositiveIntegerField(default=0)),
+                ("overdue_tasks", models.PositiveIntegerField(default=0)),
+                (
+                    "overdue_as_of",
+                    models.DateField(default=django.utils.timezone.localdate),
+                ),
+                ("member_count", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_project_stats, migrations.RunPython.noop),
+    ]
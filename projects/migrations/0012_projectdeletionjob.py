@@ -0,0 +1,83 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:37
+
+import django.db.models.deletion
+import django_enum.fields
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0011_projectstats"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectDeletionJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("project_id", models.PositiveBigIntegerField(db_index=True)),
+                ("project_name", models.CharField(max_length=100)),
+                (
+                    "status",
+                    django_enum.fields.EnumCharField(
+                        choices=[
+                            ("PENDING", "pending"),
+                            ("RUNNING", "running"),
+                            ("COMPLETED", "completed"),
+                            ("FAILED", "failed"),
+                        ],
+                        default="PENDING",
+                        max_length=9,
+                    ),
+                ),
+                (
+                    "current_step",
+                    models.CharField(blank=True, default="", max_length=50),
+                ),
+                ("total_rows", models.PositiveIntegerField(default=0)),
+                ("processed_rows", models.PositiveIntegerField(default=0)),
+                ("error", models.TextField(blank=True, default="")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "requested_by",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="project_deletion_jobs",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("status__in", ["PENDING", "RUNNING"])),
+                        fields=("project_id",),
+                        name="unique_active_project_deletion",
+                    ),
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            (
+                                "status__in",
+                                ["PENDING", "RUNNING", "COMPLETED", "FAILED"],
+                            )
+                        ),
+                        name="projects_ProjectDeletionJob_status_DeletionJobStatusEnum",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 21:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0013_projectarchive"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectsmodel",
+            name="version",
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.9 on 2026-10-18 21:55
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0015_project_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectdeletionjob",
+            name="heartbeat_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -1,10 +1,19 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
 from django_enum import EnumField
 
 from core.services.roles import ROLE_PERMISSIONS
-from core.services.enums import ProjectStatusEnum, PriorityEnum
+from core.services.enums import (
+    DeletionJobStatusEnum,
+    ProjectStatusEnum,
+    PriorityEnum,
+)
+
+# Text search configuration of every search_vector column (see SearchService)
+SEARCH_CONFIG = "english"
 
 
 class ProjectsModel(models.Model):
@@ -19,12 +28,23 @@ class ProjectsModel(models.Model):
     )
     created_at = models.DateField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Bumped by every versioned write; guards updates against lost writes
+    version = models.PositiveIntegerField(default=1, editable=False)
+    # Maintained by PostgreSQL on every write
+    search_vector = models.GeneratedField(
+        expression=SearchVector("project_name", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="B", config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+        serialize=False,
+    )
 
     class Meta:
         permissions = [
             ("assign_project", "Can assign a project to users"),
             ("add_members", "Can add a user to a project"),
         ]
+        indexes = [GinIndex(fields=["search_vector"], name="project_search_idx")]
 
 
 class ProjectMembers(models.Model):
@@ -47,3 +67,113 @@ class ProjectMembers(models.Model):
             "project",
             "project_member",
         )  # A user can only be added once per project
+
+
+class ProjectAccess(models.Model):
+    """
+    Materialized "who can see which project" index.
+    One row per (user, project) for every member and for the project creator,
+    kept in sync by ProjectAccessService so visibility checks are a single
+    indexed lookup instead of creator/member joins.
+    """
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="project_access"
+    )
+    project = models.ForeignKey(
+        ProjectsModel, on_delete=models.CASCADE, related_name="access"
+    )
+    role = models.CharField(max_length=50)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "project"], name="unique_project_access"
+            )
+        ]
+
+
+class ProjectStats(models.Model):
+    """
+    Denormalized per-project counters, maintained by ProjectStatsService.
+    Progress bars read this row instead of counting tasks on every request.
+    `overdue_tasks` depends on the date, so it is only current when
+    `overdue_as_of` is today; the next write after midnight recounts it.
+    """
+
+    project = models.OneToOneField(
+        ProjectsModel, on_delete=models.CASCADE, primary_key=True, related_name="stats"
+    )
+    total_tasks = models.PositiveIntegerField(default=0)
+    todo_tasks = models.PositiveIntegerField(default=0)
+    in_progress_tasks = models.PositiveIntegerField(default=0)
+    in_review_tasks = models.PositiveIntegerField(default=0)
+    done_tasks = models.PositiveIntegerField(default=0)
+    overdue_tasks = models.PositiveIntegerField(default=0)
+    overdue_as_of = models.DateField(default=timezone.localdate)
+    member_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+class ProjectDeletionJob(models.Model):
+    """
+    Background deletion of a project and everything under it.
+    Keeps the project id as a plain value so the job outlives the project.
+    """
+
+    project_id = models.PositiveBigIntegerField(db_index=True)
+    project_name = models.CharField(max_length=100)
+    requested_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="project_deletion_jobs",
+    )
+    status = EnumField(DeletionJobStatusEnum, default=DeletionJobStatusEnum.PENDING)
+    current_step = models.CharField(max_length=50, blank=True, default="")
+    total_rows = models.PositiveIntegerField(default=0)
+    processed_rows = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # Touched by the runner on every chunk; an active job whose heartbeat
+    # stops has lost its runner
+    heartbeat_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            # At most one unfinished job per project
+            models.UniqueConstraint(
+                fields=["project_id"],
+                condition=models.Q(
+                    status__in=[
+                        DeletionJobStatusEnum.PENDING,
+                        DeletionJobStatusEnum.RUNNING,
+                    ]
+                ),
+                name="unique_active_project_deletion",
+            )
+        ]
+
+
+class ProjectArchive(models.Model):
+    """
+    Index of archived projects, written by ProjectArchiveService.
+    An archived project's tasks, comments and history live in the tasks
+    app's Archived* tables, and the project is read-only until restored.
+    """
+
+    project = models.OneToOneField(
+        ProjectsModel,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="archive",
+    )
+    archived_by = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, related_name="+"
+    )
+    archived_at = models.DateTimeField(default=timezone.now)
+    task_count = models.PositiveIntegerField(default=0)
+    comment_count = models.PositiveIntegerField(default=0)
+    history_count = models.PositiveIntegerField(default=0)
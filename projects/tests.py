@@ -1,3 +1,1028 @@
-from django.test import TestCase
+import io
+from datetime import timedelta
 
-# Create your tests here.
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.services.permission_context import PermissionContext
+from core.services.presence import presence_buffer
+from core.services.project_access import ProjectAccessService
+from core.services.project_archive import ProjectArchiveService
+from core.services.project_deletion import ProjectDeletionService
+from audit.models import GlobalAuditLog
+from Calendar.models import CalendarEvent, ProjectMilestone
+from core.services.enums import (
+    DeletionJobStatusEnum,
+    ProjectStatusEnum,
+    StatusEnum,
+)
+from core.services.project_service import ProjectService
+from core.services.project_stats import ProjectStatsService
+from core.services.roles import permission_bit
+from core.services.task_service import TaskService
+from core.services.team_stats import TeamStatsService
+from projects.models import (
+    ProjectAccess,
+    ProjectArchive,
+    ProjectDeletionJob,
+    ProjectMembers,
+    ProjectsModel,
+    ProjectStats,
+)
+from notifications.models import Notification
+from tasks.models import ArchivedTask, CommentModel, TaskHistoryModel, TaskModel
+
+
+@override_settings(CACHE_SHARED=True)
+class PermissionContextTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.dev_group, _ = Group.objects.get_or_create(name="Developer")
+        self.owner = User.objects.create_user(
+            username="context_owner",
+            email="context-owner@example.com",
+            password="defaultPassword123",
+        )
+        self.member = User.objects.create_user(
+            username="context_member",
+            email="context-member@example.com",
+            password="defaultPassword123",
+        )
+        self.member.groups.add(self.dev_group)
+
+        today = timezone.now().date()
+        self.project = ProjectsModel.objects.create(
+            project_name="Context Project",
+            description="Permission context project",
+            start_date=today,
+            end_date=today + timedelta(days=14),
+            status="ACTIVE",
+            priority="MEDIUM",
+            created_by=self.owner,
+        )
+        ProjectMembers.objects.create(
+            project=self.project,
+            project_member=self.member,
+            role_in_project="Developer",
+        )
+
+    def test_snapshot_is_reused_across_requests(self):
+        context = PermissionContext.for_user(self.member)
+        self.assertTrue(context.in_group("Developer"))
+        self.assertEqual(context.project_role(self.project.pk), "Developer")
+
+        with self.assertNumQueries(0):
+            cached = PermissionContext.for_user(self.member)
+        self.assertEqual(cached.project_roles, context.project_roles)
+
+    def test_membership_change_invalidates_snapshot(self):
+        PermissionContext.for_user(self.member)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ProjectMembers.objects.filter(
+                project=self.project, project_member=self.member
+            ).get().delete()
+            # The version is only bumped once the delete commits
+            context = PermissionContext.for_user(self.member)
+            self.assertTrue(context.is_member(self.project.pk))
+
+        context = PermissionContext.for_user(self.member)
+        self.assertFalse(context.is_member(self.project.pk))
+
+    def test_group_change_invalidates_snapshot(self):
+        PermissionContext.for_user(self.member)
+
+        admin_group, _ = Group.objects.get_or_create(name="Admin")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.member.groups.add(admin_group)
+
+        context = PermissionContext.for_user(self.member)
+        self.assertTrue(context.has_global_permission("delete_user"))
+
+    def test_detail_request_loads_permissions_once(self):
+        self.client.force_authenticate(user=self.member)
+        url = f"/api/v1/projects/{self.project.pk}/"
+
+        with CaptureQueriesContext(connection) as cold:
+            self.client.get(url)
+        with CaptureQueriesContext(connection) as warm:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Groups + memberships are loaded once, then served from the cache
+        self.assertEqual(len(cold) - len(warm), 2)
+
+    @override_settings(CACHE_SHARED=False)
+    def test_per_process_cache_always_loads_the_snapshot(self):
+        PermissionContext.for_user(self.member)
+        # Another worker's change, whose version bump this process never sees
+        ProjectMembers.objects.filter(
+            project=self.project, project_member=self.member
+        ).delete()
+
+        context = PermissionContext.for_user(self.member)
+        self.assertFalse(context.is_member(self.project.pk))
+
+    def test_project_role_extends_global_mask(self):
+        ProjectMembers.objects.filter(
+            project=self.project, project_member=self.member
+        ).update(role_in_project="Project Manager")
+        PermissionContext.invalidate(self.member.pk)
+
+        context = PermissionContext.for_user(self.member)
+        bit = permission_bit("add_projectmembers")
+        self.assertFalse(context.has_global_bit(bit))
+        self.assertTrue(context.has_project_bit(self.project.pk, bit))
+
+
+class ProjectAccessTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="access_owner",
+            email="access-owner@example.com",
+            password="defaultPassword123",
+        )
+        self.member = User.objects.create_user(
+            username="access_member",
+            email="access-member@example.com",
+            password="defaultPassword123",
+        )
+
+        today = timezone.now().date()
+        self.project = ProjectsModel.objects.create(
+            project_name="Access Project",
+            description="Project access index",
+            start_date=today,
+            end_date=today + timedelta(days=14),
+            status="ACTIVE",
+            priority="MEDIUM",
+            created_by=self.owner,
+        )
+
+    def _access(self, user):
+        return ProjectAccess.objects.filter(user=user, project=self.project)
+
+    def test_membership_changes_maintain_access(self):
+        self.assertTrue(self._access(self.owner).exists())
+        self.assertFalse(self._access(self.member).exists())
+
+        membership = ProjectService.add_member(
+            project=self.project, user=self.member, role="Developer"
+        )
+        self.assertEqual(self._access(self.member).get().role, "Developer")
+
+        ProjectService.update_member_role(membership=membership, role="Guest")
+        self.assertEqual(self._access(self.member).get().role, "Guest")
+
+        ProjectService.remove_member(membership=membership)
+        self.assertFalse(self._access(self.member).exists())
+
+    def test_creator_keeps_access_after_leaving_membership(self):
+        membership = ProjectService.add_member(
+            project=self.project, user=self.owner, role="Developer"
+        )
+        ProjectService.remove_member(membership=membership)
+
+        self.assertTrue(self._access(self.owner).exists())
+
+    def test_rebuild_and_project_delete(self):
+        ProjectService.add_member(
+            project=self.project, user=self.member, role="Developer"
+        )
+        ProjectAccessService.rebuild()
+
+        self.assertEqual(
+            list(ProjectAccessService.project_ids_for(self.member)),
+            [{"project_id": self.project.pk}],
+        )
+        self.project.delete()
+        self.assertFalse(ProjectAccess.objects.exists())
+
+
+class ProjectListPaginationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.group, _ = Group.objects.get_or_create(name="Project Manager")
+        self.user = User.objects.create_user(
+            username="paging_user",
+            email="paging@example.com",
+            password="defaultPassword123",
+        )
+        self.user.groups.add(self.group)
+
+        today = timezone.now().date()
+        self.projects = [
+            ProjectService.create_project(
+                user=self.user,
+                data={
+                    "project_name": f"Paged Project {i}",
+                    "start_date": today,
+                    "end_date": today + timedelta(days=7),
+                },
+            )
+            for i in range(3)
+        ]
+        for i in range(4):
+            TaskService.create_task(
+                user=self.user,
+                project_id=self.projects[0].pk,
+                data={"title": f"Task {i}"},
+            )
+
+        self.client.force_authenticate(user=self.user)
+
+    def test_keyset_pages_cover_all_projects(self):
+        response = self.client.get("/api/v1/projects/", {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        first_page = [row["id"] for row in response.data["data"]]
+        pagination = response.data["pagination"]
+        self.assertTrue(pagination["has_next"])
+
+        response = self.client.get(
+            "/api/v1/projects/",
+            {"page_size": 2, "cursor": pagination["next_cursor"]},
+        )
+        second_page = [row["id"] for row in response.data["data"]]
+        self.assertFalse(response.data["pagination"]["has_next"])
+
+        self.assertEqual(
+            first_page + second_page,
+            sorted((p.pk for p in self.projects), reverse=True),
+        )
+
+    def test_tasks_preview_is_capped(self):
+        response = self.client.get("/api/v1/projects/", {"tasks_preview": 2})
+        rows = {row["id"]: row for row in response.data["data"]}
+
+        busy = rows[self.projects[0].pk]
+        self.assertEqual([t["title"] for t in busy["tasks"]], ["Task 3", "Task 2"])
+        self.assertEqual(busy["total_tasks"], 4)
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get("/api/v1/projects/", {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["error"]["code"], "INVALID_INPUT")
+
+
+class ProjectStatsTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="stats_owner",
+            email="stats_owner@example.com",
+            password="defaultPassword123",
+        )
+        self.member = User.objects.create_user(
+            username="stats_member",
+            email="stats_member@example.com",
+            password="defaultPassword123",
+        )
+        self.today = timezone.localdate()
+        self.project = ProjectService.create_project(
+            user=self.owner,
+            data={
+                "project_name": "Stats Project",
+                "start_date": self.today,
+                "end_date": self.today + timedelta(days=7),
+            },
+        )
+
+    def _stats(self):
+        return ProjectStats.objects.get(pk=self.project.pk)
+
+    def _create_task(self, **data):
+        return TaskService.create_task(
+            user=self.owner, project_id=self.project.pk, data={"title": "T", **data}
+        )
+
+    def test_task_writes_update_counters(self):
+        task = self._create_task(
+            status=StatusEnum.TO_DO, due_date=self.today - timedelta(days=1)
+        )
+        self._create_task(status=StatusEnum.IN_PROGRESS)
+
+        stats = self._stats()
+        self.assertEqual((stats.total_tasks, stats.todo_tasks), (2, 1))
+        self.assertEqual((stats.in_progress_tasks, stats.overdue_tasks), (1, 1))
+
+        TaskService.update_task_status(
+            user=self.owner, task=task, status=StatusEnum.DONE
+        )
+        stats = self._stats()
+        self.assertEqual((stats.todo_tasks, stats.done_tasks), (0, 1))
+        self.assertEqual(stats.overdue_tasks, 0)
+
+        TaskService.update_task(
+            user=self.owner, task=task, data={"status": StatusEnum.IN_REVIEW}
+        )
+        self.assertEqual(self._stats().in_review_tasks, 1)
+        self.assertEqual(self._stats().overdue_tasks, 1)
+
+        TaskService.delete_task(task=TaskModel.objects.get(pk=task.pk))
+        stats = self._stats()
+        self.assertEqual((stats.total_tasks, stats.in_review_tasks), (1, 0))
+        self.assertEqual(stats.overdue_tasks, 0)
+
+    def test_member_changes_update_member_count(self):
+        self.assertEqual(self._stats().member_count, 1)  # the creator
+
+        membership = ProjectService.add_member(
+            project=self.project, user=self.member, role="Developer"
+        )
+        self.assertEqual(self._stats().member_count, 2)
+
+        ProjectService.remove_member(membership=membership)
+        self.assertEqual(self._stats().member_count, 1)
+
+    def test_stale_overdue_count_is_recounted_on_next_write(self):
+        TaskModel.objects.create(
+            project=self.project, title="Untracked", due_date=self.today
+        )
+        ProjectStats.objects.filter(pk=self.project.pk).update(
+            overdue_as_of=self.today - timedelta(days=1)
+        )
+
+        self._create_task()
+        stats = self._stats()
+        self.assertEqual(stats.total_tasks, 2)
+        self.assertEqual(stats.overdue_as_of, self.today)
+
+    def test_rebuild_repairs_counters(self):
+        self._create_task(status=StatusEnum.DONE)
+        ProjectStats.objects.filter(pk=self.project.pk).update(
+            total_tasks=0, done_tasks=0, member_count=0
+        )
+
+        self.assertEqual(ProjectStatsService.rebuild(), 1)
+        stats = self._stats()
+        self.assertEqual((stats.total_tasks, stats.done_tasks), (1, 1))
+        self.assertEqual(stats.member_count, 1)
+
+    def test_project_list_reads_progress_from_stats(self):
+        self._create_task(status=StatusEnum.DONE)
+        self._create_task(status=StatusEnum.TO_DO)
+        group, _ = Group.objects.get_or_create(name="Project Manager")
+        self.owner.groups.add(group)
+        self.client.force_authenticate(user=self.owner)
+
+        response = self.client.get("/api/v1/projects/")
+        row = response.data["data"][0]
+        self.assertEqual((row["total_tasks"], row["tasks_completed"]), (2, 1))
+        self.assertEqual(row["progress"], 50)
+
+    def test_overdue_count_is_live_until_the_counter_is_current(self):
+        self._create_task(due_date=self.today - timedelta(days=1))
+        group, _ = Group.objects.get_or_create(name="Project Manager")
+        self.owner.groups.add(group)
+        self.client.force_authenticate(user=self.owner)
+        url = f"/api/v1/projects/{self.project.pk}/"
+
+        response = self.client.get(url)
+        self.assertEqual(response.data["project_progress"]["overdue_tasks"], 1)
+
+        # A counter from an earlier day is not trusted until a write recounts it
+        ProjectStats.objects.filter(pk=self.project.pk).update(
+            overdue_tasks=0, overdue_as_of=self.today - timedelta(days=1)
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.data["project_progress"]["overdue_tasks"], 1)
+
+
+class TeamMembersListingTests(APITestCase):
+    def setUp(self):
+        group, _ = Group.objects.get_or_create(name="Project Manager")
+        self.owner = User.objects.create_user(
+            username="team_owner",
+            email="team_owner@example.com",
+            password="defaultPassword123",
+        )
+        self.owner.groups.add(group)
+        today = timezone.localdate()
+        self.project = ProjectService.create_project(
+            user=self.owner,
+            data={
+                "project_name": "Team Project",
+                "start_date": today,
+                "end_date": today + timedelta(days=7),
+            },
+        )
+        self.other_project = ProjectService.create_project(
+            user=self.owner,
+            data={
+                "project_name": "Other Team Project",
+                "start_date": today,
+                "end_date": today + timedelta(days=7),
+            },
+        )
+        self.url = f"/api/v1/projects/{self.project.pk}/team/members/"
+        self.client.force_authenticate(user=self.owner)
+
+    def _add_members(self, count, offset=0):
+        for i in range(offset, offset + count):
+            user = User.objects.create_user(
+                username=f"team_member_{i}",
+                email=f"team_member_{i}@example.com",
+                password="defaultPassword123",
+            )
+            ProjectService.add_member(project=self.project, user=user, role="Developer")
+            for task_status in (StatusEnum.DONE, StatusEnum.TO_DO):
+                TaskModel.objects.create(
+                    project=self.project,
+                    title="Task",
+                    assigned_to=user,
+                    status=task_status,
+                )
+            # Work in other projects must not be counted
+            TaskModel.objects.create(
+                project=self.other_project, title="Elsewhere", assigned_to=user
+            )
+
+    def _get(self):
+        # Keep the periodic presence flush out of the measured request
+        presence_buffer.flush()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(queries)
+
+    def test_task_counts_are_per_project(self):
+        self._add_members(2)
+        response, _ = self._get()
+
+        rows = {row["username"]: row for row in response.data["data"]}
+        self.assertEqual(rows["team_member_0"]["task_count"], 2)
+        self.assertEqual(rows["team_member_0"]["open_task_count"], 1)
+        self.assertEqual(rows["team_owner"]["task_count"], 0)
+
+    def test_query_count_does_not_grow_with_team_size(self):
+        self._add_members(2)
+        self._get()  # warm the permission context cache
+        _, small_team_queries = self._get()
+
+        self._add_members(10, offset=2)
+        response, large_team_queries = self._get()
+
+        self.assertEqual(len(response.data["data"]), 13)
+        self.assertEqual(large_team_queries, small_team_queries)
+
+
+class TeamStatsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username="stats_team_owner",
+            email="stats_team_owner@example.com",
+            password="defaultPassword123",
+        )
+        today = timezone.localdate()
+        self.project = ProjectService.create_project(
+            user=self.owner,
+            data={
+                "project_name": "Team Stats Project",
+                "start_date": today,
+                "end_date": today + timedelta(days=7),
+            },
+        )
+        self.developer = User.objects.create_user(
+            username="stats_team_dev",
+            email="stats_team_dev@example.com",
+            password="defaultPassword123",
+        )
+        self.membership = ProjectService.add_member(
+            project=self.project, user=self.developer, role="Developer"
+        )
+
+    def test_project_stats_are_one_query_and_cached(self):
+        # The aggregate, plus the generation its cache key is built from
+        with self.assertNumQueries(2):
+            stats = TeamStatsService.for_project(self.project)
+        self.assertEqual(stats["total_members"], 2)
+        self.assertEqual((stats["project_managers"], stats["developers"]), (1, 1))
+
+        with self.assertNumQueries(1):
+            TeamStatsService.for_project(self.project)
+
+    def test_membership_change_invalidates_cached_stats(self):
+        TeamStatsService.for_project(self.project)
+        TeamStatsService.for_user(self.owner)
+
+        # The generation row is bumped by the write itself, not after commit
+        ProjectService.update_member_role(membership=self.membership, role="Admin")
+
+        self.assertEqual(TeamStatsService.for_project(self.project)["admins"], 1)
+        stats = TeamStatsService.for_user(self.owner)
+        self.assertEqual((stats["total_members"], stats["admin_members"]), (2, 1))
+
+
+class BulkTeamMembersTests(APITestCase):
+    def setUp(self):
+        group, _ = Group.objects.get_or_create(name="Project Manager")
+        self.owner = User.objects.create_user(
+            username="bulk_owner",
+            email="bulk_owner@example.com",
+            password="defaultPassword123",
+        )
+        self.owner.groups.add(group)
+        today = timezone.localdate()
+        self.project = ProjectService.create_project(
+            user=self.owner,
+            data={
+                "project_name": "Bulk Project",
+                "start_date": today,
+                "end_date": today + timedelta(days=7),
+            },
+        )
+        self.users = [
+            User.objects.create_user(
+                username=f"bulk_user_{i}",
+                email=f"bulk_user_{i}@example.com",
+                password="defaultPassword123",
+            )
+            for i in range(5)
+        ]
+        self.url = f"/api/v1/projects/{self.project.pk}/team/members/bulk/"
+        self.client.force_authenticate(user=self.owner)
+
+    def test_bulk_add_skips_members_and_reports_unknown_users(self):
+        ProjectService.add_member(
+            project=self.project, user=self.users[0], role="Developer"
+        )
+        payload = {
+            "members": [
+                {"user_id": self.users[0].pk, "role": "DEVELOPER"},
+                {"user_id": self.users[1].pk, "role": "GUEST"},
+                {"email": "BULK_USER_2@example.com", "role": "developer"},
+                {"user_id": self.users[3].pk, "role": "Project Manager"},
+                {"email": "nobody@example.com", "role": "GUEST"},
+            ]
+        }
+        audit_logs = GlobalAuditLog.objects.count()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        data = response.data["data"]
+        self.assertEqual(
+            {row["username"] for row in data["added"]},
+            {"bulk_user_1", "bulk_user_2", "bulk_user_3"},
+        )
+        self.assertEqual(data["already_members"], [self.users[0].pk])
+        self.assertEqual(data["not_found"], ["nobody@example.com"])
+
+        # Signals are skipped by bulk_create; their effects must still apply
+        self.assertTrue(ProjectAccessService.has_access(self.users[3], self.project.pk))
+        self.assertEqual(ProjectStats.objects.get(pk=self.project.pk).member_count, 5)
+
+        self.assertEqual(GlobalAuditLog.objects.count(), audit_logs + 1)
+        self.assertEqual(
+            Notification.objects.filter(audit_log__project=self.project)
+            .values("audit_log")
+            .distinct()
+            .count(),
+            1,
+        )
+
+    def test_entry_needs_exactly_one_identifier(self):
+        response = self.client.post(
+            self.url,
+            {"members": [{"role": "GUEST"}]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["error"]["code"], "INVALID_INPUT")
+
+
+@override_settings(PROJECT_DELETION_ASYNC=False, PROJECT_DELETION_BATCH_SIZE=2)
+class ProjectDeletionTests(APITestCase):
+    def setUp(self):
+        group, _ = Group.objects.get_or_create(name="Project Manager")
+        self.owner = User.objects.create_user(
+            username="deletion_owner",
+            email="deletion_owner@example.com",
+            password="defaultPassword123",
+        )
+        self.owner.groups.add(group)
+        self.today = timezone.localdate()
+        self.project = ProjectService.create_project(
+            user=self.owner,
+            data={
+                "project_name": "Doomed Project",
+                "start_date": self.today,
+                "end_date": self.today + timedelta(days=7),
+            },
+        )
+        for i in range(5):
+            # A due date and assignee also create a deadline calendar event
+            task = TaskService.create_task(
+                user=self.owner,
+                project_id=self.project.pk,
+                data={
+                    "title": f"Task {i}",
+                    "assigned_to": self.owner,
+                    "due_date": self.today,
+                },
+            )
+            CommentModel.objects.create(task=task, author=self.owner, content="Hi")
+            TaskService.update_task_status(
+                user=self.owner, task=task, status=StatusEnum.DONE
+            )
+        ProjectMilestone.objects.create(
+            project=self.project, title="Launch", due_date=self.today
+        )
+        self.client.force_authenticate(user=self.owner)
+
+    def test_delete_runs_as_a_chunked_job(self):
+        self.assertEqual(CalendarEvent.objects.count(), 6)  # 5 deadlines + milestone
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f"/api/v1/projects/{self.project.pk}/")
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        job = ProjectDeletionJob.objects.get(pk=response.data["data"]["id"])
+        self.assertEqual(job.status, DeletionJobStatusEnum.COMPLETED)
+        self.assertEqual(job.processed_rows, job.total_rows)
+
+        self.assertFalse(ProjectsModel.objects.filter(pk=self.project.pk).exists())
+        self.assertFalse(TaskModel.objects.exists())
+        self.assertFalse(CommentModel.objects.exists())
+        self.assertFalse(CalendarEvent.objects.exists())
+        # History outlives its tasks, as with the ORM cascade
+        self.assertEqual(TaskHistoryModel.objects.filter(task=None).count(), 5)
+        self.assertTrue(
+            GlobalAuditLog.objects.filter(
+                action="deleted",
+                target_id=self.project.pk,
+                metadata__deletion_job_id=job.pk,
+            ).exists()
+        )
+
+        response = self.client.get(f"/api/v1/projects/deletion-jobs/{job.pk}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"]["progress_pct"], 100.0)
+
+    def test_repeated_delete_reuses_the_active_job(self):
+        # Without the commit callbacks the job stays pending
+        first = self.client.delete(f"/api/v1/projects/{self.project.pk}/")
+        second = self.client.delete(f"/api/v1/projects/{self.project.pk}/")
+
+        self.assertEqual(first.data["data"]["id"], second.data["data"]["id"])
+        self.assertEqual(ProjectDeletionJob.objects.count(), 1)
+
+    def test_delete_redispatches_a_stalled_job(self):
+        # A job left running by a killed worker
+        self.client.delete(f"/api/v1/projects/{self.project.pk}/")
+        ProjectDeletionJob.objects.update(
+            status=DeletionJobStatusEnum.RUNNING,
+            heartbeat_at=timezone.now() - timedelta(hours=1),
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f"/api/v1/projects/{self.project.pk}/")
+
+        job = ProjectDeletionJob.objects.get(pk=response.data["data"]["id"])
+        self.assertEqual(job.status, DeletionJobStatusEnum.COMPLETED)
+        self.assertFalse(ProjectsModel.objects.filter(pk=self.project.pk).exists())
+
+    def test_a_stalled_job_has_one_runner(self):
+        self.client.delete(f"/api/v1/projects/{self.project.pk}/")
+        stalled_at = timezone.now() - timedelta(hours=1)
+        ProjectDeletionJob.objects.update(
+            status=DeletionJobStatusEnum.RUNNING, heartbeat_at=stalled_at
+        )
+        job = ProjectDeletionJob.objects.get()
+
+        lease = ProjectDeletionService.claim(job.pk)
+        self.assertIsNotNone(lease)
+        self.assertIsNone(ProjectDeletionService.claim(job.pk))
+
+        # The runner that stalled has lost its lease
+        ProjectDeletionService.run(job.pk, stalled_at)
+        self.assertTrue(ProjectsModel.objects.filter(pk=self.project.pk).exists())
+
+        ProjectDeletionService.run(job.pk, lease)
+        self.assertFalse(ProjectsModel.objects.filter(pk=self.project.pk).exists())
+        self.assertEqual(
+            GlobalAuditLog.objects.filter(
+                description=f'Deleted project "{job.project_name}"'
+            ).count(),
+            1,
+        )
+
+    def test_resume_command_runs_stalled_jobs(self):
+        self.client.delete(f"/api/v1/projects/{self.project.pk}/")
+        ProjectDeletionJob.objects.update(
+            heartbeat_at=timezone.now() - timedelta(hours=1)
+        )
+
+        call_command("resume_project_deletions", stdout=io.StringIO())
+
+        job = ProjectDeletionJob.objects.get()
+        self.assertEqual(job.status, DeletionJobStatusEnum.COMPLETED)
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        group, _ = Group.objects.get_or_create(name="Project Manager")
+        self.owner = User.objects.create_user(
+            username="etag_owner",
+            email="etag_owner@example.com",
+            password="defaultPassword123",
+        )
+        self.owner.groups.add(group)
+        today = timezone.localdate()
+        self.project = ProjectService.create_project(
+            user=self.owner,
+            data={
+                "project_name": "ETag Project",
+                "start_date": today,
+                "end_date": today + timedelta(days=7),
+            },
+        )
+        self.task = TaskService.create_task(
+            user=self.owner, project_id=self.project.pk, data={"title": "Cached"}
+        )
+        self.client.force_authenticate(user=self.owner)
+
+    def test_unchanged_resources_answer_304(self):
+        for url in [
+            f"/api/v1/projects/{self.project.pk}/",
+            f"/api/v1/projects/{self.project.pk}/tasks/",
+            f"/api/v1/tasks/{self.task.pk}/",
+        ]:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                etag = response["ETag"]
+                self.assertTrue(etag.startswith('W/"'))
+
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+                self.assertEqual(response["ETag"], etag)
+                self.assertFalse(response.content)
+
+    def test_task_write_changes_the_etag(self):
+        url = f"/api/v1/projects/{self.project.pk}/"
+        etag = self.client.get(url)["ETag"]
+
+        TaskService.update_task_status(
+            user=self.owner, task=self.task, status=StatusEnum.DONE
+        )
+        # Generations live in the database, so a worker with an empty (or
+        # its own) cache sees the bump too
+        cache.clear()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_presence_flush_changes_the_project_etag(self):
+        url = f"/api/v1/projects/{self.project.pk}/"
+        etag = self.client.get(url)["ETag"]
+
+        # The creator's last_seen is part of the payload
+        presence_buffer.clear()
+        presence_buffer.touch(self.owner.pk)
+        presence_buffer.flush()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(response.data["created_by"]["profile"]["last_seen"])
+
+    def test_stale_if_match_is_rejected_with_the_current_project(self):
+        url = f"/api/v1/projects/{self.project.pk}/"
+        ProjectService.update_project(
+            user=self.owner,
+            project_id=self.project.pk,
+            data={"description": "First"},
+            version=1,
+        )
+
+        response = self.client.patch(
+            url, {"description": "Second"}, format="json", HTTP_IF_MATCH='"1"'
+        )
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data["error"]["code"], "VERSION_CONFLICT")
+        current = response.data["error"]["details"]["current"]
+        self.assertEqual((current["description"], current["version"]), ("First", 2))
+
+        response = self.client.patch(
+            url, {"description": "Second"}, format="json", HTTP_IF_MATCH='"2"'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["data"]["version"], 3)
+
+        response = self.client.patch(
+            url, {"description": "Third"}, format="json", HTTP_IF_MATCH='W/"abc"'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_served_etag_round_trips_as_if_match(self):
+        for url in [
+            f"/api/v1/projects/{self.project.pk}/",
+            f"/api/v1/tasks/{self.task.pk}/",
+        ]:
+            with self.subTest(url=url):
+                etag = self.client.get(url)["ETag"]
+
+                response = self.client.patch(
+                    url, {"description": "Fresh"}, format="json", HTTP_IF_MATCH=etag
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+                # The ETag now names a version that has moved on
+                response = self.client.patch(
+                    url, {"description": "Stale"}, format="json", HTTP_IF_MATCH=etag
+                )
+                self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+
+class ProjectArchiveTests(APITestCase):
+    def setUp(self):
+        group, _ = Group.objects.get_or_create(name="Project Manager")
+        self.owner = User.objects.create_user(
+            username="archive_owner",
+            email="archive_owner@example.com",
+            password="defaultPassword123",
+        )
+        self.owner.groups.add(group)
+        self.today = timezone.localdate()
+        self.project = ProjectService.create_project(
+            user=self.owner,
+            data={
+                "project_name": "Finished Project",
+                "start_date": self.today,
+                "end_date": self.today + timedelta(days=7),
+            },
+        )
+        self.tasks = []
+        for i in range(3):
+            task = TaskService.create_task(
+                user=self.owner,
+                project_id=self.project.pk,
+                data={
+                    "title": f"Task {i}",
+                    "assigned_to": self.owner,
+                    "due_date": self.today,
+                },
+            )
+            CommentModel.objects.create(task=task, author=self.owner, content="Done")
+            TaskService.update_task_status(
+                user=self.owner, task=task, status=StatusEnum.DONE
+            )
+            self.tasks.append(task)
+        self.project.status = ProjectStatusEnum.COMPLETED
+        self.project.save()
+        self.client.force_authenticate(user=self.owner)
+
+    def test_archive_moves_rows_and_keeps_project_readable(self):
+        history = TaskHistoryModel.objects.filter(task__project=self.project).count()
+
+        archive = ProjectArchiveService.archive(
+            project=self.project, archived_by=self.owner
+        )
+
+        self.assertEqual(
+            (archive.task_count, archive.comment_count, archive.history_count),
+            (3, 3, history),
+        )
+        self.assertFalse(TaskModel.objects.filter(project=self.project).exists())
+        self.assertFalse(CalendarEvent.objects.exists())
+        ProjectStatsService.rebuild()
+        self.assertEqual(ProjectStats.objects.get(project=self.project).done_tasks, 3)
+
+        response = self.client.get(f"/api/v1/projects/{self.project.pk}/")
+        self.assertIsNotNone(response.data["archived_at"])
+        response = self.client.get(f"/api/v1/projects/{self.project.pk}/tasks/")
+        self.assertEqual(len(response.data["data"]), 3)
+        self.assertEqual(len(response.data["data"][0]["comments"]), 1)
+        response = self.client.get(f"/api/v1/tasks/{self.tasks[0].pk}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["title"], "Task 0")
+
+        response = self.client.patch(
+            f"/api/v1/projects/{self.project.pk}/",
+            {"description": "Reopened"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.post(
+            f"/api/v1/projects/{self.project.pk}/tasks/", {"title": "New"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_restore_puts_rows_back_under_their_ids(self):
+        ProjectArchiveService.archive(project=self.project)
+
+        restored = ProjectArchiveService.restore(project=self.project)
+
+        self.assertEqual(restored, 3)
+        self.assertEqual(
+            set(
+                TaskModel.objects.filter(project=self.project).values_list(
+                    "pk", flat=True
+                )
+            ),
+            {task.pk for task in self.tasks},
+        )
+        self.assertEqual(CommentModel.objects.filter(task__in=self.tasks).count(), 3)
+        self.assertFalse(ArchivedTask.objects.exists())
+        self.assertFalse(ProjectArchiveService.is_archived(self.project.pk))
+        # Deadline events are recreated for the restored tasks
+        self.assertEqual(CalendarEvent.objects.count(), 3)
+
+    def test_only_completed_projects_are_archived(self):
+        self.project.status = ProjectStatusEnum.ACTIVE
+        self.project.save()
+
+        with self.assertRaises(ValueError):
+            ProjectArchiveService.archive(project=self.project)
+        self.assertFalse(ProjectArchive.objects.exists())
+
+
+class BoardTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.group, _ = Group.objects.get_or_create(name="Project Manager")
+        self.user = User.objects.create_user(
+            username="board_user",
+            email="board@example.com",
+            password="defaultPassword123",
+        )
+        self.user.groups.add(self.group)
+
+        today = timezone.now().date()
+        self.project = ProjectService.create_project(
+            user=self.user,
+            data={
+                "project_name": "Board Project",
+                "start_date": today,
+                "end_date": today + timedelta(days=7),
+            },
+        )
+        for i, (priority, due) in enumerate(
+            [("LOW", None), ("HIGH", 5), ("HIGH", 1), ("MEDIUM", None), (None, 2)]
+        ):
+            TaskService.create_task(
+                user=self.user,
+                project_id=self.project.pk,
+                data={
+                    "title": f"Todo {i}",
+                    "status": StatusEnum.TO_DO,
+                    "priority": priority,
+                    "due_date": today + timedelta(days=due) if due else None,
+                },
+            )
+        TaskService.create_task(
+            user=self.user,
+            project_id=self.project.pk,
+            data={"title": "Shipped", "status": StatusEnum.DONE},
+        )
+
+        self.url = f"/api/v1/projects/{self.project.pk}/board/"
+        self.client.force_authenticate(user=self.user)
+
+    def test_board_lists_each_column_with_its_total(self):
+        response = self.client.get(self.url, {"page_size": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        columns = {
+            column["status"]: column for column in response.data["data"]["columns"]
+        }
+        self.assertEqual(list(columns), [s.value for s in StatusEnum])
+
+        todo = columns[StatusEnum.TO_DO.value]
+        self.assertEqual(todo["total"], 5)
+        self.assertEqual(
+            [card["title"] for card in todo["cards"]], ["Todo 2", "Todo 1"]
+        )
+        self.assertIsNotNone(todo["next_cursor"])
+        self.assertEqual(columns[StatusEnum.DONE.value]["total"], 1)
+        self.assertIsNone(columns[StatusEnum.DONE.value]["next_cursor"])
+        self.assertEqual(columns[StatusEnum.IN_REVIEW.value]["cards"], [])
+
+    def test_column_pages_follow_the_cursor(self):
+        response = self.client.get(self.url, {"page_size": 2})
+        cursor = response.data["data"]["columns"][0]["next_cursor"]
+
+        titles = []
+        while cursor:
+            response = self.client.get(
+                self.url,
+                {"status": StatusEnum.TO_DO.value, "page_size": 2, "cursor": cursor},
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            titles += [card["title"] for card in response.data["data"]]
+            cursor = response.data["pagination"]["next_cursor"]
+
+        self.assertEqual(titles, ["Todo 3", "Todo 0", "Todo 4"])
+
+    def test_cursor_without_status_is_rejected(self):
+        response = self.client.get(self.url, {"cursor": "abc"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
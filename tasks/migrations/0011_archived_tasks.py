@@ -0,0 +1,210 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:46
+
+import django.db.models.deletion
+import django_enum.fields
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0013_projectarchive"),
+        ("tasks", "0010_alter_taskmodel_description"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedTask",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("title", models.CharField(max_length=100)),
+                ("description", models.TextField(blank=True, null=True)),
+                (
+                    "status",
+                    django_enum.fields.EnumCharField(
+                        blank=True,
+                        choices=[
+                            ("TO_DO", "to_do"),
+                            ("IN_PROGRESS", "in_progress"),
+                            ("IN_REVIEW", "in_review"),
+                            ("DONE", "done"),
+                        ],
+                        max_length=11,
+                        null=True,
+                    ),
+                ),
+                (
+                    "priority",
+                    django_enum.fields.EnumCharField(
+                        blank=True,
+                        choices=[
+                            ("LOW", "low"),
+                            ("MEDIUM", "medium"),
+                            ("HIGH", "high"),
+                        ],
+                        max_length=6,
+                        null=True,
+                    ),
+                ),
+                ("due_date", models.DateField(blank=True, null=True)),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "assigned_to",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_tasks",
+                        to="projects.projectsmodel",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ArchivedComment",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("content", models.TextField()),
+                ("created_at", models.DateTimeField()),
+                (
+                    "author",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "task",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="comments",
+                        to="tasks.archivedtask",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ArchivedTaskAssignment",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                (
+                    "task",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="tasks.archivedtask",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ArchivedTaskHistory",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                (
+                    "field_changed",
+                    django_enum.fields.EnumCharField(
+                        choices=[
+                            ("status", "Status"),
+                            ("priority", "Priority"),
+                            ("assigned_to", "Assigned To"),
+                            ("due_date", "Due Date"),
+                            ("title", "Title"),
+                            ("description", "Description"),
+                        ],
+                        max_length=11,
+                    ),
+                ),
+                ("old_value", models.TextField(blank=True, null=True)),
+                ("new_value", models.TextField()),
+                ("timestamp", models.DateTimeField()),
+                (
+                    "changed_by",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "task",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="history",
+                        to="tasks.archivedtask",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="archivedtask",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("status__in", ["TO_DO", "IN_PROGRESS", "IN_REVIEW", "DONE"]),
+                    ("status__isnull", True),
+                    _connector="OR",
+                ),
+                name="tasks_ArchivedTask_status_StatusEnum",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="archivedtask",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("priority__in", ["LOW", "MEDIUM", "HIGH"]),
+                    ("priority__isnull", True),
+                    _connector="OR",
+                ),
+                name="tasks_ArchivedTask_priority_PriorityEnum",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="archivedtaskhistory",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    (
+                        "field_changed__in",
+                        [
+                            "status",
+                            "priority",
+                            "assigned_to",
+                            "due_date",
+                            "title",
+                            "description",
+                        ],
+                    )
+                ),
+                name="tasks_ArchivedTaskHistory_field_changed_TaskFieldEnum",
+            ),
+        ),
+    ]
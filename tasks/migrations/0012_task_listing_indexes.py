@@ -0,0 +1,72 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:50
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0013_projectarchive"),
+        ("tasks", "0011_archived_tasks"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="taskmodel",
+            name="assigned_to",
+            field=models.ForeignKey(
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="assigned_tasks",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="taskmodel",
+            name="project",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="project_tasks",
+                to="projects.projectsmodel",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="taskmodel",
+            index=models.Index(fields=["updated_at", "id"], name="task_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="taskmodel",
+            index=models.Index(
+                fields=["project", "updated_at", "id"], name="task_project_updated_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="taskmodel",
+            index=models.Index(
+                fields=["assigned_to", "updated_at", "id"],
+                name="task_assignee_updated_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="taskmodel",
+            index=models.Index(
+                fields=["status", "updated_at", "id"], name="task_status_updated_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="taskmodel",
+            index=models.Index(
+                fields=["priority", "updated_at", "id"],
+                name="task_priority_updated_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="taskmodel",
+            index=models.Index(fields=["due_date", "id"], name="task_due_date_idx"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-18 21:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0012_task_listing_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="archivedtask",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name="taskmodel",
+            name="version",
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
@@ -0,0 +1,102 @@
+# Generated by Django 5.2.9 on 2026-10-18 21:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0015_project_search"),
+        ("tasks", "0014_task_search"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="archivedtask",
+            name="descendant_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="archivedtask",
+            name="descendant_done_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="archivedtask",
+            name="descendant_estimate_hours",
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=9),
+        ),
+        migrations.AddField(
+            model_name="archivedtask",
+            name="estimate_hours",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=7, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="archivedtask",
+            name="parent",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="tasks.archivedtask",
+            ),
+        ),
+        migrations.AddField(
+            model_name="archivedtask",
+            name="path",
+            field=models.CharField(blank=True, default="", max_length=255),
+        ),
+        migrations.AddField(
+            model_name="taskmodel",
+            name="descendant_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="taskmodel",
+            name="descendant_done_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="taskmodel",
+            name="descendant_estimate_hours",
+            field=models.DecimalField(
+                decimal_places=2, default=0, editable=False, max_digits=9
+            ),
+        ),
+        migrations.AddField(
+            model_name="taskmodel",
+            name="estimate_hours",
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=7, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="taskmodel",
+            name="parent",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="subtasks",
+                to="tasks.taskmodel",
+            ),
+        ),
+        migrations.AddField(
+            model_name="taskmodel",
+            name="path",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=255
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="taskmodel",
+            index=models.Index(
+                fields=["path"], name="task_path_idx", opclasses=["varchar_pattern_ops"]
+            ),
+        ),
+    ]
@@ -0,0 +1,107 @@
+# Generated by Django 5.2.9 on 2026-10-18 21:30
+
+import django_enum.fields
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Exists, Min, OuterRef, Subquery
+
+
+def backfill_assignments(apps, schema_editor):
+    """
+    Drop assignments without a user and duplicates, give every primary
+    assignee an assignment, and copy the tasks' status and due date
+    """
+    TaskModel = apps.get_model("tasks", "TaskModel")
+    TaskAssignment = apps.get_model("tasks", "TaskAssignment")
+    ArchivedTask = apps.get_model("tasks", "ArchivedTask")
+    ArchivedTaskAssignment = apps.get_model("tasks", "ArchivedTaskAssignment")
+
+    for model in (TaskAssignment, ArchivedTaskAssignment):
+        model.objects.filter(user__isnull=True).delete()
+        first_ids = (
+            model.objects.values("user_id", "task_id")
+            .annotate(first_id=Min("id"))
+            .values("first_id")
+        )
+        model.objects.exclude(id__in=first_ids).delete()
+
+    missing = (
+        TaskModel.objects.filter(assigned_to__isnull=False)
+        .exclude(
+            Exists(
+                TaskAssignment.objects.filter(
+                    task_id=OuterRef("pk"), user_id=OuterRef("assigned_to_id")
+                )
+            )
+        )
+        .values_list("pk", "assigned_to_id")
+    )
+    TaskAssignment.objects.bulk_create(
+        (
+            TaskAssignment(task_id=task_id, user_id=user_id)
+            for task_id, user_id in missing.iterator()
+        ),
+        batch_size=1000,
+    )
+
+    for model, task_model in (
+        (TaskAssignment, TaskModel),
+        (ArchivedTaskAssignment, ArchivedTask),
+    ):
+        task = task_model.objects.filter(pk=OuterRef("task_id"))
+        model.objects.update(
+            status=Subquery(task.values("status")[:1]),
+            due_date=Subquery(task.values("due_date")[:1]),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0015_task_hierarchy"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="archivedtaskassignment",
+            name="due_date",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="archivedtaskassignment",
+            name="status",
+            field=django_enum.fields.EnumCharField(
+                blank=True,
+                choices=[
+                    ("TO_DO", "to_do"),
+                    ("IN_PROGRESS", "in_progress"),
+                    ("IN_REVIEW", "in_review"),
+                    ("DONE", "done"),
+                ],
+                max_length=11,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="taskassignment",
+            name="due_date",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="taskassignment",
+            name="status",
+            field=django_enum.fields.EnumCharField(
+                blank=True,
+                choices=[
+                    ("TO_DO", "to_do"),
+                    ("IN_PROGRESS", "in_progress"),
+                    ("IN_REVIEW", "in_review"),
+                    ("DONE", "done"),
+                ],
+                max_length=11,
+                null=True,
+            ),
+        ),
+        migrations.RunPython(backfill_assignments, migrations.RunPython.noop),
+    ]
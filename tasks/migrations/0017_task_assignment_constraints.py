@@ -0,0 +1,81 @@
+# Generated by Django 5.2.9 on 2026-10-18 21:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+# Separate from 0016, so the backfill's deferred FK checks have run before
+# the tables are altered
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0016_task_assignment_inbox"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="archivedtaskassignment",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="taskassignment",
+            name="task",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="assignments",
+                to="tasks.taskmodel",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="taskassignment",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="task_assignments",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="taskassignment",
+            index=models.Index(
+                fields=["user", "status", "due_date"],
+                include=("task",),
+                name="task_assignment_inbox_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="archivedtaskassignment",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("status__in", ["TO_DO", "IN_PROGRESS", "IN_REVIEW", "DONE"]),
+                    ("status__isnull", True),
+                    _connector="OR",
+                ),
+                name="tasks_ArchivedTaskAssignment_status_StatusEnum",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="taskassignment",
+            constraint=models.UniqueConstraint(
+                fields=("user", "task"), name="task_assignment_user_task_uniq"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="taskassignment",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("status__in", ["TO_DO", "IN_PROGRESS", "IN_REVIEW", "DONE"]),
+                    ("status__isnull", True),
+                    _connector="OR",
+                ),
+                name="tasks_TaskAssignment_status_StatusEnum",
+            ),
+        ),
+    ]
@@ -0,0 +1,62 @@
+from django.db import migrations
+from django.db.models import Exists, OuterRef
+
+
+def backfill_archived_assignments(apps, schema_editor):
+    """
+    Give the primary assignee of every archived task an archived assignment,
+    as 0016 did for live tasks. The ids come from the live assignment
+    sequence, so restoring the project cannot collide with live rows.
+    """
+    TaskAssignment = apps.get_model("tasks", "TaskAssignment")
+    ArchivedTask = apps.get_model("tasks", "ArchivedTask")
+    ArchivedTaskAssignment = apps.get_model("tasks", "ArchivedTaskAssignment")
+
+    missing = list(
+        ArchivedTask.objects.filter(assigned_to__isnull=False)
+        .exclude(
+            Exists(
+                ArchivedTaskAssignment.objects.filter(
+                    task_id=OuterRef("pk"), user_id=OuterRef("assigned_to_id")
+                )
+            )
+        )
+        .values_list("pk", "assigned_to_id", "status", "due_date")
+    )
+    if not missing:
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, 'id')) "
+            "FROM generate_series(1, %s)",
+            [TaskAssignment._meta.db_table, len(missing)],
+        )
+        ids = [row[0] for row in cursor.fetchall()]
+
+    ArchivedTaskAssignment.objects.bulk_create(
+        (
+            ArchivedTaskAssignment(
+                id=assignment_id,
+                task_id=task_id,
+                user_id=user_id,
+                status=status,
+                due_date=due_date,
+            )
+            for assignment_id, (task_id, user_id, status, due_date) in zip(
+                ids, missing
+            )
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0017_task_assignment_constraints"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_archived_assignments, migrations.RunPython.noop),
+    ]
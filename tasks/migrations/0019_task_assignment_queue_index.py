@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-18 22:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0018_archived_assignment_backfill"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="taskassignment",
+            index=models.Index(
+                fields=["user", "due_date", "id"],
+                include=("task", "status"),
+                name="task_assignment_queue_idx",
+            ),
+        ),
+    ]
@@ -1,9 +1,11 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django.contrib.auth.models import User
 from django_enum import EnumField
 from django.utils import timezone
 
-from projects.models import ProjectsModel, ProjectMembers
+from projects.models import SEARCH_CONFIG, ProjectsModel, ProjectMembers
 from core.services.enums import PriorityEnum, StatusEnum, TaskFieldEnum
 
 
@@ -12,16 +14,22 @@ class Status(models.Model):
 
 
 class TaskModel(models.Model):
+    # project and assigned_to are indexed by the composite listing indexes below
     project = models.ForeignKey(
         ProjectsModel,
         on_delete=models.CASCADE,
         related_name="project_tasks",
         blank=False,
+        db_index=False,
     )
     title = models.CharField(max_length=100)
     description = models.TextField(null=True, blank=True)
     assigned_to = models.ForeignKey(
-        User, on_delete=models.SET_NULL, related_name="assigned_tasks", null=True
+        User,
+        on_delete=models.SET_NULL,
+        related_name="assigned_tasks",
+        null=True,
+        db_index=False,
     )  # TODO: Change this to project member
     status = EnumField(StatusEnum, null=True, blank=True)
     priority = EnumField(PriorityEnum, null=True, blank=True)
@@ -31,6 +39,65 @@ class TaskModel(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Bumped by every versioned write; guards updates against lost writes
+    version = models.PositiveIntegerField(default=1, editable=False)
+    parent = models.ForeignKey(
+        "self",
+        on_delete=models.CASCADE,
+        related_name="subtasks",
+        null=True,
+        blank=True,
+    )
+    # Materialized path: the ancestors' ids, root first, each followed by "/"
+    # ("" for top-level tasks). Kept by TaskTreeService.
+    path = models.CharField(max_length=255, default="", blank=True, editable=False)
+    estimate_hours = models.DecimalField(
+        max_digits=7, decimal_places=2, null=True, blank=True
+    )
+    # Rollups over all descendants (not the task itself), kept up to date by
+    # TaskTreeService on every write
+    descendant_count = models.PositiveIntegerField(default=0, editable=False)
+    descendant_done_count = models.PositiveIntegerField(default=0, editable=False)
+    descendant_estimate_hours = models.DecimalField(
+        max_digits=9, decimal_places=2, default=0, editable=False
+    )
+    # Maintained by PostgreSQL on every write
+    search_vector = models.GeneratedField(
+        expression=SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="B", config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+        serialize=False,
+    )
+
+    class Meta:
+        # Task listings page on (updated_at, id); each filter gets an index
+        # that serves the filter and the ordering together
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="task_updated_idx"),
+            models.Index(
+                fields=["project", "updated_at", "id"], name="task_project_updated_idx"
+            ),
+            models.Index(
+                fields=["assigned_to", "updated_at", "id"],
+                name="task_assignee_updated_idx",
+            ),
+            models.Index(
+                fields=["status", "updated_at", "id"], name="task_status_updated_idx"
+            ),
+            models.Index(
+                fields=["priority", "updated_at", "id"],
+                name="task_priority_updated_idx",
+            ),
+            models.Index(fields=["due_date", "id"], name="task_due_date_idx"),
+            GinIndex(fields=["search_vector"], name="task_search_idx"),
+            # Subtree reads are prefix matches on the path
+            models.Index(
+                fields=["path"],
+                name="task_path_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+        ]
 
 
 class CommentModel(models.Model):
@@ -42,6 +109,16 @@ class CommentModel(models.Model):
     )
     content = models.TextField(blank=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Maintained by PostgreSQL on every write
+    search_vector = models.GeneratedField(
+        expression=SearchVector("content", config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+        serialize=False,
+    )
+
+    class Meta:
+        indexes = [GinIndex(fields=["search_vector"], name="comment_search_idx")]
 
 
 class TaskHistoryModel(models.Model):
@@ -58,5 +135,114 @@ class TaskHistoryModel(models.Model):
 
 
 class TaskAssignment(models.Model):
-    task = models.ForeignKey(TaskModel, on_delete=models.CASCADE)
-    user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
+    """
+    One assignee of a task. The task's assigned_to is its primary assignee
+    and always has an assignment too.
+    """
+
+    task = models.ForeignKey(
+        TaskModel, on_delete=models.CASCADE, related_name="assignments"
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="task_assignments",
+        db_index=False,
+    )
+    # Copies of the task's status and due date, kept by TaskAssignmentService,
+    # so "my work" lookups are answered by the inbox index alone
+    status = EnumField(StatusEnum, null=True, blank=True)
+    due_date = models.DateField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "task"], name="task_assignment_user_task_uniq"
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["user", "status", "due_date"],
+                include=["task"],
+                name="task_assignment_inbox_idx",
+            ),
+            # The inbox across statuses, in its due date order (ascending
+            # puts nulls last)
+            models.Index(
+                fields=["user", "due_date", "id"],
+                include=["task", "status"],
+                name="task_assignment_queue_idx",
+            ),
+        ]
+
+
+# Archive tier. Rows of archived projects are moved here under their original
+# ids by ProjectArchiveService. Field names match the live models, so the task
+# serializers render archived rows unchanged.
+
+
+class ArchivedTask(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    project = models.ForeignKey(
+        ProjectsModel, on_delete=models.CASCADE, related_name="archived_tasks"
+    )
+    title = models.CharField(max_length=100)
+    description = models.TextField(null=True, blank=True)
+    assigned_to = models.ForeignKey(
+        User, on_delete=models.SET_NULL, related_name="+", null=True
+    )
+    status = EnumField(StatusEnum, null=True, blank=True)
+    priority = EnumField(PriorityEnum, null=True, blank=True)
+    due_date = models.DateField(null=True, blank=True)
+    created_by = models.ForeignKey(
+        User, on_delete=models.SET_NULL, related_name="+", null=True
+    )
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    version = models.PositiveIntegerField(default=1)
+    parent = models.ForeignKey(
+        "self", on_delete=models.CASCADE, related_name="+", null=True
+    )
+    path = models.CharField(max_length=255, default="", blank=True)
+    estimate_hours = models.DecimalField(
+        max_digits=7, decimal_places=2, null=True, blank=True
+    )
+    descendant_count = models.PositiveIntegerField(default=0)
+    descendant_done_count = models.PositiveIntegerField(default=0)
+    descendant_estimate_hours = models.DecimalField(
+        max_digits=9, decimal_places=2, default=0
+    )
+
+
+class ArchivedComment(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    task = models.ForeignKey(
+        ArchivedTask, on_delete=models.CASCADE, related_name="comments"
+    )
+    author = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, related_name="+"
+    )
+    content = models.TextField(blank=False)
+    created_at = models.DateTimeField()
+
+
+class ArchivedTaskHistory(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    task = models.ForeignKey(
+        ArchivedTask, on_delete=models.CASCADE, related_name="history"
+    )
+    changed_by = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, related_name="+"
+    )
+    field_changed = EnumField(TaskFieldEnum)
+    old_value = models.TextField(blank=True, null=True)
+    new_value = models.TextField()
+    timestamp = models.DateTimeField()
+
+
+class ArchivedTaskAssignment(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    task = models.ForeignKey(ArchivedTask, on_delete=models.CASCADE)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    status = EnumField(StatusEnum, null=True, blank=True)
+    due_date = models.DateField(null=True, blank=True)
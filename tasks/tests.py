@@ -1,3 +1,693 @@
-from django.test import TestCase
+import io
+from datetime import timedelta
 
-# Create your tests here.
+from django.contrib.auth.models import Group, User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from core.services.enums import PriorityEnum, ProjectStatusEnum, StatusEnum
+from core.services.project_access import ProjectAccessService
+from core.services.project_archive import ProjectArchiveService
+from core.services.project_service import ProjectService
+from core.services.task_assignment import TaskAssignmentService
+from core.services.task_import import TaskImportService
+from core.services.task_service import TaskService
+from core.services.task_tree import TaskTreeService
+from api.v1.tasks.serializers import TaskImportRowSerializer
+from Calendar.models import CalendarEvent
+from audit.models import GlobalAuditLog
+from projects.models import ProjectStats
+from tasks.models import (
+    ArchivedTask,
+    CommentModel,
+    TaskAssignment,
+    TaskHistoryModel,
+    TaskModel,
+)
+
+
+class TaskListingTests(APITestCase):
+    def setUp(self):
+        group, _ = Group.objects.get_or_create(name="Project Manager")
+        self.user = User.objects.create_user(
+            username="listing_user",
+            email="listing_user@example.com",
+            password="defaultPassword123",
+        )
+        self.user.groups.add(group)
+        self.today = timezone.localdate()
+        self.project = ProjectService.create_project(
+            user=self.user,
+            data={
+                "project_name": "Listing Project",
+                "start_date": self.today,
+                "end_date": self.today + timedelta(days=7),
+            },
+        )
+        self.tasks = [
+            TaskService.create_task(
+                user=self.user,
+                project_id=self.project.pk,
+                data={
+                    "title": f"Task {i}",
+                    "status": StatusEnum.DONE if i % 2 else StatusEnum.TO_DO,
+                    "priority": PriorityEnum.HIGH,
+                    "due_date": self.today + timedelta(days=i),
+                },
+            )
+            for i in range(5)
+        ]
+        self.client.force_authenticate(user=self.user)
+
+    def _walk(self, url, params):
+        ids, cursor = [], None
+        while True:
+            page = dict(params, **({"cursor": cursor} if cursor else {}))
+            response = self.client.get(url, page)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [task["id"] for task in response.data["results"]]
+            cursor = response.data["pagination"]["next_cursor"]
+            if not cursor:
+                return ids
+
+    def test_pages_follow_updated_at_then_id(self):
+        ids = self._walk("/api/v1/tasks/", {"page_size": 2})
+
+        self.assertEqual(ids, [task.pk for task in reversed(self.tasks)])
+
+    def test_cursor_is_stable_under_inserts(self):
+        first = self.client.get("/api/v1/tasks/", {"page_size": 2}).data
+        TaskService.create_task(
+            user=self.user, project_id=self.project.pk, data={"title": "Late"}
+        )
+
+        rest = self._walk(
+            "/api/v1/tasks/",
+            {"page_size": 2, "cursor": first["pagination"]["next_cursor"]},
+        )
+
+        seen = [task["id"] for task in first["results"]] + rest
+        self.assertEqual(seen, [task.pk for task in reversed(self.tasks)])
+
+    def test_filters(self):
+        response = self.client.get(
+            "/api/v1/tasks/",
+            {
+                "status": StatusEnum.DONE,
+                "project": self.project.pk,
+                "due_after": self.today + timedelta(days=2),
+            },
+        )
+        self.assertEqual(
+            [task["id"] for task in response.data["results"]], [self.tasks[3].pk]
+        )
+
+        response = self.client.get(
+            f"/api/v1/projects/{self.project.pk}/tasks/",
+            {"status": StatusEnum.TO_DO, "page_size": 2},
+        )
+        self.assertEqual(
+            [task["id"] for task in response.data["data"]],
+            [self.tasks[4].pk, self.tasks[2].pk],
+        )
+        self.assertTrue(response.data["pagination"]["has_next"])
+
+        response = self.client.get(
+            "/api/v1/tasks/",
+            {"due_after": self.today + timedelta(days=3), "due_before": self.today},
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class BulkTaskUpdateTests(APITestCase):
+    def setUp(self):
+        group, _ = Group.objects.get_or_create(name="Project Manager")
+        self.user = User.objects.create_user(
+            username="bulk_tasks_user",
+            email="bulk_tasks_user@example.com",
+            password="defaultPassword123",
+        )
+        self.user.groups.add(group)
+        today = timezone.localdate()
+        self.project = ProjectService.create_project(
+            user=self.user,
+            data={
+                "project_name": "Sprint Project",
+                "start_date": today,
+                "end_date": today + timedelta(days=7),
+            },
+        )
+        self.tasks = [
+            TaskService.create_task(
+                user=self.user,
+                project_id=self.project.pk,
+                data={"title": f"Task {i}", "status": StatusEnum.IN_PROGRESS},
+            )
+            for i in range(30)
+        ]
+        self.client.force_authenticate(user=self.user)
+
+    def test_sprint_close_runs_in_a_fixed_number_of_queries(self):
+        TaskService.update_task_status(
+            user=self.user, task=self.tasks[0], status=StatusEnum.DONE
+        )
+        history = TaskHistoryModel.objects.count()
+        audit_logs = GlobalAuditLog.objects.count()
+        task_ids = [task.pk for task in self.tasks] + [999999]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(
+                "/api/v1/tasks/bulk/",
+                {"task_ids": task_ids, "status": StatusEnum.DONE},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["updated"]), 29)
+        self.assertEqual(response.data["unchanged"], [self.tasks[0].pk])
+        self.assertEqual(response.data["not_found"], [999999])
+        self.assertLess(len(queries), 20)
+
+        self.assertEqual(TaskHistoryModel.objects.count(), history + 29)
+        self.assertEqual(GlobalAuditLog.objects.count(), audit_logs + 1)
+        entry = GlobalAuditLog.objects.latest("id")
+        self.assertEqual(sorted(entry.metadata["task_ids"]), response.data["updated"])
+        stats = ProjectStats.objects.get(project=self.project)
+        self.assertEqual((stats.done_tasks, stats.in_progress_tasks), (30, 0))
+
+    def test_single_task_update_writes_only_changed_columns(self):
+        task = self.tasks[1]
+        TaskModel.objects.filter(pk=task.pk).update(description="Edited elsewhere")
+        history = TaskHistoryModel.objects.count()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(
+                f"/api/v1/tasks/{task.pk}/",
+                {"title": "Renamed", "status": StatusEnum.DONE},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["title"], "Renamed")
+        self.assertEqual(response.data["description"], "Edited elsewhere")
+        self.assertEqual(TaskHistoryModel.objects.count(), history + 2)
+
+        task_table = TaskModel._meta.db_table
+        updates = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith(f'UPDATE "{task_table}"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertNotIn('"description"', updates[0])
+        self.assertIn('"version"', updates[0])
+        self.assertEqual(response.data["version"], 2)
+
+    def test_stale_version_is_rejected_with_the_current_task(self):
+        task = self.tasks[2]
+        TaskService.update_task_status(
+            user=self.user, task=task, status=StatusEnum.DONE, version=1
+        )
+        history = TaskHistoryModel.objects.count()
+
+        response = self.client.put(
+            f"/api/v1/tasks/{task.pk}/",
+            {"title": "Stale edit"},
+            format="json",
+            HTTP_IF_MATCH='"1"',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data["current"]["version"], 2)
+        self.assertEqual(response.data["current"]["status"], StatusEnum.DONE.value)
+        self.assertEqual(TaskHistoryModel.objects.count(), history)
+
+        response = self.client.patch(
+            f"/api/v1/tasks/{task.pk}/",
+            {"title": "Fresh edit", "version": 2},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["version"], 3)
+
+    def test_a_task_stays_in_its_project(self):
+        other = ProjectService.create_project(
+            user=self.user,
+            data={
+                "project_name": "Other Project",
+                "start_date": self.project.start_date,
+                "end_date": self.project.end_date,
+            },
+        )
+        task = self.tasks[3]
+
+        response = self.client.patch(
+            f"/api/v1/tasks/{task.pk}/", {"project": other.pk}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        task.refresh_from_db()
+        self.assertEqual(task.project_id, self.project.pk)
+        with self.assertRaises(ValueError):
+            TaskService.update_task(user=self.user, task=task, data={"project": other})
+
+    def test_requires_a_change(self):
+        response = self.client.patch(
+            "/api/v1/tasks/bulk/", {"task_ids": [self.tasks[0].pk]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TaskImportTests(APITestCase):
+    def setUp(self):
+        group, _ = Group.objects.get_or_create(name="Project Manager")
+        self.user = User.objects.create_user(
+            username="import_user",
+            email="import_user@example.com",
+            password="defaultPassword123",
+        )
+        self.user.groups.add(group)
+        self.today = timezone.localdate()
+        self.project = ProjectService.create_project(
+            user=self.user,
+            data={
+                "project_name": "Import Project",
+                "start_date": self.today,
+                "end_date": self.today + timedelta(days=7),
+            },
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_csv_upload_imports_valid_rows_and_reports_the_rest(self):
+        rows = [
+            "title,status,priority,due_date,assigned_to",
+            f"Migrated 1,DONE,HIGH,{self.today},{self.user.pk}",
+            "Migrated 2,TO_DO,,,",
+            ",TO_DO,LOW,,",
+            "Migrated 4,TO_DO,LOW,,999999",
+        ]
+        upload = SimpleUploadedFile("tasks.csv", "\n".join(rows).encode())
+        audit_logs = GlobalAuditLog.objects.count()
+
+        response = self.client.post(
+            f"/api/v1/projects/{self.project.pk}/tasks/import/",
+            {"file": upload, "batch_size": 2},
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        report = response.data["data"]
+        self.assertEqual((report["created"], report["failed"]), (2, 2))
+        self.assertEqual([error["row"] for error in report["errors"]], [3, 4])
+        self.assertIn("title", report["errors"][0]["errors"])
+
+        self.assertEqual(TaskModel.objects.filter(project=self.project).count(), 2)
+        self.assertEqual(GlobalAuditLog.objects.count(), audit_logs + 1)
+        stats = ProjectStats.objects.get(project=self.project)
+        self.assertEqual((stats.total_tasks, stats.done_tasks), (2, 1))
+        self.assertEqual(CalendarEvent.objects.count(), 1)
+
+    def test_unreadable_row_stops_the_import_and_keeps_what_came_before(self):
+        upload = SimpleUploadedFile(
+            "tasks.csv",
+            b"title,priority\n"
+            b"First,LOW\nSecond,LOW\nThird,LOW\n"
+            b"Bad \xff,LOW\n"
+            b"Last,LOW\n",
+        )
+        audit_logs = GlobalAuditLog.objects.count()
+
+        response = self.client.post(
+            f"/api/v1/projects/{self.project.pk}/tasks/import/",
+            {"file": upload, "batch_size": 2},
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        report = response.data["data"]
+        self.assertEqual((report["created"], report["failed"]), (3, 1))
+        self.assertEqual(report["errors"][0]["row"], 4)
+        self.assertEqual(TaskModel.objects.filter(project=self.project).count(), 3)
+        self.assertEqual(GlobalAuditLog.objects.count(), audit_logs + 1)
+
+    def test_ndjson_rows_are_validated_per_line(self):
+        stream = io.BytesIO(
+            b'{"title": "From JSON", "priority": "LOW"}\n'
+            b"\n"
+            b"not json\n"
+            b'["title"]\n'
+        )
+
+        report = TaskImportService.import_rows(
+            project=self.project,
+            user=self.user,
+            rows=TaskImportService.read_rows(stream, "ndjson"),
+            serializer_class=TaskImportRowSerializer,
+        )
+
+        self.assertEqual((report["created"], report["failed"]), (1, 2))
+        self.assertEqual([error["row"] for error in report["errors"]], [2, 3])
+
+
+class SearchTests(APITestCase):
+    def setUp(self):
+        group, _ = Group.objects.get_or_create(name="Project Manager")
+        self.user, self.other = [
+            User.objects.create_user(
+                username=f"search_{name}",
+                email=f"search_{name}@example.com",
+                password="defaultPassword123",
+            )
+            for name in ("user", "other")
+        ]
+        for user in (self.user, self.other):
+            user.groups.add(group)
+        today = timezone.localdate()
+        self.project, hidden_project = [
+            ProjectService.create_project(
+                user=owner,
+                data={
+                    "project_name": name,
+                    "start_date": today,
+                    "end_date": today + timedelta(days=7),
+                },
+            )
+            for owner, name in ((self.user, "Billing revamp"), (self.other, "Hidden"))
+        ]
+        create = TaskService.create_task
+        self.title_hit = create(
+            user=self.user,
+            project_id=self.project.pk,
+            data={"title": "Invoice export", "description": "CSV"},
+        )
+        self.description_hit = create(
+            user=self.user,
+            project_id=self.project.pk,
+            data={"title": "Cleanup", "description": "Old invoices are slow"},
+        )
+        create(
+            user=self.other,
+            project_id=hidden_project.pk,
+            data={"title": "Invoice secrets"},
+        )
+        CommentModel.objects.create(
+            task=self.title_hit, author=self.user, content="Invoicing totals are off"
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_ranked_prefix_matches_scoped_to_visible_projects(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/v1/search/", {"q": "invoic"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["data"]
+        # Title matches outrank description matches; other projects never show
+        self.assertEqual(
+            [task["id"] for task in results["tasks"]],
+            [self.title_hit.pk, self.description_hit.pk],
+        )
+        self.assertEqual(len(results["comments"]), 1)
+        self.assertEqual(results["projects"], [])
+        self.assertLessEqual(len(queries), 4)
+
+        response = self.client.get(
+            "/api/v1/search/", {"q": "billing rev", "types": "projects"}
+        )
+        self.assertEqual(list(response.data["data"]), ["projects"])
+        self.assertEqual(response.data["data"]["projects"][0]["id"], self.project.pk)
+
+    def test_invalid_parameters(self):
+        response = self.client.get("/api/v1/search/", {"q": "x", "types": "users"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get("/api/v1/search/", {"q": "!!!"})
+        self.assertEqual(response.data["data"]["tasks"], [])
+
+
+class TaskTreeTests(APITestCase):
+    def setUp(self):
+        group, _ = Group.objects.get_or_create(name="Project Manager")
+        self.user = User.objects.create_user(
+            username="tree_user",
+            email="tree@example.com",
+            password="defaultPassword123",
+        )
+        self.user.groups.add(group)
+        today = timezone.localdate()
+        self.project = ProjectService.create_project(
+            user=self.user,
+            data={
+                "project_name": "Tree Project",
+                "start_date": today,
+                "end_date": today + timedelta(days=7),
+            },
+        )
+        self.epic = self._create("Epic", estimate_hours=2)
+        self.story = self._create("Story", parent=self.epic, estimate_hours=5)
+        self.subtask = self._create(
+            "Subtask", parent=self.story, estimate_hours=3, status=StatusEnum.DONE
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def _create(self, title, **data):
+        return TaskService.create_task(
+            user=self.user, project_id=self.project.pk, data={"title": title, **data}
+        )
+
+    def _rollup(self, task):
+        task.refresh_from_db()
+        return TaskTreeService.rollup(task)
+
+    def test_rollups_follow_creates_updates_and_deletes(self):
+        self.assertEqual(self.subtask.path, f"{self.epic.pk}/{self.story.pk}/")
+        rollup = self._rollup(self.epic)
+        self.assertEqual((rollup["tasks"], rollup["done"]), (3, 1))
+        self.assertEqual(rollup["estimate_hours"], 10)
+        self.assertEqual(rollup["progress_pct"], 33)
+
+        TaskService.update_task(
+            user=self.user,
+            task=self.story,
+            data={"status": StatusEnum.DONE, "estimate_hours": 1},
+        )
+        rollup = self._rollup(self.epic)
+        self.assertEqual((rollup["done"], rollup["estimate_hours"]), (2, 6))
+
+        TaskService.delete_task(task=self.story)
+        self.assertFalse(TaskModel.objects.filter(pk=self.subtask.pk).exists())
+        rollup = self._rollup(self.epic)
+        self.assertEqual((rollup["tasks"], rollup["done"]), (1, 0))
+        self.assertEqual(ProjectStats.objects.get(project=self.project).total_tasks, 1)
+
+    def test_move_rewrites_the_subtree_and_its_rollups(self):
+        other = self._create("Other epic")
+        self.subtask.refresh_from_db()
+        version = self.subtask.version
+
+        response = self.client.post(
+            f"/api/v1/tasks/{self.story.pk}/move/", {"parent": other.pk}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.subtask.refresh_from_db()
+        self.assertEqual(self.subtask.path, f"{other.pk}/{self.story.pk}/")
+        # Writes that read the old path must conflict
+        self.assertEqual(self.subtask.version, version + 1)
+        self.assertEqual(self._rollup(other)["tasks"], 3)
+        self.assertEqual(self._rollup(self.epic)["tasks"], 1)
+        self.assertEqual(TaskTreeService.rebuild(project_ids=[self.project.pk]), 4)
+        self.assertEqual(self._rollup(other)["tasks"], 3)
+
+        # A task cannot go under its own subtree
+        response = self.client.post(
+            f"/api/v1/tasks/{other.pk}/move/",
+            {"parent": self.subtask.pk},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_tree_is_one_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f"/api/v1/tasks/{self.epic.pk}/tree/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        story = response.data["children"][0]
+        self.assertEqual(story["id"], self.story.pk)
+        self.assertEqual(story["children"][0]["id"], self.subtask.pk)
+        self.assertEqual(response.data["rollup"]["tasks"], 3)
+        self.assertEqual(len([q for q in queries if "LIKE" in q["sql"]]), 1)
+
+        response = self.client.get(f"/api/v1/tasks/{self.epic.pk}/tree/", {"depth": 1})
+        self.assertEqual(response.data["children"][0]["children"], [])
+
+
+class TaskAssignmentTests(APITestCase):
+    def setUp(self):
+        group, _ = Group.objects.get_or_create(name="Project Manager")
+        self.user = User.objects.create_user(
+            username="assign_owner",
+            email="assign-owner@example.com",
+            password="defaultPassword123",
+        )
+        self.user.groups.add(group)
+        self.other = User.objects.create_user(
+            username="assign_other",
+            email="assign-other@example.com",
+            password="defaultPassword123",
+        )
+        today = timezone.localdate()
+        self.project = ProjectService.create_project(
+            user=self.user,
+            data={
+                "project_name": "Assignment Project",
+                "start_date": today,
+                "end_date": today + timedelta(days=7),
+            },
+        )
+        self.later = self._create("Later", due_date=today + timedelta(days=3))
+        self.soon = self._create(
+            "Soon", due_date=today + timedelta(days=1), assigned_to=self.other
+        )
+        self.undated = self._create("Undated")
+        self._create("Finished", status=StatusEnum.DONE)
+        self._create("Someone else's", assigned_to=self.other)
+        TaskService.set_assignees(
+            user=self.user, task=self.soon, assignees=[self.other, self.user]
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def _create(self, title, **data):
+        return TaskService.create_task(
+            user=self.user,
+            project_id=self.project.pk,
+            data={"title": title, "assigned_to": self.user, **data},
+        )
+
+    def test_inbox_lists_open_work_by_due_date_from_the_index(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/v1/me/work/", {"page_size": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [task["id"] for task in response.data["data"]],
+            [self.soon.pk, self.later.pk],
+        )
+        self.assertFalse(response.data["data"][0]["is_primary"])
+        self.assertTrue(response.data["pagination"]["has_next"])
+        # The page comes from the assignments alone; tasks are one pk lookup
+        task_queries = [q for q in queries if "tasks_taskmodel" in q["sql"]]
+        self.assertEqual(len(task_queries), 1)
+
+        response = self.client.get(
+            "/api/v1/me/work/",
+            {"cursor": response.data["pagination"]["next_cursor"]},
+        )
+        self.assertEqual(
+            [task["id"] for task in response.data["data"]], [self.undated.pk]
+        )
+
+    def test_inbox_pages_are_read_off_the_index_in_order(self):
+        undated = self._create("Undated too")
+        seen, params = [], {"page_size": 1}
+        while True:
+            response = self.client.get("/api/v1/me/work/", params)
+            seen += [task["id"] for task in response.data["data"]]
+            if not response.data["pagination"]["has_next"]:
+                break
+            params["cursor"] = response.data["pagination"]["next_cursor"]
+        self.assertEqual(
+            seen, [self.soon.pk, self.later.pk, self.undated.pk, undated.pk]
+        )
+
+        # No sort step: the rows come off the index in inbox order (the
+        # tiny test table would otherwise be scanned whole)
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("SET LOCAL enable_bitmapscan = off")
+            plan = TaskAssignmentService.inbox(self.user)[:50].explain()
+        self.assertIn("task_assignment_queue_idx", plan)
+        self.assertNotIn("Sort", plan)
+
+    def test_assignment_copies_follow_task_writes(self):
+        due = timezone.localdate() + timedelta(days=5)
+        TaskService.update_task(user=self.user, task=self.later, data={"due_date": due})
+        TaskService.bulk_update(
+            user=self.user,
+            tasks=TaskModel.objects.filter(pk=self.soon.pk),
+            data={"status": StatusEnum.DONE},
+        )
+
+        self.assertEqual(
+            TaskAssignment.objects.get(task=self.later, user=self.user).due_date, due
+        )
+        self.assertEqual(
+            set(
+                TaskAssignment.objects.filter(task=self.soon).values_list(
+                    "status", flat=True
+                )
+            ),
+            {StatusEnum.DONE},
+        )
+
+        # Reassigning the primary replaces its assignment
+        TaskService.assign_task(
+            altered_by=self.user, task=self.later, assigned_to_id=self.other.pk
+        )
+        self.assertEqual(
+            list(
+                TaskAssignment.objects.filter(task=self.later).values_list(
+                    "user_id", flat=True
+                )
+            ),
+            [self.other.pk],
+        )
+        # Assignees outside the project see the tasks they are assigned
+        visible = TaskModel.objects.filter(
+            ProjectAccessService.task_visibility(self.other)
+        )
+        self.assertIn(self.soon, visible)
+
+    def test_assignees_endpoint_keeps_or_hands_over_the_primary(self):
+        url = f"/api/v1/tasks/{self.later.pk}/assignees/"
+
+        response = self.client.put(
+            url, {"user_ids": [self.other.pk, self.user.pk]}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["assigned_to"], self.user.pk)
+        self.assertEqual(
+            [assignee["id"] for assignee in response.data["assignees"]],
+            [self.user.pk, self.other.pk],
+        )
+
+        response = self.client.put(url, {"user_ids": [self.other.pk]}, format="json")
+        self.assertEqual(response.data["assigned_to"], self.other.pk)
+        self.later.refresh_from_db()
+        self.assertEqual(self.later.assigned_to_id, self.other.pk)
+
+        response = self.client.put(url, {"user_ids": [999999]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_archived_tasks_stay_visible_to_their_assignees(self):
+        TaskService.set_assignees(
+            user=self.user, task=self.later, assignees=[self.user, self.other]
+        )
+        self.project.status = ProjectStatusEnum.COMPLETED
+        self.project.save()
+        ProjectArchiveService.archive(project=self.project)
+        developers, _ = Group.objects.get_or_create(name="Developer")
+        self.other.groups.add(developers)
+
+        visible = ArchivedTask.objects.filter(
+            ProjectAccessService.archived_task_visibility(self.other)
+        ).values_list("pk", flat=True)
+        self.assertIn(self.later.pk, visible)
+        self.assertNotIn(self.undated.pk, visible)
+
+        self.client.force_authenticate(user=self.other)
+        response = self.client.get(f"/api/v1/tasks/{self.later.pk}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
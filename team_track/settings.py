@@ -97,6 +97,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "django_enum",
     "rest_framework_simplejwt",
@@ -125,6 +126,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.middleware.PresenceMiddleware",
 ]
 
 
@@ -178,6 +180,43 @@ else:
     DATABASE_URL = f"postgresql://{DATABASES['default']['USER']}:{DATABASES['default']['PASSWORD']}@{DATABASES['default']['HOST']}:{DATABASES['default']['PORT']}/{DATABASES['default']['NAME']}"
 
 
+# Cache
+# Backs the cross-request permission snapshots. Point CACHE_URL at a shared
+# backend (e.g. redis://) when running more than one worker process.
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}  # type: ignore[arg-type]
+
+# Whether every worker process sees the same cache. A per-process cache cannot
+# carry cross-worker invalidations, so state that must not go stale (token
+# claim freshness, permission snapshots) is then read from the database instead.
+CACHE_SHARED = env.bool(  # type: ignore
+    "CACHE_SHARED",
+    default=CACHES["default"]["BACKEND"]
+    not in {
+        "django.core.cache.backends.locmem.LocMemCache",
+        "django.core.cache.backends.dummy.DummyCache",
+    },
+)
+
+# Seconds a user's cached role/permission snapshot is kept
+PERMISSION_CACHE_TIMEOUT = env.int("PERMISSION_CACHE_TIMEOUT", default=300)  # type: ignore
+
+# Seconds team sidebar stats are cached (bounds how stale online counts get)
+TEAM_STATS_CACHE_TIMEOUT = env.int("TEAM_STATS_CACHE_TIMEOUT", default=30)  # type: ignore
+
+# Seconds a user-directory search result is cached per query
+DIRECTORY_CACHE_TIMEOUT = env.int("DIRECTORY_CACHE_TIMEOUT", default=60)  # type: ignore
+
+# Project deletion runs in a background thread, deleting this many rows per chunk
+PROJECT_DELETION_ASYNC = env.bool("PROJECT_DELETION_ASYNC", default=True)  # type: ignore
+PROJECT_DELETION_BATCH_SIZE = env.int("PROJECT_DELETION_BATCH_SIZE", default=500)  # type: ignore
+# Seconds without progress after which an unfinished deletion job is taken to
+# have lost its runner (e.g. a killed worker) and is dispatched again
+PROJECT_DELETION_STALE_AFTER = env.int("PROJECT_DELETION_STALE_AFTER", default=600)  # type: ignore
+
+# Task imports validate and insert this many rows per transaction
+TASK_IMPORT_BATCH_SIZE = env.int("TASK_IMPORT_BATCH_SIZE", default=1000)  # type: ignore
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -225,7 +264,7 @@ MEDIA_ROOT = BASE_DIR / "media"
 # Django REST Framework Configuraton
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "core.services.authentication.ClaimsJWTAuthentication",
     ],
     # 'DEFAULT_PERMISSION_CLASSES': [
     #     'rest_framework.permissions.IsAuthenticated'
@@ -255,6 +294,7 @@ SPECTACULAR_SETTINGS = {
 
 SIMPLE_JWT = {
     "TOKEN_OBTAIN_SERIALIZER": "api.v1.auth.serializers.CustomTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "api.v1.auth.serializers.CustomTokenRefreshSerializer",
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
     "ACCESS_TOKEN_LIFETIME": timedelta(hours=1),
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'team_track.settings')
 
 application = get_wsgi_application()
+
+# Write buffered presence from idle workers and on shutdown
+from core.services.presence import presence_buffer  # noqa: E402
+
+presence_buffer.start_flusher()